@@ -1,15 +1,24 @@
 """Minimal CGSHOP 2026 solver CLI.
 
 Reads an instance JSON file and prints a CGSHOP2026Solution JSON that brings all
-triangulations to the (presumably unique) Delaunay triangulation via flips.
+triangulations to the (presumably unique) Delaunay triangulation via flips, or
+to the most promising of several candidate targets with --target auto. With
+--time-limit, the solution keeps improving until the time limit.
 """
 
 from __future__ import annotations
 
 import argparse
+import signal
 import sys
 import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from itertools import repeat
 from pathlib import Path
+from typing import NamedTuple
 
 REPO_ROOT = Path(__file__).resolve().parent
 PYUTILS_SRC = REPO_ROOT / "pyutils26" / "src"
@@ -24,12 +33,22 @@ if VENV_SITE.exists() and str(VENV_SITE) not in sys.path:
     sys.path.insert(0, str(VENV_SITE))
 
 from cgshop2026_pyutils.geometry import (
-    Point,
+    PointSet,
     FlippableTriangulation,
-    violates_local_delaunay as cgal_violates_local_delaunay,
 )
 from cgshop2026_pyutils.schemas import CGSHOP2026Instance, CGSHOP2026Solution
 from cgshop2026_pyutils.io import read_instance
+from cgshop2026_pyutils.solvers import (
+    TargetCandidate,
+    candidate_targets,
+    edge_frequencies,
+    estimate_cost,
+    flip_to_delaunay,
+    flip_to_target,
+    instance_lower_bound,
+    is_delaunay,
+    median_triangulation,
+)
 from cgshop2026_pyutils.verify import check_for_errors
 
 
@@ -50,60 +69,410 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Run cgshop2026_pyutils.verify.check_for_errors on the produced solution.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes that solve the triangulations concurrently (default: 1).",
+    )
+    parser.add_argument(
+        "--target",
+        choices=("delaunay", "auto"),
+        default="delaunay",
+        help=(
+            "Common target triangulation: Delaunay, or the best of the candidate "
+            "targets with the lowest estimated cost (default: delaunay)."
+        ),
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=None,
+        help=(
+            "Start from the Delaunay solution and keep trying further targets for "
+            "this many seconds (overrides --target)."
+        ),
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=Path,
+        default=None,
+        help=(
+            "With --time-limit, keep the best solution in this directory while it is "
+            "being improved, so an interrupted run leaves it behind."
+        ),
+    )
+    parser.add_argument(
+        "--bounds",
+        action="store_true",
+        help=(
+            "Report a lower bound on the objective and the gap of the solution to it "
+            "(takes time quadratic in the number of triangulations)."
+        ),
+    )
     return parser.parse_args()
 
 
-def instance_points(instance: CGSHOP2026Instance) -> list[Point]:
-    """Convert the integer coordinate lists into Point objects."""
-    return [Point(x, y) for x, y in zip(instance.points_x, instance.points_y)]
+def instance_points(instance: CGSHOP2026Instance) -> PointSet:
+    """Load the integer coordinate lists into a native PointSet."""
+    return PointSet.from_instance(instance)
 
 
 def build_triangulations(
-    instance: CGSHOP2026Instance, points: list[Point]
+    instance: CGSHOP2026Instance, points: PointSet
 ) -> list[FlippableTriangulation]:
     """Wrap every edge list of the instance in a FlippableTriangulation."""
     return [
-        FlippableTriangulation.from_points_edges(points, edges)
+        FlippableTriangulation.from_points_edges(points, edges, backend="native")
         for edges in instance.triangulations
     ]
 
 
-def flip_to_delaunay(
-    triangulation: FlippableTriangulation, points: list[Point]
+class Target(NamedTuple):
+    """A target triangulation, which is only read, and whether it is Delaunay."""
+
+    triangulation: FlippableTriangulation
+    is_delaunay: bool
+
+
+# The point set of the instance, built once per worker process by init_worker.
+_worker_points: PointSet | None = None
+# The target edges of the last task of the worker and their target, so that the
+# target is built and checked once per worker and target, not per triangulation.
+_worker_target: tuple[tuple[tuple[int, int], ...], Target] | None = None
+
+
+def init_worker(points_x: list[int], points_y: list[int]) -> None:
+    """Build the shared point set of a worker process.
+
+    Workers ignore SIGINT; a Ctrl-C is handled by the main process alone, which
+    shuts the pool down.
+    """
+    global _worker_points, _worker_target
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _worker_points = PointSet.from_arrays(points_x, points_y)
+    _worker_target = None
+
+
+def build_target(
+    points: PointSet, target_edges: list[tuple[int, int]] | None
+) -> Target | None:
+    """Build the target, or None for the Delaunay triangulation."""
+    if target_edges is None:
+        return None
+    target = FlippableTriangulation.from_points_edges(
+        points, target_edges, backend="native"
+    )
+    return Target(target, is_delaunay(target))
+
+
+def flip_triangulation(
+    triangulation: FlippableTriangulation, target: Target | None
 ) -> list[list[tuple[int, int]]]:
-    """Flip all non-Delaunay edges; returns batches of concurrently flipped edges."""
-    batches: list[list[tuple[int, int]]] = []
-    while True:
-        pending_batch: list[tuple[int, int]] = []
-        for edge in triangulation.possible_flips():
-            opposite = triangulation.get_flip_partner(edge)
-            a_idx, b_idx = edge
-            c_idx, d_idx = opposite
-            if cgal_violates_local_delaunay(
-                points[a_idx], points[b_idx], points[c_idx], points[d_idx]
-            ):
-                try:
-                    triangulation.add_flip(edge)
-                except ValueError:
-                    # Another flip in this batch now conflicts with this edge.
-                    continue
-                pending_batch.append(edge)
-        if not pending_batch:
-            break
-        triangulation.commit()
-        batches.append(pending_batch)
-    return batches
-
-
-def solve_instance(instance: CGSHOP2026Instance) -> CGSHOP2026Solution:
-    """Return a CGSHOP2026Solution JSONable object."""
-    points = instance_points(instance)
-    triangulations = build_triangulations(instance, points)
-    return CGSHOP2026Solution(
-        instance_uid=instance.instance_uid,
-        flips=[flip_to_delaunay(tri, points) for tri in triangulations],
-        meta={"algorithm": "local_delaunay_flips"},
+    """Flip a triangulation to Delaunay or, if given, to the target."""
+    if target is None:
+        return flip_to_delaunay(triangulation)
+    return flip_to_target(triangulation, target.triangulation, target.is_delaunay)
+
+
+@contextmanager
+def worker_pool(
+    instance: CGSHOP2026Instance, workers: int
+) -> Iterator[ProcessPoolExecutor | None]:
+    """A process pool for the triangulations of the instance, or None without one.
+
+    When the block is left, also by a KeyboardInterrupt, the tasks that have not
+    started are cancelled and the pool is shut down before the exception
+    propagates.
+    """
+    if workers <= 1 or len(instance.triangulations) <= 1:
+        yield None
+        return
+    pool = ProcessPoolExecutor(
+        max_workers=min(workers, len(instance.triangulations)),
+        initializer=init_worker,
+        initargs=(instance.points_x, instance.points_y),
+    )
+    try:
+        yield pool
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def solve_triangulation(
+    edges: list[tuple[int, int]],
+    target_edges: list[tuple[int, int]] | None = None,
+    deadline: float | None = None,
+) -> list[list[tuple[int, int]]] | None:
+    """Flip one triangulation of the worker's point set to Delaunay or the target.
+
+    Returns None without flipping if the deadline (a time.time() value, which
+    all processes share) has passed, so that the remaining tasks of an abandoned
+    target do not keep the workers busy.
+    """
+    global _worker_target
+    points = _worker_points
+    if points is None:
+        raise RuntimeError("init_worker must be called before solve_triangulation.")
+    if deadline is not None and time.time() > deadline:
+        return None
+    target = None
+    if target_edges is not None:
+        key = tuple(target_edges)
+        if _worker_target is None or _worker_target[0] != key:
+            _worker_target = (key, build_target(points, target_edges))
+        target = _worker_target[1]
+    triangulation = FlippableTriangulation.from_points_edges(
+        points, edges, backend="native"
     )
+    return flip_triangulation(triangulation, target)
+
+
+def solve_all(
+    instance: CGSHOP2026Instance,
+    target_edges: list[tuple[int, int]] | None = None,
+    workers: int = 1,
+    triangulations: list[FlippableTriangulation] | None = None,
+) -> list[list[list[tuple[int, int]]]]:
+    """Flip every triangulation of the instance to Delaunay or the target edges.
+
+    With more than one worker, the triangulations are solved concurrently by a
+    process pool. The points are sent to every worker once, and the flips are
+    returned in the order of the triangulations. Otherwise, forks of the already
+    built triangulations of the instance are flipped if they are given.
+    """
+    with worker_pool(instance, workers) as pool:
+        if pool is not None:
+            return list(
+                pool.map(
+                    solve_triangulation, instance.triangulations, repeat(target_edges)
+                )
+            )
+    points = instance_points(instance)
+    target = build_target(points, target_edges)
+    if triangulations is None:
+        triangulations = build_triangulations(instance, points)
+    else:
+        triangulations = [tri.fork() for tri in triangulations]
+    return [flip_triangulation(tri, target) for tri in triangulations]
+
+
+def solve_instance(
+    instance: CGSHOP2026Instance,
+    workers: int = 1,
+    target: str = "delaunay",
+    bounds: bool = False,
+) -> CGSHOP2026Solution:
+    """Return a CGSHOP2026Solution JSONable object.
+
+    With target "auto", the two candidate targets with the lowest estimated cost
+    and the Delaunay triangulation are solved, and the solution with the fewest
+    parallel steps is returned. With bounds, the meta data also contains a lower
+    bound on the objective for any target and the relative gap of the solution
+    to it (see add_lower_bound).
+    """
+    triangulations = None
+    if target != "delaunay" or bounds:
+        triangulations = build_triangulations(instance, instance_points(instance))
+    if target == "delaunay":
+        best = CGSHOP2026Solution(
+            instance_uid=instance.instance_uid,
+            flips=solve_all(instance, workers=workers, triangulations=triangulations),
+            meta={"algorithm": "local_delaunay_flips"},
+        )
+    else:
+        assert triangulations is not None
+        candidates = candidate_targets(triangulations)
+        evaluated = candidates[:2] + [
+            c for c in candidates[2:] if c.name == "delaunay"
+        ]
+        best = None
+        for candidate in evaluated:
+            target_edges = [tuple(e) for e in candidate.target.edge_array().tolist()]
+            solution = CGSHOP2026Solution(
+                instance_uid=instance.instance_uid,
+                flips=solve_all(instance, target_edges, workers, triangulations),
+                meta={"algorithm": "target_flips", "target": candidate.name},
+            )
+            if best is None or solution.objective_value < best.objective_value:
+                best = solution
+        assert best is not None
+    if triangulations is not None and bounds:
+        add_lower_bound(best, instance_lower_bound(triangulations))
+    return best
+
+
+def optimality_gap(objective: int, lower_bound: int) -> float:
+    """Return how much of the objective the lower bound leaves unexplained."""
+    return (objective - lower_bound) / objective if objective else 0.0
+
+
+def add_lower_bound(solution: CGSHOP2026Solution, lower_bound: int) -> None:
+    """Store the lower bound and the optimality gap in the solution meta data."""
+    solution.meta["lower_bound"] = lower_bound
+    solution.meta["gap"] = optimality_gap(solution.objective_value, lower_bound)
+
+
+def bound_summary(solution: CGSHOP2026Solution) -> str:
+    """Describe the lower bound and gap of the solution, if they were computed."""
+    if "lower_bound" not in solution.meta:
+        return ""
+    return f", lower bound {solution.meta['lower_bound']}, gap {solution.meta['gap']:.1%}"
+
+
+def improvement_targets(
+    triangulations: list[FlippableTriangulation],
+) -> Iterator[TargetCandidate]:
+    """Yield the targets the anytime solver tries after the Delaunay baseline.
+
+    First come the candidate targets in the order of their estimated cost, then
+    the median triangulations grown from the remaining inputs, which are only
+    computed when the time limit allows trying them.
+    """
+    candidates = candidate_targets(triangulations)
+    yield from (c for c in candidates if c.name != "delaunay")
+    names = {c.name for c in candidates}
+    frequencies = edge_frequencies(triangulations)
+    for candidate in candidates:
+        name = f"median from {candidate.name}"
+        if candidate.name.startswith("input ") and name not in names:
+            median = median_triangulation(candidate.target, frequencies)
+            estimate = estimate_cost(median, frequencies, len(triangulations))
+            yield TargetCandidate(name, median, estimate)
+
+
+def flips_within(
+    instance: CGSHOP2026Instance,
+    target_edges: list[tuple[int, int]] | None,
+    pool: ProcessPoolExecutor | None,
+    deadline: float | None = None,
+    max_steps: int | None = None,
+    triangulations: list[FlippableTriangulation] | None = None,
+) -> list[list[list[tuple[int, int]]]] | None:
+    """Flip every triangulation to Delaunay or the target edges.
+
+    Gives up and returns None as soon as the deadline (a time.time() value) has
+    passed or the parallel steps so far reach max_steps, so hopeless targets are
+    abandoned early. Without a pool, forks of the given triangulations are
+    flipped. With a pool, the tasks that have not started are cancelled and the
+    workers skip the started ones once the deadline has passed, so only the
+    triangulations that are being flipped delay the next target.
+    """
+    futures: list[Future] = []
+    if pool is None:
+        points = instance_points(instance)
+        target = build_target(points, target_edges)
+        if triangulations is None:
+            triangulations = build_triangulations(instance, points)
+        results = (flip_triangulation(tri.fork(), target) for tri in triangulations)
+    else:
+        futures = [
+            pool.submit(solve_triangulation, edges, target_edges, deadline)
+            for edges in instance.triangulations
+        ]
+        results = (
+            future.result(
+                timeout=None if deadline is None else max(deadline - time.time(), 0.0)
+            )
+            for future in futures
+        )
+    flips = []
+    steps = 0
+    try:
+        for rounds in results:
+            if rounds is None:
+                return None
+            flips.append(rounds)
+            steps += len(rounds)
+            if max_steps is not None and steps >= max_steps:
+                return None
+            unfinished = len(flips) < len(instance.triangulations)
+            if unfinished and deadline is not None and time.time() > deadline:
+                return None
+    except FutureTimeoutError:
+        return None
+    finally:
+        for future in futures:
+            future.cancel()
+    return flips
+
+
+def write_checkpoint(solution: CGSHOP2026Solution, path: Path) -> None:
+    """Atomically replace the checkpoint file with the solution."""
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_text(solution.model_dump_json())
+    temporary.replace(path)
+
+
+def solve_instance_anytime(
+    instance: CGSHOP2026Instance,
+    time_limit: float,
+    workers: int = 1,
+    checkpoint: Path | None = None,
+    bounds: bool = False,
+) -> CGSHOP2026Solution:
+    """Return the best solution found within the time limit (in seconds).
+
+    Starts with the Delaunay solution, which is always computed completely, and
+    then tries the targets of improvement_targets until the time limit passes
+    or, with bounds, the lower bound is reached. The lower bound is computed
+    before the time limit starts. A target is abandoned as soon as it cannot
+    beat the best solution. Every improvement is verified with the incremental
+    check_for_errors before it is accepted and, if a checkpoint path is given,
+    written to it, so the file always holds the best valid solution so far. The
+    time limit is checked between triangulations, so the last triangulation of
+    every worker and the last verification may exceed it.
+    """
+    triangulations = build_triangulations(instance, instance_points(instance))
+    # Zero rounds are a lower bound as well; they only stop the search if all
+    # triangulations are equal.
+    lower_bound = instance_lower_bound(triangulations) if bounds else 0
+    deadline = time.time() + time_limit
+    best: CGSHOP2026Solution | None = None
+
+    def accept(flips: list[list[list[tuple[int, int]]]], target: str) -> None:
+        nonlocal best
+        solution = CGSHOP2026Solution(
+            instance_uid=instance.instance_uid,
+            flips=flips,
+            meta={"algorithm": "anytime_target_flips", "target": target},
+        )
+        if errors := check_for_errors(instance, solution, incremental=True):
+            if best is None:
+                raise RuntimeError(
+                    "The Delaunay solution is invalid:\n" + "\n".join(errors)
+                )
+            return
+        if bounds:
+            add_lower_bound(solution, lower_bound)
+        best = solution
+        if checkpoint is not None:
+            write_checkpoint(solution, checkpoint)
+
+    with worker_pool(instance, workers) as pool:
+        flips = flips_within(instance, None, pool, triangulations=triangulations)
+        assert flips is not None
+        accept(flips, "delaunay")
+        candidates = improvement_targets(triangulations)
+        while best is not None and best.objective_value > lower_bound:
+            if time.time() > deadline:
+                break
+            candidate = next(candidates, None)
+            if candidate is None:
+                break
+            target_edges = [tuple(e) for e in candidate.target.edge_array().tolist()]
+            flips = flips_within(
+                instance,
+                target_edges,
+                pool,
+                deadline,
+                best.objective_value,
+                triangulations,
+            )
+            if flips is not None:
+                accept(flips, candidate.name)
+    assert best is not None
+    return best
 
 
 def solution_metrics(solution: CGSHOP2026Solution) -> tuple[int, int]:
@@ -123,9 +492,33 @@ def main() -> None:
         raise SystemExit(f"Instance file not found: {args.instance}") from None
 
     start_time = time.perf_counter()
-    solution = solve_instance(instance)
+    if args.time_limit is None:
+        solution = solve_instance(
+            instance, workers=args.workers, target=args.target, bounds=args.bounds
+        )
+    else:
+        checkpoint = None
+        if args.checkpoint_dir is not None:
+            args.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+            checkpoint = args.checkpoint_dir / f"{instance.instance_uid}.solution.json"
+            # An interrupted run must only leave a checkpoint that it wrote itself.
+            checkpoint.unlink(missing_ok=True)
+        try:
+            solution = solve_instance_anytime(
+                instance,
+                args.time_limit,
+                workers=args.workers,
+                checkpoint=checkpoint,
+                bounds=args.bounds,
+            )
+        except KeyboardInterrupt:
+            if checkpoint is None or not checkpoint.exists():
+                raise
+            raise SystemExit(
+                f"Interrupted; the best solution so far is in {checkpoint}"
+            ) from None
     if args.verify:
-        errors = check_for_errors(instance, solution, full_recompute=True)
+        errors = check_for_errors(instance, solution, incremental=True)
         if errors:
             raise SystemExit(
                 "Solution verification failed:\n" + "\n".join(f"- {msg}" for msg in errors)
@@ -134,7 +527,7 @@ def main() -> None:
     total_flips, total_steps = solution_metrics(solution)
     print(
         f"{solution.instance_uid}: {total_flips} flips across "
-        f"{total_steps} parallel steps in {elapsed:.2f}s"
+        f"{total_steps} parallel steps in {elapsed:.2f}s{bound_summary(solution)}"
     )
 
 
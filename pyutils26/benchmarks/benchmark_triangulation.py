@@ -0,0 +1,93 @@
+"""
+Benchmark of is_triangulation and compute_triangles: combinatorial vs. CGAL arrangement.
+
+The instances are grids with randomly chosen cell diagonals and slightly
+perturbed points. Run with
+
+    python benchmarks/benchmark_triangulation.py --sizes 1000 10000 100000
+
+The arrangement path is quadratic in the number of edges and is skipped for
+instances larger than --max-arrangement-points.
+"""
+
+import argparse
+import math
+import random
+import time
+
+from cgshop2026_pyutils.geometry import Point, compute_triangles, is_triangulation
+
+
+def grid_triangulation(
+    num_points: int, seed: int = 0
+) -> tuple[list[Point], list[tuple[int, int]]]:
+    """A grid with about num_points perturbed points and random diagonals."""
+    rng = random.Random(seed)
+    size = max(2, math.isqrt(num_points))
+    scale = 10
+    points: list[Point] = []
+    for i in range(size):
+        for j in range(size):
+            # Keep the boundary straight so the grid covers its convex hull.
+            interior = 0 < i < size - 1 and 0 < j < size - 1
+            dx, dy = (rng.randint(-2, 2), rng.randint(-2, 2)) if interior else (0, 0)
+            points.append(Point(scale * i + dx, scale * j + dy))
+    edges: list[tuple[int, int]] = []
+    for i in range(size):
+        for j in range(size):
+            idx = i * size + j
+            if i + 1 < size:
+                edges.append((idx, idx + size))
+            if j + 1 < size:
+                edges.append((idx, idx + 1))
+            if i + 1 < size and j + 1 < size:
+                if rng.random() < 0.5:
+                    edges.append((idx, idx + size + 1))
+                else:
+                    edges.append((idx + 1, idx + size))
+    return points, edges
+
+
+def time_call(fn, repeat: int) -> float:
+    """Best wall-clock time of repeated calls in seconds."""
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-arrangement-points", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'function':>18} {'points':>8} {'edges':>8}"
+        f" {'combinatorial [s]':>18} {'arrangement [s]':>16}"
+    )
+    for num_points in args.sizes:
+        points, edges = grid_triangulation(num_points)
+        assert is_triangulation(points, edges)
+        for fn in (is_triangulation, compute_triangles):
+            combinatorial = time_call(lambda: fn(points, edges), args.repeat)
+            if len(points) <= args.max_arrangement_points:
+                arrangement = time_call(
+                    lambda: fn(points, edges, use_arrangement=True), args.repeat
+                )
+                arrangement_str = f"{arrangement:16.4f}"
+            else:
+                arrangement_str = f"{'skipped':>16}"
+            print(
+                f"{fn.__name__:>18} {len(points):>8} {len(edges):>8}"
+                f" {combinatorial:18.4f} {arrangement_str}"
+            )
+
+
+if __name__ == "__main__":
+    main()
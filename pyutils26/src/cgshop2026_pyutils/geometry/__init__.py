@@ -2,29 +2,44 @@ from ._bindings import (
     is_triangulation,
     compute_triangles,
     Point,
+    PointSet,
     do_cross,
+    do_cross_many,
+    flippable_mask,
+    illegal_edges,
+    violates_local_delaunay,
     Segment,
     FieldNumber,
+    FlipEngine,
 )  # pyright: ignore[reportMissingModuleSource]
 from .flip_partner_map import FlipPartnerMap
 
 from .flippable_triangulation import FlippableTriangulation
 from .flip_partner_map import expand_edges_by_convex_hull_edges
+from .parallel_flips import conflict_graph, select_parallel_flips
 from .draw import draw_flips, draw_edges
 from .typing import Edge, ParallelFlipSequence, ParallelFlips, Triangle
 
 __all__ = [
     "is_triangulation",
     "Point",
+    "PointSet",
     "FieldNumber",
     "compute_triangles",
     "do_cross",
+    "do_cross_many",
+    "flippable_mask",
+    "violates_local_delaunay",
+    "illegal_edges",
     "Segment",
     "FlipPartnerMap",
+    "FlipEngine",
     "FlippableTriangulation",
     "draw_flips",
     "draw_edges",
     "expand_edges_by_convex_hull_edges",
+    "conflict_graph",
+    "select_parallel_flips",
     "Edge",
     "ParallelFlipSequence",
     "ParallelFlips",
@@ -1,16 +1,54 @@
 // pybind11
+#include <pybind11/numpy.h>     // NumPy arrays for batched queries
 #include <pybind11/operators.h> // To define operator overloading
 #include <pybind11/pybind11.h>  // Basic pybind11 functionality
 #include <pybind11/stl.h>       // Automatic conversion of vectors
 
+#include <algorithm>
+
 // Local headers
+#include "batch_operations.h"
 #include "cgal_types.h"
 #include "cgal_utils.h"
+#include "flip_engine.h"
 #include "geometry_operations.h"
+#include "point_set.h"
 
 // Pybind11 module definitions
+namespace {
+
+namespace py = pybind11;
+using IndexArray =
+    py::array_t<std::int64_t, py::array::c_style | py::array::forcecast>;
+
+// Ensure that `array` is a (k, columns) index array and return k. Empty
+// input (e.g., an empty list) is accepted as zero rows.
+std::size_t checked_rows(const IndexArray &array, py::ssize_t columns,
+                         const char *name) {
+  if (array.size() == 0) {
+    return 0;
+  }
+  if (array.ndim() != 2 || array.shape(1) != columns) {
+    throw py::value_error(std::string(name) + " must have shape (k, " +
+                          std::to_string(columns) + ").");
+  }
+  return static_cast<std::size_t>(array.shape(0));
+}
+
+// Build a point set from two one-dimensional integer coordinate arrays.
+std::shared_ptr<cgshop2026::PointSet>
+point_set_from_arrays(const IndexArray &xs, const IndexArray &ys) {
+  if (xs.ndim() != 1 || ys.ndim() != 1 || xs.shape(0) != ys.shape(0)) {
+    throw py::value_error(
+        "xs and ys must be one-dimensional and have the same length.");
+  }
+  return std::make_shared<cgshop2026::PointSet>(
+      xs.data(), ys.data(), static_cast<std::size_t>(xs.shape(0)));
+}
+
+} // anonymous namespace
+
 PYBIND11_MODULE(_bindings, m) {
-  namespace py = pybind11;
   using namespace cgshop2026;
   m.doc() = "CGAL geometry bindings for CG:SHOP 2026";
 
@@ -77,15 +115,192 @@ PYBIND11_MODULE(_bindings, m) {
                            point_to_string(self.target()));
       });
 
+  // Point sets
+  py::class_<PointSet, std::shared_ptr<PointSet>>(
+      m, "PointSet",
+      "An immutable point set backed by native arrays. Accepted by all "
+      "functions that take a list of points.")
+      .def(py::init<std::vector<Point>>(), py::arg("points"))
+      .def_static("from_arrays", &point_set_from_arrays, py::arg("xs"),
+                  py::arg("ys"),
+                  "Build a point set from integer coordinate arrays.")
+      .def_static(
+          "from_instance",
+          [](const py::object &instance) {
+            return point_set_from_arrays(
+                instance.attr("points_x").cast<IndexArray>(),
+                instance.attr("points_y").cast<IndexArray>());
+          },
+          py::arg("instance"),
+          "Build a point set from the coordinates of an instance.")
+      .def(
+          "to_arrays",
+          [](const PointSet &self) {
+            const auto [xs, ys] = self.integer_coordinates();
+            return py::make_tuple(
+                py::array_t<std::int64_t>(static_cast<py::ssize_t>(xs.size()),
+                                          xs.data()),
+                py::array_t<std::int64_t>(static_cast<py::ssize_t>(ys.size()),
+                                          ys.data()));
+          },
+          "Return the integer x- and y-coordinate arrays of the points.")
+      .def("__len__", &PointSet::size)
+      .def("__getitem__",
+           [](const PointSet &self, py::ssize_t i) {
+             const auto n = static_cast<py::ssize_t>(self.size());
+             if (i < 0) {
+               i += n;
+             }
+             if (i < 0 || i >= n) {
+               throw py::index_error("Point index out of range.");
+             }
+             return self[static_cast<std::size_t>(i)];
+           })
+      .def(
+          "__iter__",
+          [](const PointSet &self) {
+            return py::make_iterator(self.points().begin(),
+                                     self.points().end());
+          },
+          py::keep_alive<0, 1>())
+      .def("__str__", [](const PointSet &self) {
+        return fmt::format("PointSet({} points)", self.size());
+      });
+  py::implicitly_convertible<std::vector<Point>, PointSet>();
+
+  // The long-running functions below release the GIL once their arguments are
+  // converted, so that many triangulations can be processed by a thread pool.
+  // They only read their (converted) arguments and share no global state.
+
   // Triangulation check
   m.def("is_triangulation", &is_triangulation,
         "Check if a set of edges forms a triangulation of the given points.",
-        py::arg("points"), py::arg("edges"), py::arg("verbose") = false);
+        py::arg("points"), py::arg("edges"), py::arg("verbose") = false,
+        py::arg("use_arrangement") = false,
+        py::call_guard<py::gil_scoped_release>());
 
   // Compute triangles
   m.def("compute_triangles", &compute_triangles,
-        "Compute all triangles formed by the given points and edges.");
+        "Compute all triangles formed by the given points and edges.",
+        py::arg("points"), py::arg("edges"), py::arg("use_arrangement") = false,
+        py::call_guard<py::gil_scoped_release>());
 
   // Segment crossing test
   m.def("do_cross", &do_cross, "Check if two segments cross each other.");
+
+  // Batched queries
+  m.def(
+      "do_cross_many",
+      [](const PointSet &points, const IndexArray &quads) {
+        const std::size_t count = checked_rows(quads, 4, "quads");
+        py::array_t<bool> result(static_cast<py::ssize_t>(count));
+        bool *out = result.mutable_data();
+        {
+          py::gil_scoped_release release;
+          do_cross_many(points, quads.data(), count, out);
+        }
+        return result;
+      },
+      py::arg("points"), py::arg("quads"),
+      "For each row (a, b, c, d) of quads, check if the segments "
+      "(points[a], points[b]) and (points[c], points[d]) cross.");
+  m.def(
+      "flippable_mask",
+      [](const PointSet &points, const IndexArray &edges,
+         const IndexArray &opposite_vertices) {
+        const std::size_t count = checked_rows(edges, 2, "edges");
+        if (checked_rows(opposite_vertices, 2, "opposite_vertices") != count) {
+          throw py::value_error(
+              "edges and opposite_vertices must have the same length.");
+        }
+        py::array_t<bool> result(static_cast<py::ssize_t>(count));
+        bool *out = result.mutable_data();
+        {
+          py::gil_scoped_release release;
+          flippable_mask(points, edges.data(), opposite_vertices.data(), count,
+                         out);
+        }
+        return result;
+      },
+      py::arg("points"), py::arg("edges"), py::arg("opposite_vertices"),
+      "For each edge and the opposite vertices of its two triangles, check if "
+      "the edge is flippable.");
+
+  // Delaunay predicates
+  m.def("violates_local_delaunay", &violates_local_delaunay, py::arg("a"),
+        py::arg("b"), py::arg("c"), py::arg("d"),
+        "Check if d lies strictly inside the circumcircle of the triangle "
+        "(a, b, c), i.e., if the edge (a, b) between the triangles (a, b, c) "
+        "and (a, b, d) is illegal.");
+  m.def(
+      "illegal_edges",
+      [](const PointSet &points, const IndexArray &edges,
+         const IndexArray &flip_partners) {
+        const std::size_t count = checked_rows(edges, 2, "edges");
+        if (checked_rows(flip_partners, 2, "flip_partners") != count) {
+          throw py::value_error(
+              "edges and flip_partners must have the same length.");
+        }
+        py::gil_scoped_release release;
+        return illegal_edges(points, edges.data(), flip_partners.data(), count);
+      },
+      py::arg("points"), py::arg("edges"), py::arg("flip_partners"),
+      "Return the edges that violate the Delaunay property, given the flip "
+      "partner of each edge.");
+
+  // Native flip engine. Only build and _from_edge_records, which create a new
+  // engine from their own arguments, release the GIL. All other methods keep
+  // it, so a Python thread can never read an engine while another one flips
+  // it.
+  py::class_<FlipEngine>(m, "FlipEngine",
+                         "A native triangulation supporting O(1) edge flips.")
+      .def(py::init<std::shared_ptr<PointSet>, std::vector<FlipEngine::Edge>>(),
+           py::arg("points"), py::arg("edges"))
+      .def_static(
+          "build",
+          [](std::shared_ptr<PointSet> points,
+             const std::vector<FlipEngine::Edge> &edges) {
+            return FlipEngine(std::move(points), edges);
+          },
+          py::arg("points"), py::arg("edges"),
+          py::call_guard<py::gil_scoped_release>())
+      .def_property_readonly("points",
+                             [](const FlipEngine &self) {
+                               return std::const_pointer_cast<PointSet>(
+                                   self.points());
+                             })
+      .def_property_readonly("edges", &FlipEngine::edges)
+      .def("is_flippable", &FlipEngine::is_flippable, py::arg("edge"))
+      .def("flip", &FlipEngine::flip, py::arg("edge"))
+      .def("conflicting_flips", &FlipEngine::conflicting_flips, py::arg("edge"))
+      .def("check_parallel_flips", &FlipEngine::check_parallel_flips,
+           py::arg("edges"), py::arg("greedy"))
+      .def("get_flip_partner", &FlipEngine::get_flip_partner, py::arg("edge"))
+      .def("count_crossings", &FlipEngine::count_crossings, py::arg("segments"))
+      .def("certify_flip", &FlipEngine::certify_flip, py::arg("old_edge"),
+           py::arg("new_edge"))
+      .def("certify_flips", &FlipEngine::certify_flips, py::arg("flips"))
+      .def("flippable_edges", &FlipEngine::flippable_edges)
+      .def("compute_triangles", &FlipEngine::compute_triangles)
+      .def("deep_copy", [](const FlipEngine &self) { return FlipEngine(self); })
+      .def_static(
+          "_from_edge_records",
+          [](std::shared_ptr<PointSet> points, const IndexArray &records) {
+            const std::size_t count = checked_rows(records, 5, "records");
+            std::vector<FlipEngine::EdgeRecord> converted(count);
+            if (count > 0) {
+              std::copy_n(records.data(), 5 * count, converted.front().data());
+            }
+            py::gil_scoped_release release;
+            return FlipEngine::from_edge_records(std::move(points), converted);
+          },
+          py::arg("points"), py::arg("records"))
+      .def("_edge_records",
+           [](const FlipEngine &self) {
+             const auto records = self.edge_records();
+             return py::array_t<std::int64_t>(
+                 {static_cast<py::ssize_t>(records.size()), py::ssize_t{5}},
+                 records.empty() ? nullptr : records.front().data());
+           })
+      .def("_rebuild_flip_map", &FlipEngine::rebuild);
 }
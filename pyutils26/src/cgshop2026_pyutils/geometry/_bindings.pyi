@@ -2,8 +2,12 @@
 CGAL geometry bindings for CG:SHOP 2026
 """
 
-from typing import overload, Sequence
+from typing import Iterator, overload, Sequence
 from typing_extensions import Self, override
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
 class FieldNumber:
     """A container for exact numbers in CGAL."""
 
@@ -59,19 +63,66 @@ class Segment:
     @override
     def __str__(self) -> str: ...
 
+class PointSet:
+    """
+    An immutable point set backed by native arrays.
+
+    Accepted by all functions that take a sequence of points. Building it once
+    from coordinate arrays avoids creating a Point object per point, and the
+    native integer coordinates are shared by all calls using the set.
+    """
+
+    def __init__(self, points: Sequence[Point]) -> None: ...
+    @staticmethod
+    def from_arrays(xs: ArrayLike, ys: ArrayLike) -> PointSet:
+        """
+        Build a point set from integer coordinate arrays.
+
+        Raises:
+            ValueError: If the arrays are not one-dimensional with the same
+                length, or a coordinate exceeds 2**53 in absolute value.
+        """
+        ...
+    @staticmethod
+    def from_instance(instance: object) -> PointSet:
+        """Build a point set from the `points_x` and `points_y` of an instance."""
+        ...
+    def to_arrays(self) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Return the integer x- and y-coordinate arrays of the points, the inverse
+        of `from_arrays`.
+
+        Raises:
+            ValueError: If a coordinate is not an integer of at most 2**53 in
+                absolute value.
+        """
+        ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> Point: ...
+    def __iter__(self) -> Iterator[Point]: ...
+    @override
+    def __str__(self) -> str: ...
+
 def is_triangulation(
-    points: Sequence[Point], edges: Sequence[tuple[int, int]], verbose: bool = False
+    points: Sequence[Point] | PointSet,
+    edges: Sequence[tuple[int, int]],
+    verbose: bool = False,
+    use_arrangement: bool = False,
 ) -> bool:
     """
     Check if a set of edges forms a triangulation of the given points.
 
-    Uses the CGAL arrangement data structure to insert the edges and verify
-    the triangulation properties.
+    By default, checks the edge count against Euler's formula and traces the
+    faces of the angularly sorted edges, which takes O(n log n) time. Only
+    degenerate inputs (e.g., all points collinear) fall back to inserting the
+    edges into a CGAL arrangement.
+    Releases the GIL while running, so it can be called from multiple threads.
 
     Args:
-        points: A sequence of Point objects representing the vertices.
+        points: The vertices as a sequence of Point objects or a PointSet.
         edges: A sequence of (int, int) tuples representing edges as point indices.
         verbose: If True, print additional information during validation.
+        use_arrangement: If True, always use the (slower) CGAL arrangement.
 
     Returns:
         True if the edges form a valid triangulation, False otherwise.
@@ -79,7 +130,9 @@ def is_triangulation(
     ...
 
 def compute_triangles(
-    points: Sequence[Point], edges: Sequence[tuple[int, int]]
+    points: Sequence[Point] | PointSet,
+    edges: Sequence[tuple[int, int]],
+    use_arrangement: bool = False,
 ) -> list[tuple[int, int, int]]:
     """
     Compute all triangles formed by the given set of points and edges.
@@ -89,9 +142,15 @@ def compute_triangles(
     hull. Otherwise, all edges should appear exactly twice. The indices will be
     sorted in each triangle, and the list of triangles will also be sorted.
 
+    If the edges form a triangulation, the triangles are read off the angularly
+    sorted edges in O(n log n) time. Otherwise, the edges are inserted into a
+    CGAL arrangement.
+    Releases the GIL while running, so it can be called from multiple threads.
+
     Args:
-        points: A sequence of Point objects representing the vertices.
+        points: The vertices as a sequence of Point objects or a PointSet.
         edges: A sequence of (int, int) tuples representing edges as point indices.
+        use_arrangement: If True, always use the (slower) CGAL arrangement.
 
     Returns:
         A sorted list of triangles, each represented as a tuple of three sorted
@@ -114,3 +173,165 @@ def do_cross(seg1: Segment, seg2: Segment) -> bool:
         True if the segments cross, False otherwise.
     """
     ...
+
+def do_cross_many(
+    points: Sequence[Point] | PointSet, quads: ArrayLike
+) -> NDArray[np.bool_]:
+    """
+    Batched version of `do_cross` on point indices.
+
+    Args:
+        points: The points.
+        quads: An integer array of shape (k, 4). Row (a, b, c, d) asks whether
+            the segments (points[a], points[b]) and (points[c], points[d]) cross.
+
+    Returns:
+        A boolean array of length k.
+
+    Raises:
+        ValueError: If quads does not have shape (k, 4).
+        RuntimeError: If an index is out of bounds.
+    """
+    ...
+
+def flippable_mask(
+    points: Sequence[Point] | PointSet, edges: ArrayLike, opposite_vertices: ArrayLike
+) -> NDArray[np.bool_]:
+    """
+    Check for many edges at once whether they are flippable.
+
+    An edge (u, v) whose two incident triangles have the opposite vertices
+    (c, d) is flippable if the segments (u, v) and (c, d) cross.
+
+    Args:
+        points: The points.
+        edges: An integer array of shape (k, 2) with the edges.
+        opposite_vertices: An integer array of shape (k, 2) with the opposite
+            vertices of the two triangles incident to each edge.
+
+    Returns:
+        A boolean array of length k.
+
+    Raises:
+        ValueError: If the arrays do not have shape (k, 2).
+        RuntimeError: If an index is out of bounds.
+    """
+    ...
+
+def violates_local_delaunay(a: Point, b: Point, c: Point, d: Point) -> bool:
+    """
+    Check if the edge (a, b) between the triangles (a, b, c) and (a, b, d)
+    violates the Delaunay property.
+
+    This is the case if d lies strictly inside the circumcircle of (a, b, c),
+    independent of the orientation of (a, b, c). Cocircular points do not
+    violate the Delaunay property. The test is exact.
+
+    Returns:
+        True if the edge (a, b) is illegal, False otherwise.
+    """
+    ...
+
+def illegal_edges(
+    points: Sequence[Point] | PointSet, edges: ArrayLike, flip_partners: ArrayLike
+) -> list[tuple[int, int]]:
+    """
+    Find all edges that violate the Delaunay property in a single call.
+
+    Args:
+        points: The points.
+        edges: An integer array of shape (k, 2) with flippable edges.
+        flip_partners: An integer array of shape (k, 2) with the edge that
+            replaces each edge when flipped.
+
+    Returns:
+        The illegal edges (see `violates_local_delaunay`) in input order.
+
+    Raises:
+        ValueError: If the arrays do not have shape (k, 2).
+        RuntimeError: If an index is out of bounds.
+    """
+    ...
+
+class FlipEngine:
+    """
+    A native triangulation supporting O(1) edge flips.
+
+    Stores the triangulation as triangle-adjacency arrays and offers the same
+    interface as `FlipPartnerMap`, so it can be used as a drop-in backend of
+    `FlippableTriangulation`. Edges are returned normalized as (min, max).
+    """
+
+    def __init__(
+        self, points: Sequence[Point] | PointSet, edges: Sequence[tuple[int, int]]
+    ) -> None: ...
+    @staticmethod
+    def build(
+        points: Sequence[Point] | PointSet, edges: Sequence[tuple[int, int]]
+    ) -> FlipEngine: ...
+    @property
+    def points(self) -> PointSet: ...
+    @property
+    def edges(self) -> set[tuple[int, int]]: ...
+    def is_flippable(self, edge: tuple[int, int]) -> bool: ...
+    def flip(self, edge: tuple[int, int]) -> tuple[int, int]: ...
+    def conflicting_flips(self, edge: tuple[int, int]) -> set[tuple[int, int]]: ...
+    def check_parallel_flips(
+        self, edges: Sequence[tuple[int, int]], greedy: bool
+    ) -> tuple[list[int], list[int], list[tuple[int, int]]]:
+        """
+        Classifies flips to be performed in parallel. Returns the indices of the
+        selected flips, the indices of the non-flippable edges, and all pairs of
+        indices (i < j) of flippable edges sharing a triangle. With `greedy`, edges
+        conflicting with an earlier selected edge are skipped.
+        """
+        ...
+    def get_flip_partner(self, edge: tuple[int, int]) -> tuple[int, int]: ...
+    def count_crossings(self, segments: Sequence[tuple[int, int]]) -> list[int]:
+        """
+        For every segment between two points of the set, the number of edges of
+        the triangulation that it properly crosses (edges only touched at a
+        vertex are not counted). Walks through the triangles along the segment.
+
+        Raises:
+            ValueError: If a vertex index is out of range or the endpoints of a
+                segment are equal.
+        """
+        ...
+    def flippable_edges(self) -> list[tuple[int, int]]: ...
+    def compute_triangles(self) -> list[tuple[int, int, int]]: ...
+    def certify_flip(
+        self, old_edge: tuple[int, int], new_edge: tuple[int, int]
+    ) -> None:
+        """
+        Re-checks a committed flip from old_edge to new_edge with exact predicates,
+        looking only at its quadrilateral. Raises ValueError if a check fails.
+        """
+        ...
+    def certify_flips(
+        self, flips: Sequence[tuple[tuple[int, int], tuple[int, int]]]
+    ) -> None:
+        """
+        certify_flip for every (old_edge, new_edge) pair of a round in a single
+        call. Raises ValueError naming the first flip that fails.
+        """
+        ...
+    def deep_copy(self) -> FlipEngine: ...
+    @staticmethod
+    def _from_edge_records(points: PointSet, records: ArrayLike) -> FlipEngine:
+        """
+        Rebuild an engine from the records of `_edge_records()` in linear time,
+        without recomputing the triangles or the flippability.
+
+        Raises:
+            ValueError: If the records do not have shape (k, 5), a vertex index
+                is out of range, or an edge is not part of a triangle.
+        """
+        ...
+    def _edge_records(self) -> NDArray[np.int64]:
+        """
+        One row (u, v, apex 1, apex 2, flippable) per edge with u < v, where the
+        apexes are the opposite vertices (apex 2 is -1 on the convex hull).
+        """
+        ...
+    def _rebuild_flip_map(self) -> None: ...
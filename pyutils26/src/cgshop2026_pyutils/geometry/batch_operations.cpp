@@ -0,0 +1,116 @@
+#include "batch_operations.h"
+#include "predicates.h"
+#include <stdexcept>
+
+namespace cgshop2026 {
+
+namespace {
+
+/**
+ * Evaluates a predicate for `count` index quadruples provided by
+ * `quad_at(i, k)` and passes the results to `emit(i, result)`. The predicate
+ * must accept four IntegralPoints as well as four Points; the former are used
+ * if the point set has native integer coordinates.
+ */
+template <typename QuadAt, typename Predicate, typename Emit>
+void evaluate_batch(const PointSet &points, std::size_t count, QuadAt quad_at,
+                    Predicate predicate, Emit emit) {
+  const std::int64_t point_count = static_cast<std::int64_t>(points.size());
+  const auto checked = [&](std::int64_t idx) {
+    if (idx < 0 || idx >= point_count) {
+      throw std::runtime_error("Point indices are out of bounds.");
+    }
+    return static_cast<std::size_t>(idx);
+  };
+
+  const auto &integral_points = points.integral_points();
+  for (std::size_t i = 0; i < count; ++i) {
+    const std::size_t a = checked(quad_at(i, 0));
+    const std::size_t b = checked(quad_at(i, 1));
+    const std::size_t c = checked(quad_at(i, 2));
+    const std::size_t d = checked(quad_at(i, 3));
+    if (integral_points) {
+      const auto &ip = *integral_points;
+      emit(i, predicate(ip[a], ip[b], ip[c], ip[d]));
+    } else {
+      emit(i, predicate(points[a], points[b], points[c], points[d]));
+    }
+  }
+}
+
+struct CrossPredicate {
+  bool operator()(const IntegralPoint &a, const IntegralPoint &b,
+                  const IntegralPoint &c, const IntegralPoint &d) const {
+    return do_cross(a, b, c, d);
+  }
+  bool operator()(const Point &a, const Point &b, const Point &c,
+                  const Point &d) const {
+    return exact_do_cross(a, b, c, d);
+  }
+};
+
+struct LocalDelaunayPredicate {
+#if defined(CGSHOP2026_HAS_INT128)
+  bool operator()(const IntegralPoint &a, const IntegralPoint &b,
+                  const IntegralPoint &c, const IntegralPoint &d) const {
+    return violates_local_delaunay(a, b, c, d);
+  }
+#else
+  // Without int128, the incircle test runs on the kernel.
+  bool operator()(const IntegralPoint &a, const IntegralPoint &b,
+                  const IntegralPoint &c, const IntegralPoint &d) const {
+    return (*this)(to_point(a), to_point(b), to_point(c), to_point(d));
+  }
+  static Point to_point(const IntegralPoint &p) {
+    return Point(static_cast<double>(p.x()), static_cast<double>(p.y()));
+  }
+#endif
+  bool operator()(const Point &a, const Point &b, const Point &c,
+                  const Point &d) const {
+    return exact_violates_local_delaunay(a, b, c, d);
+  }
+};
+
+} // anonymous namespace
+
+void do_cross_many(const PointSet &points, const std::int64_t *quads,
+                   std::size_t count, bool *result) {
+  evaluate_batch(
+      points, count,
+      [quads](std::size_t i, std::size_t k) { return quads[4 * i + k]; },
+      CrossPredicate{},
+      [result](std::size_t i, bool crossing) { result[i] = crossing; });
+}
+
+void flippable_mask(const PointSet &points, const std::int64_t *edges,
+                    const std::int64_t *opposite_vertices, std::size_t count,
+                    bool *result) {
+  evaluate_batch(
+      points, count,
+      [edges, opposite_vertices](std::size_t i, std::size_t k) {
+        return k < 2 ? edges[2 * i + k] : opposite_vertices[2 * i + k - 2];
+      },
+      CrossPredicate{},
+      [result](std::size_t i, bool flippable) { result[i] = flippable; });
+}
+
+std::vector<std::tuple<int, int>>
+illegal_edges(const PointSet &points, const std::int64_t *edges,
+              const std::int64_t *flip_partners, std::size_t count) {
+  std::vector<std::tuple<int, int>> illegal;
+  evaluate_batch(
+      points, count,
+      [edges, flip_partners](std::size_t i, std::size_t k) {
+        return k < 2 ? edges[2 * i + k] : flip_partners[2 * i + k - 2];
+      },
+      LocalDelaunayPredicate{},
+      [&](std::size_t i, bool violates) {
+        if (violates) {
+          illegal.emplace_back(static_cast<int>(edges[2 * i]),
+                               static_cast<int>(edges[2 * i + 1]));
+        }
+      });
+  return illegal;
+}
+
+} // namespace cgshop2026
@@ -0,0 +1,44 @@
+#pragma once
+
+#include "cgal_types.h"
+#include "point_set.h"
+#include <cstddef>
+#include <cstdint>
+#include <tuple>
+#include <vector>
+
+namespace cgshop2026 {
+
+/**
+ * For each row (a, b, c, d) of the row-major `count x 4` index array `quads`,
+ * check if the segments (points[a], points[b]) and (points[c], points[d])
+ * cross (see do_cross). The results are written to `result`.
+ * Throws std::runtime_error if an index is out of bounds.
+ */
+void do_cross_many(const PointSet &points, const std::int64_t *quads,
+                   std::size_t count, bool *result);
+
+/**
+ * For each edge (u, v) of the row-major `count x 2` array `edges` with the
+ * opposite vertices (c, d) of its two incident triangles in
+ * `opposite_vertices`, check if the edge is flippable, i.e., if the segments
+ * (u, v) and (c, d) cross. The results are written to `result`.
+ * Throws std::runtime_error if an index is out of bounds.
+ */
+void flippable_mask(const PointSet &points, const std::int64_t *edges,
+                    const std::int64_t *opposite_vertices, std::size_t count,
+                    bool *result);
+
+/**
+ * For each edge (u, v) of the row-major `count x 2` array `edges` with the
+ * edge (c, d) that would replace it when flipped in `flip_partners`, check if
+ * the edge violates the Delaunay property, i.e., d lies strictly inside the
+ * circumcircle of (u, v, c) (see exact_violates_local_delaunay).
+ * Returns the illegal edges in input order.
+ * Throws std::runtime_error if an index is out of bounds.
+ */
+std::vector<std::tuple<int, int>>
+illegal_edges(const PointSet &points, const std::int64_t *edges,
+              const std::int64_t *flip_partners, std::size_t count);
+
+} // namespace cgshop2026
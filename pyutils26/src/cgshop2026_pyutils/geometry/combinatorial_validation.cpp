@@ -0,0 +1,225 @@
+#include "combinatorial_validation.h"
+#include "cgal_utils.h"
+#include "predicates.h"
+#include <algorithm>
+#include <array>
+#include <cstdint>
+#include <numeric>
+#include <stdexcept>
+#include <unordered_set>
+#include <utility>
+
+namespace cgshop2026 {
+
+namespace {
+
+// The checks below run either on native integers or on exact kernel points.
+CGAL::Orientation orient(const IntegralPoint &p, const IntegralPoint &q,
+                         const IntegralPoint &r) {
+  return orientation(p, q, r);
+}
+
+CGAL::Orientation orient(const Point &p, const Point &q, const Point &r) {
+  return CGAL::orientation(p, q, r);
+}
+
+// 0 for directions in [0, pi) around c, 1 for directions in [pi, 2pi).
+template <typename P> int half_plane(const P &c, const P &p) {
+  return (p.y() > c.y() || (p.y() == c.y() && p.x() > c.x())) ? 0 : 1;
+}
+
+std::uint64_t directed_key(int u, int v) {
+  return (static_cast<std::uint64_t>(static_cast<std::uint32_t>(u)) << 32) |
+         static_cast<std::uint32_t>(v);
+}
+
+std::uint64_t undirected_key(int u, int v) {
+  return u < v ? directed_key(u, v) : directed_key(v, u);
+}
+
+template <typename P>
+CombinatorialResult
+check_triangulation(const std::vector<P> &points, const std::vector<int> &hull,
+                    const std::vector<std::tuple<int, int>> &edges,
+                    bool verbose,
+                    std::vector<std::tuple<int, int, int>> *triangles) {
+  const int n = static_cast<int>(points.size());
+  const int h = static_cast<int>(hull.size());
+
+  // Step 1: Collect the edges and check their number.
+  std::unordered_set<std::uint64_t> edge_keys;
+  edge_keys.reserve(edges.size() + hull.size());
+  std::vector<std::pair<int, int>> all_edges;
+  all_edges.reserve(edges.size() + hull.size());
+  for (const auto &[u, v] : edges) {
+    if (u == v || !edge_keys.insert(undirected_key(u, v)).second) {
+      if (verbose)
+        fmt::print("ERROR: Edge ({}, {}) is degenerate or duplicated.\n", u, v);
+      return CombinatorialResult::NoTriangulation;
+    }
+    all_edges.emplace_back(u, v);
+  }
+  for (int k = 0; k < h; ++k) {
+    const int u = hull[k];
+    const int v = hull[(k + 1) % h];
+    if (edge_keys.insert(undirected_key(u, v)).second) {
+      all_edges.emplace_back(u, v);
+    }
+  }
+  const int edge_count = static_cast<int>(all_edges.size());
+  if (edge_count != 3 * n - 3 - h) {
+    if (verbose)
+      fmt::print("ERROR: A triangulation of {} points with {} hull points has "
+                 "{} edges, but got {}.\n",
+                 n, h, 3 * n - 3 - h, edge_count);
+    return CombinatorialResult::NoTriangulation;
+  }
+
+  // Step 2: Sort the half-edges leaving each vertex counter-clockwise.
+  // Half-edge k of vertex v is stored at index offsets[v] + k.
+  std::vector<int> offsets(n + 1, 0);
+  for (const auto &[u, v] : all_edges) {
+    ++offsets[u + 1];
+    ++offsets[v + 1];
+  }
+  std::partial_sum(offsets.begin(), offsets.end(), offsets.begin());
+  std::vector<int> origin(2 * edge_count);
+  std::vector<int> target(2 * edge_count);
+  {
+    std::vector<int> cursor(offsets.begin(), offsets.end() - 1);
+    for (const auto &[u, v] : all_edges) {
+      origin[cursor[u]] = u;
+      target[cursor[u]++] = v;
+      origin[cursor[v]] = v;
+      target[cursor[v]++] = u;
+    }
+  }
+  for (int v = 0; v < n; ++v) {
+    const P &c = points[v];
+    const auto begin = target.begin() + offsets[v];
+    const auto end = target.begin() + offsets[v + 1];
+    std::sort(begin, end, [&](int a, int b) {
+      const int half_a = half_plane(c, points[a]);
+      const int half_b = half_plane(c, points[b]);
+      if (half_a != half_b) {
+        return half_a < half_b;
+      }
+      return orient(c, points[a], points[b]) == CGAL::LEFT_TURN;
+    });
+    for (auto it = begin; it != end && it + 1 != end; ++it) {
+      if (half_plane(c, points[*it]) == half_plane(c, points[*(it + 1)]) &&
+          orient(c, points[*it], points[*(it + 1)]) == CGAL::COLLINEAR) {
+        if (verbose)
+          fmt::print("ERROR: Edges ({}, {}) and ({}, {}) overlap.\n", v, *it, v,
+                     *(it + 1));
+        return CombinatorialResult::NoTriangulation;
+      }
+    }
+  }
+
+  // Pair every half-edge with its twin.
+  std::vector<int> twin(2 * edge_count);
+  {
+    std::vector<std::pair<std::uint64_t, int>> by_edge;
+    by_edge.reserve(2 * edge_count);
+    for (int e = 0; e < 2 * edge_count; ++e) {
+      by_edge.emplace_back(undirected_key(origin[e], target[e]), e);
+    }
+    std::sort(by_edge.begin(), by_edge.end());
+    for (std::size_t i = 0; i < by_edge.size(); i += 2) {
+      twin[by_edge[i].second] = by_edge[i + 1].second;
+      twin[by_edge[i + 1].second] = by_edge[i].second;
+    }
+  }
+
+  // Step 3: Trace the faces. The face of half-edge (u, v) continues with the
+  // half-edge of v that precedes (v, u) in counter-clockwise order.
+  const auto next = [&](int e) {
+    const int v = target[e];
+    const int degree = offsets[v + 1] - offsets[v];
+    return offsets[v] + (twin[e] - offsets[v] + degree - 1) % degree;
+  };
+  // The outer face runs clockwise along the convex hull.
+  std::unordered_set<std::uint64_t> outer_halfedges;
+  outer_halfedges.reserve(hull.size());
+  for (int k = 0; k < h; ++k) {
+    outer_halfedges.insert(directed_key(hull[(k + 1) % h], hull[k]));
+  }
+
+  std::vector<char> visited(2 * edge_count, 0);
+  if (triangles) {
+    triangles->clear();
+    triangles->reserve(2 * n - 2 - h);
+  }
+  int face_count = 0;
+  int outer_faces = 0;
+  for (int start = 0; start < 2 * edge_count; ++start) {
+    if (visited[start]) {
+      continue;
+    }
+    ++face_count;
+    std::array<int, 3> corners{};
+    int length = 0;
+    bool along_hull = true;
+    for (int e = start; !visited[e]; e = next(e)) {
+      visited[e] = 1;
+      if (length < 3) {
+        corners[length] = origin[e];
+      }
+      ++length;
+      along_hull = along_hull &&
+                   outer_halfedges.count(directed_key(origin[e], target[e]));
+    }
+    if (length == 3 && orient(points[corners[0]], points[corners[1]],
+                              points[corners[2]]) == CGAL::LEFT_TURN) {
+      if (triangles) {
+        std::sort(corners.begin(), corners.end());
+        triangles->emplace_back(corners[0], corners[1], corners[2]);
+      }
+      continue;
+    }
+    if (length == h && along_hull && ++outer_faces == 1) {
+      continue;
+    }
+    if (verbose)
+      fmt::print("ERROR: Face with {} vertices starting at ({}, {}) is not a "
+                 "counter-clockwise triangle.\n",
+                 length, origin[start], target[start]);
+    return CombinatorialResult::NoTriangulation;
+  }
+
+  if (outer_faces != 1 || n - edge_count + face_count != 2) {
+    if (verbose)
+      fmt::print("ERROR: The edges do not form a connected plane graph.\n");
+    return CombinatorialResult::NoTriangulation;
+  }
+  return CombinatorialResult::Triangulation;
+}
+
+} // anonymous namespace
+
+CombinatorialResult check_triangulation_combinatorially(
+    const PointSet &points, const std::vector<std::tuple<int, int>> &edges,
+    bool verbose, std::vector<std::tuple<int, int, int>> *triangles) {
+  const int point_count = static_cast<int>(points.size());
+  for (const auto &[i, j] : edges) {
+    if (i < 0 || i >= point_count || j < 0 || j >= point_count) {
+      if (verbose)
+        fmt::print(
+            "ERROR: Edge ({}, {}) has invalid indices. Point count: {}\n", i, j,
+            point_count);
+      throw std::runtime_error("Edge indices are out of bounds.");
+    }
+  }
+  if (point_count < 3 || points.is_collinear()) {
+    return CombinatorialResult::Degenerate;
+  }
+  const std::vector<int> &hull = points.hull();
+  if (const auto &integral_points = points.integral_points()) {
+    return check_triangulation(*integral_points, hull, edges, verbose,
+                               triangles);
+  }
+  return check_triangulation(points.points(), hull, edges, verbose, triangles);
+}
+
+} // namespace cgshop2026
@@ -0,0 +1,44 @@
+#pragma once
+
+#include "cgal_types.h"
+#include "point_set.h"
+#include <tuple>
+#include <vector>
+
+namespace cgshop2026 {
+
+/**
+ * Outcome of the combinatorial triangulation check.
+ */
+enum class CombinatorialResult {
+  Triangulation,   ///< The edges form a triangulation.
+  NoTriangulation, ///< The edges do not form a triangulation.
+  Degenerate,      ///< Fewer than three points or all points are collinear.
+};
+
+/**
+ * Check if the given edges (plus the convex hull) form a triangulation of the
+ * points without building an arrangement, in O(n log n) time:
+ *  1. The number of edges must be 3n - 3 - h (Euler's formula), where h is the
+ *     number of points on the boundary of the convex hull.
+ *  2. The neighbors of every vertex are sorted by angle. Two edges leaving a
+ *     vertex in the same direction overlap.
+ *  3. Tracing the faces of this rotation system must give counter-clockwise
+ *     triangles only, plus a single outer face along the convex hull, and the
+ *     face count must satisfy Euler's formula for a connected plane graph.
+ * Then the triangles cover the convex hull exactly once, so no two edges cross
+ * and no point lies in the interior of an edge or triangle.
+ *
+ * If `triangles` is given and the result is Triangulation, it receives the
+ * triangles with sorted indices (in no particular order).
+ *
+ * The convex hull is taken from the point set, which computes it only once.
+ * Expects pairwise distinct points. Degenerate inputs are left to the
+ * arrangement-based check.
+ * Throws std::runtime_error if an edge index is out of bounds.
+ */
+CombinatorialResult check_triangulation_combinatorially(
+    const PointSet &points, const std::vector<std::tuple<int, int>> &edges,
+    bool verbose, std::vector<std::tuple<int, int, int>> *triangles = nullptr);
+
+} // namespace cgshop2026
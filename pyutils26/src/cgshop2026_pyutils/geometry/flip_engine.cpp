@@ -0,0 +1,511 @@
+#include "flip_engine.h"
+#include "geometry_operations.h"
+#include "predicates.h"
+#include <algorithm>
+#include <stdexcept>
+#include <string>
+
+namespace cgshop2026 {
+
+FlipEngine::FlipEngine(std::shared_ptr<const PointSet> points,
+                       const std::vector<Edge> &edges)
+    : points_(std::move(points)) {
+  build_from_edges(edges);
+}
+
+std::uint64_t FlipEngine::edge_key(int u, int v) {
+  if (u > v)
+    std::swap(u, v);
+  return (static_cast<std::uint64_t>(static_cast<std::uint32_t>(u)) << 32) |
+         static_cast<std::uint32_t>(v);
+}
+
+FlipEngine::Page &FlipEngine::writable_page(int t) {
+  auto &page = pages_[t >> kPageBits];
+  if (page.use_count() > 1) {
+    page = std::make_shared<Page>(*page);
+  }
+  return *page;
+}
+
+FlipEngine::Shard &FlipEngine::writable_shard(std::uint64_t key) {
+  auto &shard = shards_[shard_index(key)];
+  if (shard.use_count() > 1) {
+    shard = std::make_shared<Shard>(*shard);
+  }
+  return *shard;
+}
+
+void FlipEngine::set_flippable(int h, bool flippable) {
+  writable_page(h / 3).flippable[h % kPageHalfedges] = flippable ? 1 : 0;
+}
+
+void FlipEngine::build_from_edges(const std::vector<Edge> &edges) {
+  build_from_triangles(cgshop2026::compute_triangles(*points_, edges));
+  for (int h = 0; h < num_halfedges(); ++h) {
+    if (twin(h) > h) {
+      update_flippability(h);
+    }
+  }
+}
+
+void FlipEngine::build_from_triangles(const std::vector<Triangle> &triangles) {
+  // Other copies of the engine keep their pages and shards.
+  num_triangles_ = static_cast<int>(triangles.size());
+  pages_.clear();
+  for (int t = 0; t < num_triangles_; t += kPageTriangles) {
+    auto page = std::make_shared<Page>();
+    page->twin.fill(-1);
+    pages_.push_back(std::move(page));
+  }
+  shards_.clear();
+  shard_bits_ = 1;
+  while ((std::size_t{1} << shard_bits_) < kShardsPerPage * pages_.size()) {
+    ++shard_bits_;
+  }
+  for (std::size_t i = 0; i < (std::size_t{1} << shard_bits_); ++i) {
+    shards_.push_back(std::make_shared<Shard>());
+    // A page has about 1.5 * kPageTriangles edges.
+    shards_.back()->reserve(2 * kPageTriangles / kShardsPerPage);
+  }
+
+  // Store every triangle counter-clockwise.
+  for (int t = 0; t < num_triangles_; ++t) {
+    const auto &[i, j, k] = triangles[t];
+    auto &triangle =
+        pages_[t >> kPageBits]->triangles[t & (kPageTriangles - 1)];
+    if (orientation(i, j, k) == CGAL::CLOCKWISE) {
+      triangle = {i, k, j};
+    } else {
+      triangle = {i, j, k};
+    }
+  }
+
+  // Link the half-edges of neighboring triangles.
+  for (int h = 0; h < num_halfedges(); ++h) {
+    const auto key = edge_key(source(h), target(h));
+    auto [it, inserted] = shards_[shard_index(key)]->emplace(key, h);
+    if (!inserted) {
+      link(h, it->second);
+    }
+  }
+}
+
+FlipEngine
+FlipEngine::from_edge_records(std::shared_ptr<const PointSet> points,
+                              const std::vector<EdgeRecord> &records) {
+  FlipEngine engine(std::move(points));
+  const auto n = static_cast<std::int64_t>(engine.points_->size());
+  // Every triangle is listed by its three edges; keep it only at the edge
+  // formed by its two smallest vertices.
+  std::vector<Triangle> triangles;
+  triangles.reserve(2 * records.size() / 3 + 1);
+  for (const auto &[u, v, apex_1, apex_2, flippable] : records) {
+    if (u < 0 || u >= v || v >= n || apex_1 < 0 || apex_1 >= n || apex_2 < -1 ||
+        apex_2 >= n) {
+      throw std::invalid_argument("Edge record has an invalid vertex index.");
+    }
+    for (const auto apex : {apex_1, apex_2}) {
+      if (apex > v) {
+        triangles.emplace_back(static_cast<int>(u), static_cast<int>(v),
+                               static_cast<int>(apex));
+      }
+    }
+  }
+  engine.build_from_triangles(triangles);
+  for (const auto &[u, v, apex_1, apex_2, flippable] : records) {
+    const int h =
+        engine.find_halfedge({static_cast<int>(u), static_cast<int>(v)});
+    if (h < 0) {
+      throw std::invalid_argument("Edge record is not part of a triangle.");
+    }
+    engine.set_flippable(h, flippable != 0);
+    if (engine.twin(h) >= 0) {
+      engine.set_flippable(engine.twin(h), flippable != 0);
+    }
+  }
+  return engine;
+}
+
+std::vector<FlipEngine::EdgeRecord> FlipEngine::edge_records() const {
+  std::vector<EdgeRecord> records;
+  records.reserve(num_halfedges() / 2 + 1);
+  for (int h = 0; h < num_halfedges(); ++h) {
+    const int g = twin(h);
+    if (g >= 0 && g < h) {
+      continue;
+    }
+    records.push_back({std::min(source(h), target(h)),
+                       std::max(source(h), target(h)), apex(h),
+                       g >= 0 ? apex(g) : -1, flippable(h)});
+  }
+  return records;
+}
+
+void FlipEngine::rebuild() {
+  const auto current = edges();
+  build_from_edges(std::vector<Edge>(current.begin(), current.end()));
+}
+
+void FlipEngine::link(int h, int g) {
+  writable_page(h / 3).twin[h % kPageHalfedges] = g;
+  if (g >= 0) {
+    writable_page(g / 3).twin[g % kPageHalfedges] = h;
+  }
+}
+
+int FlipEngine::find_halfedge(const Edge &edge) const {
+  const auto &[u, v] = edge;
+  const auto key = edge_key(u, v);
+  const auto &index = shard(key);
+  const auto it = index.find(key);
+  return it == index.end() ? -1 : it->second;
+}
+
+int FlipEngine::flippable_halfedge(const Edge &edge) const {
+  const int h = find_halfedge(edge);
+  if (h < 0 || !flippable(h)) {
+    throw std::invalid_argument("Edge is not flippable");
+  }
+  return h;
+}
+
+CGAL::Orientation FlipEngine::orientation(int a, int b, int c) const {
+  const PointSet &points = *points_;
+  if (const auto &integral_points = points.integral_points()) {
+    const auto &ip = *integral_points;
+    return cgshop2026::orientation(ip[a], ip[b], ip[c]);
+  }
+  return exact_orientation(points[a], points[b], points[c]);
+}
+
+bool FlipEngine::crosses(int a, int b, int c, int d) const {
+  const PointSet &points = *points_;
+  if (const auto &integral_points = points.integral_points()) {
+    const auto &ip = *integral_points;
+    return do_cross(ip[a], ip[b], ip[c], ip[d]);
+  }
+  return exact_do_cross(points[a], points[b], points[c], points[d]);
+}
+
+bool FlipEngine::check_flippability(int h) const {
+  const int g = twin(h);
+  if (g < 0) {
+    return false;
+  }
+  return crosses(source(h), target(h), apex(h), apex(g));
+}
+
+void FlipEngine::update_flippability(int h) {
+  const bool flippable = check_flippability(h);
+  set_flippable(h, flippable);
+  if (twin(h) >= 0) {
+    set_flippable(twin(h), flippable);
+  }
+}
+
+bool FlipEngine::is_flippable(const Edge &edge) const {
+  const int h = find_halfedge(edge);
+  return h >= 0 && flippable(h);
+}
+
+std::vector<int>
+FlipEngine::count_crossings(const std::vector<Edge> &segments) const {
+  const int n = static_cast<int>(points_->size());
+  const int num_halfedges = this->num_halfedges();
+  // The outgoing half-edges of every vertex, grouped by vertex.
+  std::vector<int> first(n + 1, 0);
+  for (int h = 0; h < num_halfedges; ++h) {
+    ++first[source(h) + 1];
+  }
+  for (int v = 0; v < n; ++v) {
+    first[v + 1] += first[v];
+  }
+  std::vector<int> outgoing(num_halfedges);
+  std::vector<int> fill(first.begin(), first.end() - 1);
+  for (int h = 0; h < num_halfedges; ++h) {
+    outgoing[fill[source(h)]++] = h;
+  }
+
+  std::vector<int> result;
+  result.reserve(segments.size());
+  for (const auto &[start, v] : segments) {
+    if (start < 0 || start >= n || v < 0 || v >= n || start == v) {
+      throw std::invalid_argument("Invalid segment for count_crossings");
+    }
+    int crossings = 0;
+    // The walk restarts whenever the segment passes through a vertex u.
+    int u = start;
+    while (u != v) {
+      // Find the triangle (u, b, c) at u that the segment leaves u through.
+      int crossed = -1;
+      int through = -1;
+      for (int i = first[u]; i < first[u + 1] && crossed < 0 && through < 0;
+           ++i) {
+        const int h = outgoing[i];
+        const int b = target(h);
+        if (b == v) {
+          through = v;
+          continue;
+        }
+        // v lies in the wedge between the rays to b and to c = apex(h).
+        const auto side_b = orientation(u, b, v);
+        const auto side_c = orientation(u, apex(h), v);
+        if (side_b == CGAL::LEFT_TURN && side_c == CGAL::RIGHT_TURN) {
+          crossed = next(h);
+        } else if (side_b == CGAL::COLLINEAR && side_c == CGAL::RIGHT_TURN) {
+          through = b;
+        } else if (side_b == CGAL::LEFT_TURN && side_c == CGAL::COLLINEAR) {
+          through = apex(h);
+        }
+      }
+      if (through >= 0) {
+        u = through;
+        continue;
+      }
+      if (crossed < 0) {
+        throw std::invalid_argument("Segment leaves the triangulation");
+      }
+      // The source of `crossed` lies right of the segment, its target left.
+      while (true) {
+        ++crossings;
+        const int g = twin(crossed);
+        if (g < 0) {
+          throw std::invalid_argument("Segment leaves the triangulation");
+        }
+        const int w = apex(g);
+        const auto side = w == v ? CGAL::COLLINEAR : orientation(u, v, w);
+        if (side == CGAL::COLLINEAR) {
+          u = w;
+          break;
+        }
+        crossed = side == CGAL::LEFT_TURN ? next(g) : prev(g);
+      }
+    }
+    result.push_back(crossings);
+  }
+  return result;
+}
+
+FlipEngine::Edge FlipEngine::get_flip_partner(const Edge &edge) const {
+  const int h = flippable_halfedge(edge);
+  const int c = apex(h);
+  const int d = apex(twin(h));
+  return {std::min(c, d), std::max(c, d)};
+}
+
+std::set<FlipEngine::Edge>
+FlipEngine::conflicting_flips(const Edge &edge) const {
+  const int h = flippable_halfedge(edge);
+  const int g = twin(h);
+  std::set<Edge> conflicting;
+  // The four outer half-edges of the quadrilateral around the edge.
+  for (int outer :
+       {3 * (h / 3) + (h % 3 + 1) % 3, 3 * (h / 3) + (h % 3 + 2) % 3,
+        3 * (g / 3) + (g % 3 + 1) % 3, 3 * (g / 3) + (g % 3 + 2) % 3}) {
+    if (flippable(outer)) {
+      const int u = source(outer);
+      const int v = target(outer);
+      conflicting.emplace(std::min(u, v), std::max(u, v));
+    }
+  }
+  return conflicting;
+}
+
+std::tuple<std::vector<int>, std::vector<int>, std::vector<std::pair<int, int>>>
+FlipEngine::check_parallel_flips(const std::vector<Edge> &edges,
+                                 bool greedy) const {
+  std::vector<int> selected;
+  std::vector<int> unflippable;
+  std::vector<std::pair<int, int>> conflicts;
+  // The flips using each triangle, and the triangles of the selected flips.
+  std::unordered_map<int, std::vector<int>> users;
+  std::unordered_set<int> used_by_selected;
+  users.reserve(2 * edges.size());
+  for (int i = 0; i < static_cast<int>(edges.size()); ++i) {
+    const int h = find_halfedge(edges[i]);
+    if (h < 0 || !flippable(h)) {
+      unflippable.push_back(i);
+      continue;
+    }
+    const int triangles[2] = {h / 3, twin(h) / 3};
+    std::vector<int> conflicting;
+    for (const int t : triangles) {
+      auto &flips = users[t];
+      conflicting.insert(conflicting.end(), flips.begin(), flips.end());
+      flips.push_back(i);
+    }
+    // The same edge given twice shares both triangles.
+    std::sort(conflicting.begin(), conflicting.end());
+    conflicting.erase(std::unique(conflicting.begin(), conflicting.end()),
+                      conflicting.end());
+    for (const int j : conflicting) {
+      conflicts.emplace_back(j, i);
+    }
+    if (!greedy || (!used_by_selected.count(triangles[0]) &&
+                    !used_by_selected.count(triangles[1]))) {
+      selected.push_back(i);
+      used_by_selected.insert(triangles, triangles + 2);
+    }
+  }
+  return {selected, unflippable, conflicts};
+}
+
+FlipEngine::Edge FlipEngine::flip(const Edge &edge) {
+  const int h = find_halfedge(edge);
+  if (h < 0) {
+    throw std::invalid_argument("Edge does not exist in the triangulation");
+  }
+  if (!flippable(h)) {
+    throw std::invalid_argument("Edge is not flippable");
+  }
+  const int g = twin(h);
+  const int t = h / 3;
+  const int s = g / 3;
+
+  // Triangle t = (a, b, c) and triangle s = (b, a, d), both counter-clockwise,
+  // so the quadrilateral is (a, d, b, c) in counter-clockwise order.
+  const int a = source(h);
+  const int b = target(h);
+  const int c = apex(h);
+  const int d = apex(g);
+  const int twin_bc = twin(3 * t + (h % 3 + 1) % 3);
+  const int twin_ca = twin(3 * t + (h % 3 + 2) % 3);
+  const int twin_ad = twin(3 * s + (g % 3 + 1) % 3);
+  const int twin_db = twin(3 * s + (g % 3 + 2) % 3);
+
+  // Replace them by t = (c, a, d) and s = (d, b, c).
+  writable_page(t).triangles[t & (kPageTriangles - 1)] = {c, a, d};
+  writable_page(s).triangles[s & (kPageTriangles - 1)] = {d, b, c};
+  link(3 * t + 0, twin_ca);
+  link(3 * t + 1, twin_ad);
+  link(3 * t + 2, 3 * s + 2);
+  link(3 * s + 0, twin_db);
+  link(3 * s + 1, twin_bc);
+
+  writable_shard(edge_key(a, b)).erase(edge_key(a, b));
+  const std::pair<std::uint64_t, int> moved[] = {{edge_key(c, a), 3 * t + 0},
+                                                 {edge_key(a, d), 3 * t + 1},
+                                                 {edge_key(d, c), 3 * t + 2},
+                                                 {edge_key(d, b), 3 * s + 0},
+                                                 {edge_key(b, c), 3 * s + 1}};
+  for (const auto &[key, halfedge] : moved) {
+    // Only overwrite the shard if the stored half-edge moved, so that flips
+    // rarely copy a shared shard.
+    const auto &index = shard(key);
+    const auto it = index.find(key);
+    const int stored = it == index.end() ? -1 : it->second;
+    if (stored != halfedge && (stored < 0 || twin(halfedge) != stored)) {
+      writable_shard(key)[key] = halfedge;
+    }
+  }
+
+  // The new edge and the four edges of the quadrilateral may have changed
+  // their flippability.
+  update_flippability(3 * t + 0);
+  update_flippability(3 * t + 1);
+  update_flippability(3 * t + 2);
+  update_flippability(3 * s + 0);
+  update_flippability(3 * s + 1);
+
+  return {std::min(c, d), std::max(c, d)};
+}
+
+void FlipEngine::certify_flips(
+    const std::vector<std::pair<Edge, Edge>> &flips) const {
+  for (const auto &[old_edge, new_edge] : flips) {
+    try {
+      certify_flip(old_edge, new_edge);
+    } catch (const std::invalid_argument &error) {
+      const auto &[a, b] = old_edge;
+      throw std::invalid_argument("Flip of edge (" + std::to_string(a) + ", " +
+                                  std::to_string(b) +
+                                  ") could not be certified: " + error.what());
+    }
+  }
+}
+
+void FlipEngine::certify_flip(const Edge &old_edge,
+                              const Edge &new_edge) const {
+  const auto &[a, b] = old_edge;
+  const auto &[c, d] = new_edge;
+  if (find_halfedge(old_edge) >= 0) {
+    throw std::invalid_argument("The flipped edge is still present.");
+  }
+  const int h = find_halfedge(new_edge);
+  if (h < 0 || twin(h) < 0) {
+    throw std::invalid_argument("The new edge is not shared by two triangles.");
+  }
+  const int g = twin(h);
+  if (edge_key(source(h), target(h)) != edge_key(c, d) ||
+      source(g) != target(h) || target(g) != source(h) ||
+      edge_key(apex(h), apex(g)) != edge_key(a, b)) {
+    throw std::invalid_argument(
+        "The triangles of the new edge do not match the flipped edge.");
+  }
+  if (!crosses(a, b, c, d)) {
+    throw std::invalid_argument("The quadrilateral is not strictly convex.");
+  }
+  for (const int t : {h / 3, g / 3}) {
+    const auto &[i, j, k] = triangle(t);
+    if (orientation(i, j, k) != CGAL::LEFT_TURN) {
+      throw std::invalid_argument("A new triangle is not counter-clockwise.");
+    }
+    for (int x = 3 * t; x < 3 * t + 3; ++x) {
+      const int y = twin(x);
+      if (y >= 0 &&
+          (twin(y) != x || source(y) != target(x) || target(y) != source(x))) {
+        throw std::invalid_argument(
+            "A new triangle is not linked to its neighbors.");
+      }
+      const int stored = find_halfedge({source(x), target(x)});
+      if (stored != x && (y < 0 || stored != y)) {
+        throw std::invalid_argument(
+            "An edge of a new triangle is not indexed.");
+      }
+      if ((flippable(x) != 0) != check_flippability(x)) {
+        throw std::invalid_argument(
+            "The flippability of an edge is out of date.");
+      }
+    }
+  }
+}
+
+std::vector<FlipEngine::Edge> FlipEngine::flippable_edges() const {
+  std::vector<Edge> result;
+  for (int h = 0; h < num_halfedges(); ++h) {
+    if (twin(h) > h && flippable(h)) {
+      const int u = source(h);
+      const int v = target(h);
+      result.emplace_back(std::min(u, v), std::max(u, v));
+    }
+  }
+  return result;
+}
+
+FlipEngine::EdgeSet FlipEngine::edges() const {
+  EdgeSet result;
+  result.reserve(num_halfedges() / 2 + 1);
+  for (int h = 0; h < num_halfedges(); ++h) {
+    if (twin(h) < h) {
+      const int u = source(h);
+      const int v = target(h);
+      result.emplace(std::min(u, v), std::max(u, v));
+    }
+  }
+  return result;
+}
+
+std::vector<FlipEngine::Triangle> FlipEngine::compute_triangles() const {
+  std::vector<Triangle> result;
+  result.reserve(num_triangles_);
+  for (int t = 0; t < num_triangles_; ++t) {
+    auto tri = triangle(t);
+    std::sort(tri.begin(), tri.end());
+    result.emplace_back(tri[0], tri[1], tri[2]);
+  }
+  std::sort(result.begin(), result.end());
+  return result;
+}
+
+} // namespace cgshop2026
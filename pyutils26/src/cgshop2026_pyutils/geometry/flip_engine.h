@@ -0,0 +1,238 @@
+#pragma once
+
+#include "cgal_types.h"
+#include "cgal_utils.h"
+#include "point_set.h"
+#include <array>
+#include <cstdint>
+#include <memory>
+#include <set>
+#include <tuple>
+#include <unordered_map>
+#include <unordered_set>
+#include <utility>
+#include <vector>
+
+namespace cgshop2026 {
+
+/**
+ * @brief Native triangulation that supports O(1) edge flips.
+ *
+ * The triangulation is stored as triangle-adjacency arrays: every triangle is
+ * a counter-clockwise triple of point indices, and half-edge `3 * t + i` runs
+ * from corner `i` to corner `i + 1` of triangle `t`. `twin` links every
+ * half-edge to the half-edge of the neighboring triangle (or -1 on the convex
+ * hull). An edge is flippable if it is shared by two triangles whose union is
+ * a strictly convex quadrilateral.
+ *
+ * The public interface mirrors the Python `FlipPartnerMap` so that
+ * `FlippableTriangulation` can use either one as backend.
+ *
+ * The arrays are split into pages of 64 triangles, and the index from edges
+ * to half-edges into 8 shards per page. Copies of an engine share all pages and
+ * shards, and each copy duplicates a page or shard on its first write to it
+ * (copy-on-write), like the Python `FlipPartnerMap`. So copying only copies
+ * the page references, and a flip only copies the few pages it touches.
+ */
+class FlipEngine {
+public:
+  using Edge = std::tuple<int, int>;
+  using Triangle = std::tuple<int, int, int>;
+  using EdgeSet = std::unordered_set<Edge, TupleHash>;
+  /// (u, v, apex_1, apex_2, flippable) of an edge with u < v; the apexes are
+  /// the opposite vertices of its triangles, apex_2 is -1 on the convex hull.
+  using EdgeRecord = std::array<std::int64_t, 5>;
+
+  /**
+   * @brief Build the engine from points and the edges of a triangulation.
+   *
+   * The convex hull edges are added implicitly. The input is expected to be a
+   * valid triangulation (see `is_triangulation`). The point set is shared, not
+   * copied, between engines.
+   */
+  FlipEngine(std::shared_ptr<const PointSet> points,
+             const std::vector<Edge> &edges);
+
+  /**
+   * @brief Rebuild an engine from the records returned by `edge_records()`
+   * in linear time, without recomputing the triangles or the flippability.
+   * @throws std::invalid_argument if a vertex index is out of range or an
+   * edge of the records is not part of a triangle.
+   */
+  static FlipEngine from_edge_records(std::shared_ptr<const PointSet> points,
+                                      const std::vector<EdgeRecord> &records);
+
+  /**
+   * @brief One record per edge, in the format of the Python `FlipPartnerMap`.
+   */
+  [[nodiscard]] std::vector<EdgeRecord> edge_records() const;
+
+  /**
+   * @brief Check if the given edge (in any orientation) is flippable.
+   */
+  [[nodiscard]] bool is_flippable(const Edge &edge) const;
+
+  /**
+   * @brief Flip the given edge and return the new (normalized) edge.
+   * @throws std::invalid_argument if the edge does not exist or is not
+   * flippable.
+   */
+  Edge flip(const Edge &edge);
+
+  /**
+   * @brief Re-check a committed flip from `old_edge` to `new_edge` with exact
+   * predicates, which use integer arithmetic if the points are integral (see
+   * PointSet::integral_points): the quadrilateral must be strictly convex, its
+   * two triangles counter-clockwise and correctly linked to their neighbors,
+   * and the flippability of its five edges up to date.
+   * @throws std::invalid_argument with a description if a check fails.
+   */
+  void certify_flip(const Edge &old_edge, const Edge &new_edge) const;
+
+  /**
+   * @brief certify_flip for every (old_edge, new_edge) pair of a round.
+   * @throws std::invalid_argument naming the first flip that fails.
+   */
+  void certify_flips(const std::vector<std::pair<Edge, Edge>> &flips) const;
+
+  /**
+   * @brief The flippable edges that cannot be flipped in parallel with the
+   * given edge, i.e., the flippable edges of its two incident triangles.
+   * @throws std::invalid_argument if the edge is not flippable.
+   */
+  [[nodiscard]] std::set<Edge> conflicting_flips(const Edge &edge) const;
+
+  /**
+   * @brief Classify a set of flips that should be performed in parallel.
+   *
+   * Two flips conflict if their edges share a triangle. Returns the indices
+   * (into `edges`) of the selected flips, the indices of the edges that are
+   * not flippable, and all conflicting pairs of indices (i < j) among the
+   * flippable edges. If `greedy` is set, the flippable edges are selected in
+   * the given order, skipping edges that conflict with an already selected
+   * one; otherwise all flippable edges are selected.
+   */
+  [[nodiscard]] std::tuple<std::vector<int>, std::vector<int>,
+                           std::vector<std::pair<int, int>>>
+  check_parallel_flips(const std::vector<Edge> &edges, bool greedy) const;
+
+  /**
+   * @brief For every segment between two points of the set, the number of
+   * edges of the triangulation that it properly crosses. Edges that the
+   * segment only touches at a vertex are not counted.
+   *
+   * Walks through the triangles along each segment, so a segment costs time
+   * proportional to the degrees of its endpoints and its number of crossings.
+   * @throws std::invalid_argument if a vertex index is out of range or the
+   * endpoints of a segment are equal.
+   */
+  [[nodiscard]] std::vector<int>
+  count_crossings(const std::vector<Edge> &segments) const;
+
+  /**
+   * @brief The (normalized) edge that replaces the given edge when flipped.
+   * @throws std::invalid_argument if the edge is not flippable.
+   */
+  [[nodiscard]] Edge get_flip_partner(const Edge &edge) const;
+
+  /**
+   * @brief All currently flippable edges (normalized).
+   */
+  [[nodiscard]] std::vector<Edge> flippable_edges() const;
+
+  /**
+   * @brief All edges of the triangulation, including the convex hull.
+   */
+  [[nodiscard]] EdgeSet edges() const;
+
+  /**
+   * @brief The triangles with sorted indices, as a sorted list.
+   */
+  [[nodiscard]] std::vector<Triangle> compute_triangles() const;
+
+  /**
+   * @brief Recompute all adjacency information from the current edge set.
+   */
+  void rebuild();
+
+  [[nodiscard]] const std::shared_ptr<const PointSet> &points() const {
+    return points_;
+  }
+
+private:
+  explicit FlipEngine(std::shared_ptr<const PointSet> points)
+      : points_(std::move(points)) {}
+
+  static std::uint64_t edge_key(int u, int v);
+
+  void build_from_edges(const std::vector<Edge> &edges);
+  void build_from_triangles(const std::vector<Triangle> &triangles);
+  [[nodiscard]] int find_halfedge(const Edge &edge) const;
+  [[nodiscard]] int flippable_halfedge(const Edge &edge) const;
+  [[nodiscard]] int num_halfedges() const { return 3 * num_triangles_; }
+  [[nodiscard]] const std::array<int, 3> &triangle(int t) const {
+    return pages_[t >> kPageBits]->triangles[t & (kPageTriangles - 1)];
+  }
+  [[nodiscard]] int twin(int h) const {
+    return pages_[h / kPageHalfedges]->twin[h % kPageHalfedges];
+  }
+  [[nodiscard]] bool flippable(int h) const {
+    return pages_[h / kPageHalfedges]->flippable[h % kPageHalfedges] != 0;
+  }
+  [[nodiscard]] int source(int h) const { return triangle(h / 3)[h % 3]; }
+  [[nodiscard]] int target(int h) const {
+    return triangle(h / 3)[(h % 3 + 1) % 3];
+  }
+  [[nodiscard]] int apex(int h) const {
+    return triangle(h / 3)[(h % 3 + 2) % 3];
+  }
+  [[nodiscard]] static int next(int h) { return 3 * (h / 3) + (h % 3 + 1) % 3; }
+  [[nodiscard]] static int prev(int h) { return 3 * (h / 3) + (h % 3 + 2) % 3; }
+  [[nodiscard]] CGAL::Orientation orientation(int a, int b, int c) const;
+  /// Whether the segments (a, b) and (c, d) cross properly.
+  [[nodiscard]] bool crosses(int a, int b, int c, int d) const;
+  [[nodiscard]] bool check_flippability(int h) const;
+  void update_flippability(int h);
+  void link(int h, int g);
+
+  static constexpr int kPageBits = 6;
+  static constexpr int kPageTriangles = 1 << kPageBits;
+  static constexpr int kPageHalfedges = 3 * kPageTriangles;
+  // Small shards keep the copy of a shared shard cheap.
+  static constexpr int kShardsPerPage = 8;
+  /// The triangles, twins and flippability of kPageTriangles triangles.
+  struct Page {
+    std::array<std::array<int, 3>, kPageTriangles> triangles{};
+    std::array<int, kPageHalfedges> twin{};
+    std::array<char, kPageHalfedges> flippable{};
+  };
+  /// Maps edge_key(u, v) to one of the half-edges of the edge.
+  using Shard = std::unordered_map<std::uint64_t, int>;
+
+  /**
+   * @brief The page of triangle t, copied first if other engines share it.
+   */
+  Page &writable_page(int t);
+  [[nodiscard]] const Shard &shard(std::uint64_t key) const {
+    return *shards_[shard_index(key)];
+  }
+  [[nodiscard]] std::size_t shard_index(std::uint64_t key) const {
+    // Fibonacci hashing; the number of shards is a power of two.
+    return (key * 0x9E3779B97F4A7C15ULL) >> (64 - shard_bits_);
+  }
+  /**
+   * @brief The shard of the key, copied first if other engines share it.
+   */
+  Shard &writable_shard(std::uint64_t key);
+  void set_flippable(int h, bool flippable);
+
+  std::shared_ptr<const PointSet> points_;
+  int num_triangles_ = 0;
+  int shard_bits_ = 1;
+  // Pages and shards are never modified while shared; see writable_page()
+  // and writable_shard().
+  std::vector<std::shared_ptr<Page>> pages_;
+  std::vector<std::shared_ptr<Shard>> shards_;
+};
+
+} // namespace cgshop2026
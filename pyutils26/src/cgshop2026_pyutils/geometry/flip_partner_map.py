@@ -1,5 +1,18 @@
-from collections import defaultdict
-from ._bindings import compute_triangles, do_cross, Segment, Point, is_triangulation  # pyright: ignore[reportMissingModuleSource]
+from array import array
+from collections.abc import Iterator, Mapping, Sequence, Set as AbstractSet
+from itertools import chain, compress
+
+import numpy as np
+
+from ._bindings import (
+    compute_triangles,
+    do_cross,
+    flippable_mask,
+    Segment,
+    Point,
+    PointSet,
+    is_triangulation,
+)  # pyright: ignore[reportMissingModuleSource]
 from .typing import Edge, Triangle
 
 
@@ -8,6 +21,96 @@ def normalize_edge(v: int, w: int) -> Edge:
     return (v, w) if v < w else (w, v)
 
 
+# The edge records of a FlipPartnerMap are stored in pages of _PAGE_SIZE edges.
+# Copies share all pages until one of them writes to a page (copy-on-write).
+_PAGE_BITS = 6
+_PAGE_SIZE = 1 << _PAGE_BITS
+_PAGE_MASK = _PAGE_SIZE - 1
+# An edge record: its endpoints (u < v), the opposite vertices of its incident
+# triangles (-1 on the convex hull), and 1 if it is flippable.
+_U, _V, _APEX_1, _APEX_2, _FLIPPABLE = range(5)
+_RECORD_SIZE = 5
+
+
+class _EdgeSetView(AbstractSet[Edge]):
+    """Read-only set of the normalized edges of a FlipPartnerMap."""
+
+    def __init__(self, flip_map: "FlipPartnerMap"):
+        self._map = flip_map
+
+    def __contains__(self, edge: object) -> bool:
+        return isinstance(edge, tuple) and self._map._edge_id(*edge) is not None
+
+    def __iter__(self) -> Iterator[Edge]:
+        return chain.from_iterable(
+            zip(page[_U::_RECORD_SIZE], page[_V::_RECORD_SIZE])
+            for page in self._map._pages
+        )
+
+    def __len__(self) -> int:
+        return self._map._size
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _EdgeSetView):
+            # Compare the integer keys shard by shard instead of building tuples.
+            a, b = self._map._id_shards, other._map._id_shards
+            if self._map._n == other._map._n and len(a) == len(b):
+                return all(x is y or x.keys() == y.keys() for x, y in zip(a, b))
+        return super().__eq__(other)
+
+    def copy(self) -> set[Edge]:
+        return set(self)
+
+
+class _FlipPartnerView(Mapping[Edge, Edge]):
+    """Read-only mapping of the flippable edges of a FlipPartnerMap to their partners."""
+
+    def __init__(self, flip_map: "FlipPartnerMap"):
+        self._map = flip_map
+
+    def __getitem__(self, edge: Edge) -> Edge:
+        e = self._map._edge_id(*edge)
+        if e is None:
+            raise KeyError(edge)
+        page, o = self._map._record(e)
+        if not page[o + _FLIPPABLE]:
+            raise KeyError(edge)
+        return (page[o + _APEX_1], page[o + _APEX_2])
+
+    def __contains__(self, edge: object) -> bool:
+        return isinstance(edge, tuple) and self._map.is_flippable(edge)
+
+    def __iter__(self) -> Iterator[Edge]:
+        return iter(self._map.flippable_edges())
+
+    def __len__(self) -> int:
+        return sum(page[_FLIPPABLE::_RECORD_SIZE].count(1) for page in self._map._pages)
+
+
+class _TriangleView(Mapping[Edge, list[Triangle]]):
+    """Read-only mapping of every edge of a FlipPartnerMap to its incident triangles."""
+
+    def __init__(self, flip_map: "FlipPartnerMap"):
+        self._map = flip_map
+
+    def __getitem__(self, edge: Edge) -> list[Triangle]:
+        e = self._map._edge_id(*edge)
+        if e is None:
+            raise KeyError(edge)
+        page, o = self._map._record(e)
+        u, v = page[o + _U], page[o + _V]
+        return [(u, v, w) for w in page[o + _APEX_1 : o + _APEX_2 + 1] if w >= 0]
+
+    def __contains__(self, edge: object) -> bool:
+        return isinstance(edge, tuple) and self._map._edge_id(*edge) is not None
+
+    def __iter__(self) -> Iterator[Edge]:
+        return iter(_EdgeSetView(self._map))
+
+    def __len__(self) -> int:
+        return self._map._size
+
+
 class FlipPartnerMap:
     """
     This class maintains a mapping of flippable edges in a triangulation to their flip partners.
@@ -17,179 +120,356 @@ class FlipPartnerMap:
     This convexity can be checked by verifying that the edge to flip and its flip partner cross each other properly (i.e., they intersect at a point that is not an endpoint of either segment).
 
     All edges that belong to the two triangles incident to a flippable edge are considered conflicting flips, as flipping one of them would invalidate the other.
+
+    Internally, every edge has a dense id. An edge (u, v) with u < v is looked up by the
+    single integer key u * n + v, and its endpoints, the two opposite vertices (the apexes
+    of the incident triangles, -1 on the convex hull), and its flippability are stored in a
+    flat integer record. A flip reuses the id of the removed edge for the new edge.
+    `edges`, `flip_map`, and `edge_to_triangles` are read-only tuple views on these records.
+
+    The records and the key lookup are split into pages of 64 edges. `deep_copy()` only
+    copies the page references, and each copy duplicates a page on its first write to it,
+    so copies never affect each other while a flip only copies the pages it touches.
     """
 
-    def __init__(
-        self,
-        points: list[Point],
-        edges: set[tuple[int, int]],
-        flip_map: dict[tuple[int, int], tuple[int, int]],
-    ):
-        self.points: list[Point] = points
-        self.edges: set[Edge] = edges
-        self.flip_map: dict[Edge, Edge] = flip_map
-        self.edge_to_triangles: defaultdict[Edge, list[Triangle]] = defaultdict(list)
+    def __init__(self, points: list[Point] | PointSet):
+        self.points: list[Point] | PointSet = points
+        self._n: int = len(points)
+        self._size: int = 0  # number of edges
+        self._pages: list[array] = []  # edge records, _PAGE_SIZE per page
+        self._own_pages: bytearray = bytearray()  # 1 if the page is not shared
+        self._id_shards: list[dict[int, int]] = [{}]  # edge key -> edge id
+        self._own_shards: bytearray = bytearray(1)  # 1 if the shard is not shared
 
     @staticmethod
-    def build(points: list[Point], edges: list[tuple[int, int]]) -> "FlipPartnerMap":
-        edge_ = {(min(u, v), max(u, v)) for u, v in edges}
-        instance = FlipPartnerMap(points, edge_, {})
-        instance._rebuild_flip_map()
+    def build(
+        points: list[Point] | PointSet, edges: list[tuple[int, int]]
+    ) -> "FlipPartnerMap":
+        instance = FlipPartnerMap(points)
+        instance._rebuild_flip_map(edges)
         return instance
 
+    @property
+    def edges(self) -> AbstractSet[Edge]:
+        """The normalized edges of the triangulation."""
+        return _EdgeSetView(self)
+
+    @property
+    def flip_map(self) -> Mapping[Edge, Edge]:
+        """Maps each flippable edge to its flip partner."""
+        return _FlipPartnerView(self)
+
+    @property
+    def edge_to_triangles(self) -> Mapping[Edge, list[Triangle]]:
+        """Maps each edge to the (one or two) triangles it is incident to."""
+        return _TriangleView(self)
+
+    def _edge_id(self, u: int, v: int) -> int | None:
+        if u > v:
+            u, v = v, u
+        if u < 0 or v >= self._n:
+            return None
+        key = u * self._n + v
+        return self._id_shards[key % len(self._id_shards)].get(key)
+
+    def _record(self, e: int) -> tuple[array, int]:
+        """The page holding the record of edge e and the offset of the record."""
+        return self._pages[e >> _PAGE_BITS], (e & _PAGE_MASK) * _RECORD_SIZE
+
+    def _writable_record(self, e: int) -> tuple[array, int]:
+        """Like _record(), but copies the page first if it is shared."""
+        p = e >> _PAGE_BITS
+        if not self._own_pages[p]:
+            self._pages[p] = self._pages[p][:]
+            self._own_pages[p] = 1
+        return self._pages[p], (e & _PAGE_MASK) * _RECORD_SIZE
+
+    def _writable_shard(self, key: int) -> dict[int, int]:
+        s = key % len(self._id_shards)
+        if not self._own_shards[s]:
+            self._id_shards[s] = self._id_shards[s].copy()
+            self._own_shards[s] = 1
+        return self._id_shards[s]
+
     def compute_triangles(self) -> list[tuple[int, int, int]]:
         """
         Computes the triangles formed by the current edges in the flip map.
         """
-        return compute_triangles(self.points, [edge for edge in self.edges])
+        return compute_triangles(self.points, list(self.edges))
 
-    def _rebuild_flip_map(self):
+    def _rebuild_flip_map(self, edges: list[tuple[int, int]] | None = None):
         """
         Rebuilds the flip map by recomputing the triangles and their incident edges.
         Can also be used if you do not want to rely on the incremental updates via flip().
         """
-        triangles = self.compute_triangles()
-        self.edges.clear()
-        # 1. Collect the triangles each edge is incident to.
-        self.edge_to_triangles = defaultdict(list)
+        triangles = compute_triangles(
+            self.points, list(self.edges) if edges is None else edges
+        )
+        n = self._n
+        ids: dict[int, int] = {}
+        records: array = array("q")
+        # 1. Assign ids to the edges and collect the apexes of their triangles.
         for tri in triangles:
-            edges: list[Edge] = [(tri[0], tri[1]), (tri[1], tri[2]), (tri[2], tri[0])]
-            for u, v in edges:
-                norm_edge = normalize_edge(u, v)
-                self.edges.add(norm_edge)
-                self.edge_to_triangles[norm_edge].append(tri)
-        # 2. Build the flip map for edges that are shared by exactly two triangles.
-        self.flip_map.clear()  # clear existing map
-        for norm_edge in self.edge_to_triangles:
-            self._update_flip_partner(norm_edge=norm_edge)
-
-    def _update_flip_partner(self, norm_edge: tuple[int, int]):
-        tris = self.edge_to_triangles[norm_edge]
-        if len(tris) == 2:
-            if opp_edge := self._check_flippability(norm_edge, tris[0], tris[1]):
-                self.flip_map[norm_edge] = opp_edge
-            elif norm_edge in self.flip_map:
-                del self.flip_map[norm_edge]
-        elif norm_edge in self.flip_map:
-            del self.flip_map[norm_edge]
-
-    def _check_flippability(
-        self,
-        norm_edge: tuple[int, int],
-        triang_1: tuple[int, int, int],
-        triang_2: tuple[int, int, int],
-    ) -> tuple[int, int] | None:
-        opp1 = next(v for v in triang_1 if v not in norm_edge)
-        opp2 = next(v for v in triang_2 if v not in norm_edge)
-        if do_cross(
-            Segment(self.points[norm_edge[0]], self.points[norm_edge[1]]),
+            for u, v, w in (
+                (tri[0], tri[1], tri[2]),
+                (tri[1], tri[2], tri[0]),
+                (tri[2], tri[0], tri[1]),
+            ):
+                if u > v:
+                    u, v = v, u
+                e = ids.setdefault(u * n + v, len(ids))
+                if e * _RECORD_SIZE == len(records):
+                    records.extend((u, v, w, -1, 0))
+                else:
+                    records[e * _RECORD_SIZE + _APEX_2] = w
+        # 2. Classify all edges shared by two triangles with a single native call.
+        table = np.frombuffer(records, dtype=np.int64).reshape(-1, _RECORD_SIZE).copy()
+        inner = np.flatnonzero(table[:, _APEX_2] >= 0)
+        mask = flippable_mask(
+            self.points,
+            table[inner, _U : _V + 1],
+            table[inner, _APEX_1 : _APEX_2 + 1],
+        )
+        table[inner[mask], _FLIPPABLE] = 1
+        # 3. Split the records and the key lookup into pages.
+        self._load_records(table)
+
+    def _load_records(self, table: np.ndarray):
+        """Replaces all edges by the records of a (k, 5) int64 array."""
+        self._size = len(table)
+        self._pages = []
+        for start in range(0, self._size, _PAGE_SIZE):
+            page: array = array("q")
+            page.frombytes(table[start : start + _PAGE_SIZE].tobytes())
+            self._pages.append(page)
+        self._own_pages = bytearray(b"\x01" * len(self._pages))
+        self._id_shards = [{} for _ in range(max(1, len(self._pages)))]
+        self._own_shards = bytearray(b"\x01" * len(self._id_shards))
+        keys = table[:, _U] * self._n + table[:, _V]
+        for e, key in enumerate(keys.tolist()):
+            self._id_shards[key % len(self._id_shards)][key] = e
+
+    @staticmethod
+    def _from_edge_records(
+        points: list[Point] | PointSet, records: np.ndarray
+    ) -> "FlipPartnerMap":
+        """
+        Rebuilds a flip map from the records returned by _edge_records() in linear
+        time, without recomputing the triangles or the flippability.
+        """
+        table = np.asarray(records, dtype=np.int64)
+        if table.size and (table.ndim != 2 or table.shape[1] != _RECORD_SIZE):
+            raise ValueError(f"records must have shape (k, {_RECORD_SIZE}).")
+        instance = FlipPartnerMap(points)
+        instance._load_records(table.reshape(-1, _RECORD_SIZE))
+        return instance
+
+    def _edge_records(self) -> np.ndarray:
+        """
+        The (k, 5) int64 array of all edge records (u, v, apex 1, apex 2, flippable),
+        the format shared with FlipEngine._edge_records().
+        """
+        if not self._pages:
+            return np.zeros((0, _RECORD_SIZE), dtype=np.int64)
+        return np.concatenate(
+            [np.frombuffer(page, dtype=np.int64) for page in self._pages]
+        ).reshape(-1, _RECORD_SIZE)
+
+    def _update_flip_partner(self, e: int):
+        flippable = self._check_flippability(e)
+        page, o = self._record(e)
+        if page[o + _FLIPPABLE] != flippable:
+            page, o = self._writable_record(e)
+            page[o + _FLIPPABLE] = flippable
+
+    def _check_flippability(self, e: int) -> bool:
+        page, o = self._record(e)
+        opp1, opp2 = page[o + _APEX_1], page[o + _APEX_2]
+        if opp1 < 0 or opp2 < 0:
+            return False
+        return do_cross(
+            Segment(self.points[page[o + _U]], self.points[page[o + _V]]),
             Segment(self.points[opp1], self.points[opp2]),
-        ):
-            return (opp1, opp2)
-        return None
+        )
 
     def is_flippable(self, edge: tuple[int, int]) -> bool:
         """
         Checks if the given edge is flippable.
         """
-        u, v = edge
-        if u > v:
-            u, v = v, u
-        return (u, v) in self.flip_map
+        e = self._edge_id(*edge)
+        if e is None:
+            return False
+        page, o = self._record(e)
+        return bool(page[o + _FLIPPABLE])
 
     def conflicting_flips(self, edge: tuple[int, int]) -> set[tuple[int, int]]:
         """
         These are the edges that cannot be flipped if the given edge is flipped.
         """
         u, v = normalize_edge(*edge)
-        if (u, v) not in self.flip_map:
-            raise ValueError("Edge is not flippable")
-        opp1, opp2 = self.flip_map[(u, v)]
+        opp1, opp2 = self.get_flip_partner((u, v))
         conflicting: set[Edge] = set()
-        for e in [(u, opp1), (v, opp1), (u, opp2), (v, opp2)]:
-            if e[0] > e[1]:
-                e = (e[1], e[0])
-            if e in self.flip_map:
-                conflicting.add(e)
+        for x, y in [(u, opp1), (v, opp1), (u, opp2), (v, opp2)]:
+            if self.is_flippable((x, y)):
+                conflicting.add(normalize_edge(x, y))
         return conflicting
 
+    def check_parallel_flips(
+        self, edges: Sequence[tuple[int, int]], greedy: bool
+    ) -> tuple[list[int], list[int], list[tuple[int, int]]]:
+        """
+        Classifies a set of flips that should be performed in parallel. Two flips conflict
+        if their edges share a triangle.
+        Returns the indices (into edges) of the selected flips, the indices of the edges
+        that are not flippable, and all conflicting pairs of indices (i < j) among the
+        flippable edges. If greedy is set, the flippable edges are selected in the given
+        order, skipping edges that conflict with an already selected one; otherwise all
+        flippable edges are selected.
+        """
+        selected: list[int] = []
+        unflippable: list[int] = []
+        conflicts: list[tuple[int, int]] = []
+        users: dict[Triangle, list[int]] = {}  # the flips using each triangle
+        used_by_selected: set[Triangle] = set()
+        for i, (u, v) in enumerate(edges):
+            if not self.is_flippable((u, v)):
+                unflippable.append(i)
+                continue
+            triangles = [
+                tuple(sorted((u, v, w))) for w in self.get_flip_partner((u, v))
+            ]
+            conflicting: set[int] = set()
+            for tri in triangles:
+                flips = users.setdefault(tri, [])
+                conflicting.update(flips)
+                flips.append(i)
+            conflicts.extend((j, i) for j in sorted(conflicting))
+            if not greedy or used_by_selected.isdisjoint(triangles):
+                selected.append(i)
+                used_by_selected.update(triangles)
+        return selected, unflippable, conflicts
+
     def flip(self, edge: tuple[int, int]) -> tuple[int, int]:
         """
         Will flip the given edge and update the flip map accordingly.
         It will throw an error if the edge is not flippable.
         """
-        old_edge = normalize_edge(*edge)
-        if old_edge not in self.edges:
+        u, v = normalize_edge(*edge)
+        e = self._edge_id(u, v)
+        if e is None:
             raise ValueError("Edge does not exist in the triangulation")
-        if old_edge not in self.flip_map:
+        page, o = self._record(e)
+        if not page[o + _FLIPPABLE]:
             raise ValueError("Edge is not flippable")
-        new_edge = normalize_edge(*self.flip_map.pop(old_edge))
-        self.flip_map[new_edge] = old_edge
-
-        # Update the triangles incident to the old edge
-        _ = self.edge_to_triangles.pop(old_edge)
-
-        # Update triangles for the new edge
-        new_tri_0 = (new_edge[0], new_edge[1], old_edge[0])
-        new_tri_1 = (new_edge[0], new_edge[1], old_edge[1])
-        self.edge_to_triangles[new_edge] = [new_tri_0, new_tri_1]
-
-        # we need to replace the old triangle in the surrounding edges. This part is a bit ugly
-        def contains_old_edge(tri: Triangle):
-            return old_edge[0] in tri and old_edge[1] in tri
-
-        e1 = normalize_edge(new_edge[0], w=old_edge[0])
-        self.edge_to_triangles[e1] = [new_tri_0] + [
-            t for t in self.edge_to_triangles[e1] if not contains_old_edge(t)
-        ]
-        e2 = normalize_edge(new_edge[1], old_edge[0])
-        self.edge_to_triangles[e2] = [new_tri_0] + [
-            t for t in self.edge_to_triangles[e2] if not contains_old_edge(t)
-        ]
-        e3 = normalize_edge(new_edge[0], old_edge[1])
-        self.edge_to_triangles[e3] = [new_tri_1] + [
-            t for t in self.edge_to_triangles[e3] if not contains_old_edge(t)
-        ]
-        e4 = normalize_edge(new_edge[1], old_edge[1])
-        self.edge_to_triangles[e4] = [new_tri_1] + [
-            t for t in self.edge_to_triangles[e4] if not contains_old_edge(t)
-        ]
-
-        # Update the edges set
-        self.edges.remove(old_edge)
-        self.edges.add(new_edge)
-
-        # The edges now could have become flippable or unflippable, so we need to update them all
-        self._update_flip_partner(e1)
-        self._update_flip_partner(e2)
-        self._update_flip_partner(e3)
-        self._update_flip_partner(e4)
-
-        return new_edge
+        n = self._n
+        c, d = normalize_edge(page[o + _APEX_1], page[o + _APEX_2])
+
+        # The new edge reuses the id of the old one and is always flippable back.
+        del self._writable_shard(u * n + v)[u * n + v]
+        self._writable_shard(c * n + d)[c * n + d] = e
+        page, o = self._writable_record(e)
+        page[o + _U], page[o + _V] = c, d
+        page[o + _APEX_1], page[o + _APEX_2] = u, v
+
+        # In the four surrounding edges, the triangle (x, w, y) becomes (x, w, z).
+        for x, y in ((u, v), (v, u)):
+            for w, z in ((c, d), (d, c)):
+                f = self._edge_id(x, w)
+                page, o = self._writable_record(f)
+                page[o + (_APEX_1 if page[o + _APEX_1] == y else _APEX_2)] = z
+                self._update_flip_partner(f)
+
+        return (c, d)
+
+    def certify_flip(self, old_edge: tuple[int, int], new_edge: tuple[int, int]):
+        """
+        Re-checks a committed flip from old_edge to new_edge with exact predicates, looking
+        only at its quadrilateral: it must be strictly convex, the triangles of its five edges
+        must be consistent, and the flip map must be up to date for these edges.
+        This certifies the incremental updates of flip() without recomputing all triangles.
+        It will throw an error if a check fails.
+        """
+        a, b = normalize_edge(*old_edge)
+        c, d = normalize_edge(*new_edge)
+        if self._edge_id(a, b) is not None:
+            raise ValueError(f"The flipped edge {(a, b)} is still present.")
+        e = self._edge_id(c, d)
+        if e is None:
+            raise ValueError(f"The new edge {(c, d)} is missing.")
+        if not do_cross(
+            Segment(self.points[a], self.points[b]),
+            Segment(self.points[c], self.points[d]),
+        ):
+            raise ValueError(f"The quadrilateral of {(a, b)} is not strictly convex.")
+        page, o = self._record(e)
+        if sorted(page[o + _APEX_1 : o + _APEX_2 + 1]) != [a, b]:
+            raise ValueError(
+                f"The triangles of the new edge {(c, d)} are inconsistent."
+            )
+
+        edge_ids = [e]
+        for x, y in ((a, b), (b, a)):
+            for w, z in ((c, d), (d, c)):
+                f = self._edge_id(x, w)
+                # The edge (x, w) must border the triangle (x, w, z) but not (x, w, y).
+                if f is not None:
+                    page, o = self._record(f)
+                    opposite = page[o + _APEX_1 : o + _APEX_2 + 1]
+                if f is None or z not in opposite or y in opposite:
+                    outer = normalize_edge(x, w)
+                    raise ValueError(
+                        f"The triangles of edge {outer} next to {(c, d)} are inconsistent."
+                    )
+                edge_ids.append(f)
+
+        for f in edge_ids:
+            page, o = self._record(f)
+            if bool(page[o + _FLIPPABLE]) != self._check_flippability(f):
+                edge = (page[o + _U], page[o + _V])
+                raise ValueError(f"The flip partner of edge {edge} is out of date.")
 
     def deep_copy(self) -> "FlipPartnerMap":
-        copy = FlipPartnerMap(self.points, self.edges.copy(), self.flip_map.copy())
-        copy.edge_to_triangles = self.edge_to_triangles.copy()
+        """
+        Returns an independent copy of the flip map. This only copies the page references:
+        both maps copy a shared page on their first write to it.
+        """
+        copy = FlipPartnerMap(self.points)
+        copy._size = self._size
+        copy._pages = self._pages.copy()
+        copy._id_shards = self._id_shards.copy()
+        for flip_map in (self, copy):
+            flip_map._own_pages = bytearray(len(self._pages))
+            flip_map._own_shards = bytearray(len(self._id_shards))
         return copy
 
     def flippable_edges(self) -> list[tuple[int, int]]:
         """
         Returns a list of all currently flippable edges.
         """
-        return list(self.flip_map.keys())
+        result: list[Edge] = []
+        for page in self._pages:
+            result.extend(
+                compress(
+                    zip(page[_U::_RECORD_SIZE], page[_V::_RECORD_SIZE]),
+                    page[_FLIPPABLE::_RECORD_SIZE],
+                )
+            )
+        return result
 
     def get_flip_partner(self, edge: tuple[int, int]) -> tuple[int, int]:
         """
         Returns the flip partner of the given edge.
         """
-        u, v = normalize_edge(*edge)
-        if (u, v) not in self.flip_map:
-            raise ValueError("Edge is not flippable")
-        return self.flip_map[(u, v)]
+        e = self._edge_id(*edge)
+        if e is not None:
+            page, o = self._record(e)
+            if page[o + _FLIPPABLE]:
+                return (page[o + _APEX_1], page[o + _APEX_2])
+        raise ValueError("Edge is not flippable")
 
 
 def expand_edges_by_convex_hull_edges(
-    points: list[Point], edges: list[tuple[int, int]]
+    points: list[Point] | PointSet, edges: list[tuple[int, int]]
 ) -> list[tuple[int, int]]:
     """
     Expands the given set of edges by adding the edges of the convex hull of the points.
@@ -1,14 +1,55 @@
+import struct
 import sys
+from array import array
+from collections.abc import Iterable
+from typing import Literal
+
+import numpy as np
+from numpy.typing import NDArray
 
 if sys.version_info >= (3, 12):
     from typing import override
 else:
     from typing_extensions import override
 
-from .flip_partner_map import FlipPartnerMap, normalize_edge
-from ._bindings import is_triangulation, Point  # pyright: ignore[reportMissingModuleSource]
+from .flip_partner_map import (
+    _APEX_1,
+    _APEX_2,
+    _U,
+    _V,
+    FlipPartnerMap,
+    normalize_edge,
+)
+from ._bindings import is_triangulation, Point, PointSet, FlipEngine  # pyright: ignore[reportMissingModuleSource]
 from .typing import Edge
 
+# The flip map implementations a FlippableTriangulation can run on. Both offer
+# the same interface; the native one performs flips in O(1) inside C++.
+FlipMapBackend = Literal["python", "native"]
+
+# How apply_parallel_flips treats non-flippable and conflicting edges: "strict"
+# rejects the whole round, "greedy" skips them.
+ParallelFlipMode = Literal["strict", "greedy"]
+
+_MASK_64 = (1 << 64) - 1
+
+# Layout of to_bytes(): a 32-byte header (magic, format version, backend, and the
+# numbers of points, edge records and pending flips) followed by little-endian int64
+# arrays of the x- and y-coordinates, the (k, 5) edge records (see FlipPartnerMap)
+# and the (m, 2) pending flips. All arrays are 8-byte aligned.
+_SERIAL_HEADER = struct.Struct("<4sBB2xqqq")
+_SERIAL_MAGIC = b"CGFT"
+_SERIAL_VERSION = 1
+_SERIAL_BACKENDS: tuple[FlipMapBackend, ...] = ("python", "native")
+
+
+def _edge_hash(u: int, v: int) -> int:
+    """A pseudo-random 64-bit value for the normalized edge (u, v) (SplitMix64)."""
+    z = ((u << 32 | v) + 0x9E3779B97F4A7C15) & _MASK_64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return z ^ (z >> 31)
+
 
 class FlippableTriangulation:
     """
@@ -17,45 +58,185 @@ class FlippableTriangulation:
     to build your optimization algorithm.
     """
 
-    def __init__(self, flip_map: FlipPartnerMap):
+    def __init__(self, flip_map: FlipPartnerMap | FlipEngine):
         # Do not validate or build here to allow cheap copies/forks.
-        self._flip_map: FlipPartnerMap = flip_map
+        self._flip_map: FlipPartnerMap | FlipEngine = flip_map
         self._flip_queue: list[Edge] = []
+        self._pending: set[Edge] = set()  # the edges of _flip_queue
         self._conflicting_edges: set[Edge] = set()
+        # Flippable edges that are neither pending nor conflicting, in insertion
+        # order. Built on first use and then updated incrementally.
+        self._available: dict[Edge, None] | None = None
+        # True while a fork shares _available; it is copied before writing.
+        self._available_shared: bool = False
+        # Every committed flip as (u, v, c, d) for the edge (u, v) replaced by
+        # (c, d), and the number of journaled flips at the start of every commit.
+        self._journal: array = array("q")
+        self._commit_starts: list[int] = []
+        # Zobrist hash of the edges: the XOR of _edge_hash over all edges.
+        # Computed on first use and then updated by every flip.
+        self._hash: int | None = None
 
     @override
     def __eq__(self, other: object) -> bool:
         """
         Checks if two triangulations are equal (same edges and same pending flips).
+        Triangulations with different state hashes are rejected in O(1).
         """
         if not isinstance(other, FlippableTriangulation):
             return False
+        if self.state_hash() != other.state_hash():
+            return False
         if self._flip_map.edges != other._flip_map.edges:
             return False
-        flip_queue_set = {normalize_edge(*e) for e in self._flip_queue}
-        other_flip_queue_set = {normalize_edge(*e) for e in other._flip_queue}
-        return flip_queue_set == other_flip_queue_set
+        return self._pending == other._pending
+
+    @override
+    def __hash__(self) -> int:
+        """
+        The state hash of the triangulation. Note that it changes with every commit,
+        so a triangulation must not be modified while it is used as a dictionary key.
+        """
+        return self.state_hash()
+
+    def state_hash(self) -> int:
+        """
+        Returns a 64-bit Zobrist hash of the edges of the triangulation (pending flips
+        are not included). Triangulations with the same edges have the same hash,
+        independent of the backend and of the flips that led to them. The hash is
+        updated in O(1) per flip, so it can be used to detect revisited states.
+        """
+        if self._hash is None:
+            self._hash = 0
+            for u, v in self._flip_map.edges:
+                self._hash ^= _edge_hash(u, v)
+        return self._hash
+
+    def _update_hash(self, old_edge: Edge, new_edge: Edge):
+        if self._hash is not None:
+            self._hash ^= _edge_hash(*old_edge) ^ _edge_hash(*new_edge)
 
     @staticmethod
     def from_points_edges(
-        points: list[Point], edges: list[tuple[int, int]]
+        points: list[Point] | PointSet,
+        edges: list[tuple[int, int]],
+        backend: FlipMapBackend = "python",
     ) -> "FlippableTriangulation":
         """
         Validates input and builds the internal flip map.
         Use this factory when creating an instance from raw points/edges.
+
+        Args:
+            points: The points of the triangulation. Pass a `PointSet` to share
+                one native copy of the points between many triangulations.
+            edges: The edges of the triangulation (convex hull edges are implicit).
+            backend: "python" for the reference `FlipPartnerMap`, "native" for the
+                C++ `FlipEngine` with O(1) flips.
         """
         if not is_triangulation(points, edges, verbose=False):
             raise ValueError(
                 "The provided edges do not form a valid triangulation of the given points."
             )
-        flip_map = FlipPartnerMap.build(points, edges)
+        if backend == "python":
+            flip_map = FlipPartnerMap.build(points, edges)
+        elif backend == "native":
+            flip_map = FlipEngine.build(points, edges)
+        else:
+            raise ValueError(f"Unknown flip map backend: {backend}")
         return FlippableTriangulation(flip_map)
 
     def fork(self) -> "FlippableTriangulation":
         """
         Creates a copy of the triangulation that can be modified independently.
+        The copy starts with an empty flip journal, so it cannot be rolled back
+        to checkpoints of this triangulation.
+        """
+        fork = FlippableTriangulation(self._flip_map.deep_copy())
+        fork._hash = self._hash
+        if self._available is not None and not self._flip_queue:
+            fork._available = self._available
+            fork._available_shared = self._available_shared = True
+        return fork
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the points, the edges with their flip partners and flippability,
+        and the pending flips into a compact binary format, e.g., to send the
+        triangulation to another process. The flip journal is not included.
+        The layout is a fixed header followed by int64 arrays, so the data can also
+        be placed in a `multiprocessing.shared_memory` block.
+
+        Raises:
+            ValueError: If a point coordinate is not an integer.
         """
-        return FlippableTriangulation(self._flip_map.deep_copy())
+        points = self._flip_map.points
+        if not isinstance(points, PointSet):
+            points = PointSet(points)
+        xs, ys = points.to_arrays()
+        records = self._flip_map._edge_records()
+        pending = np.array(self._flip_queue, dtype=np.int64).reshape(-1, 2)
+        backend = 1 if isinstance(self._flip_map, FlipEngine) else 0
+        header = _SERIAL_HEADER.pack(
+            _SERIAL_MAGIC,
+            _SERIAL_VERSION,
+            backend,
+            len(xs),
+            len(records),
+            len(pending),
+        )
+        arrays = (xs, ys, records, pending)
+        return header + b"".join(a.astype("<i8", copy=False).tobytes() for a in arrays)
+
+    @staticmethod
+    def from_bytes(
+        data: bytes | bytearray | memoryview, backend: FlipMapBackend | None = None
+    ) -> "FlippableTriangulation":
+        """
+        Restores a triangulation serialized with to_bytes() in linear time, without
+        validating the triangulation or recomputing its triangles.
+
+        Args:
+            data: The serialized triangulation, or any buffer starting with it.
+            backend: The flip map backend of the restored triangulation. By default,
+                the backend of the serialized triangulation.
+
+        Raises:
+            ValueError: If the data is not a serialized triangulation.
+        """
+        if len(data) < _SERIAL_HEADER.size:
+            raise ValueError("The data is too short to hold a triangulation.")
+        magic, version, stored_backend, n, k, m = _SERIAL_HEADER.unpack_from(data)
+        if (
+            magic != _SERIAL_MAGIC
+            or version != _SERIAL_VERSION
+            or stored_backend >= len(_SERIAL_BACKENDS)
+        ):
+            raise ValueError("The data is not a serialized triangulation.")
+        count = 2 * n + 5 * k + 2 * m
+        # Buffers such as shared memory blocks may be longer than the data.
+        if len(data) < _SERIAL_HEADER.size + 8 * count:
+            raise ValueError("The data is shorter than the length in its header.")
+        values = np.frombuffer(
+            data, dtype="<i8", count=count, offset=_SERIAL_HEADER.size
+        )
+        points = PointSet.from_arrays(values[:n], values[n : 2 * n])
+        records = values[2 * n : 2 * n + 5 * k].reshape(k, 5)
+        if backend is None:
+            backend = _SERIAL_BACKENDS[stored_backend]
+        if backend == "python":
+            flip_map = FlipPartnerMap._from_edge_records(points, records)
+        elif backend == "native":
+            flip_map = FlipEngine._from_edge_records(points, records)
+        else:
+            raise ValueError(f"Unknown flip map backend: {backend}")
+        triangulation = FlippableTriangulation(flip_map)
+        for u, v in values[2 * n + 5 * k :].reshape(m, 2).tolist():
+            triangulation.add_flip((u, v))
+        return triangulation
+
+    def __reduce__(self):
+        """Pickles the triangulation in the format of to_bytes()."""
+        return FlippableTriangulation.from_bytes, (self.to_bytes(),)
 
     def get_edges(self) -> list[tuple[int, int]]:
         """
@@ -63,6 +244,77 @@ class FlippableTriangulation:
         """
         return list(self._flip_map.edges)
 
+    def edge_array(self) -> NDArray[np.int64]:
+        """
+        Returns the normalized edges of the triangulation, including the convex hull,
+        as a lexicographically sorted (k, 2) array. Like the other array methods, this
+        is regenerated from the flip map on every call with a few vectorized passes.
+        """
+        edges = self._flip_map._edge_records()[:, _U : _V + 1]
+        return edges[np.lexsort((edges[:, 1], edges[:, 0]))]
+
+    def triangle_array(self) -> NDArray[np.int64]:
+        """
+        Returns the triangles as a lexicographically sorted (t, 3) array of sorted
+        vertex triples, in the order of compute_triangles().
+        """
+        return self._triangles(self._flip_map._edge_records())
+
+    @staticmethod
+    def _triangles(records: NDArray[np.int64]) -> NDArray[np.int64]:
+        # Every triangle is listed by its three edges; keep it only at the edge
+        # formed by its two smallest vertices.
+        triangles = np.concatenate(
+            [
+                records[records[:, apex] > records[:, _V]][:, [_U, _V, apex]]
+                for apex in (_APEX_1, _APEX_2)
+            ]
+        )
+        return triangles[
+            np.lexsort((triangles[:, 2], triangles[:, 1], triangles[:, 0]))
+        ]
+
+    def triangle_adjacency(self) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Returns the triangles (see triangle_array()) and the dual graph as a (t, 3)
+        array: entry [i, j] is the index of the triangle sharing the edge opposite to
+        corner j of triangle i, or -1 on the convex hull.
+        """
+        records = self._flip_map._edge_records()
+        triangles = self._triangles(records)
+        n = len(self._flip_map.points)
+        keys = (triangles[:, 0] * n + triangles[:, 1]) * n + triangles[:, 2]
+        adjacency = np.full(triangles.shape, -1, dtype=np.int64)
+        inner = records[records[:, _APEX_2] >= 0]
+        u, v = inner[:, _U], inner[:, _V]
+        sides = []
+        for apex in (inner[:, _APEX_1], inner[:, _APEX_2]):
+            triangle = np.sort(np.stack((u, v, apex), axis=1), axis=1)
+            index = np.searchsorted(
+                keys, (triangle[:, 0] * n + triangle[:, 1]) * n + triangle[:, 2]
+            )
+            # The position of the apex in the sorted triple is its corner.
+            sides.append((index, (apex > u).astype(np.int64) + (apex > v)))
+        (first, first_corner), (second, second_corner) = sides
+        adjacency[first, first_corner] = second
+        adjacency[second, second_corner] = first
+        return triangles, adjacency
+
+    def vertex_neighbors(self) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Returns the vertex stars in compressed sparse row format (indptr, indices):
+        the neighbors of vertex v are indices[indptr[v] : indptr[v + 1]], in
+        ascending order. Can be passed to `scipy.sparse.csr_matrix`.
+        """
+        edges = self._flip_map._edge_records()[:, _U : _V + 1]
+        sources = np.concatenate((edges[:, 0], edges[:, 1]))
+        targets = np.concatenate((edges[:, 1], edges[:, 0]))
+        order = np.lexsort((targets, sources))
+        counts = np.bincount(sources, minlength=len(self._flip_map.points))
+        indptr = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return indptr, targets[order]
+
     def add_flip(self, edge: tuple[int, int]) -> tuple[int, int]:
         """
         Flips the given edge in the triangulation. It adds this flip to the list of pending flips.
@@ -79,31 +331,210 @@ class FlippableTriangulation:
             raise ValueError("Edge flip conflicts with previously added flips.")
         if not self._flip_map.is_flippable(edge):
             raise ValueError("Edge is not flippable.")
-        if edge in self._flip_queue:
+        if edge in self._pending:
             raise ValueError("Edge flip already pending.")
         conflicts = self._flip_map.conflicting_flips(edge)
         self._conflicting_edges.update(conflicts)
         self._flip_queue.append(edge)
+        self._pending.add(edge)
+        if (available := self._writable_available()) is not None:
+            available.pop(edge, None)
+            for conflict in conflicts:
+                available.pop(conflict, None)
         return self._flip_map.get_flip_partner(edge)
 
-    def commit(self):
+    def apply_parallel_flips(
+        self, edges: Iterable[tuple[int, int]], mode: ParallelFlipMode = "strict"
+    ) -> list[tuple[Edge, Edge]]:
+        """
+        Validates a whole round of parallel flips in a single call to the flip map and
+        commits it. Two flips conflict if their edges share a triangle.
+
+        Args:
+            edges: The edges to flip in parallel, iterated once.
+            mode: "strict" to reject the round if any edge is not flippable or any two
+                edges conflict, "greedy" to flip the edges in the given order, skipping
+                non-flippable edges and edges that conflict with an earlier one.
+
+        Returns:
+            The pairs (flipped edge, new edge) of the committed flips.
+
+        Raises:
+            ValueError: If flips are pending, or in strict mode if the round is invalid.
+                The message lists all non-flippable edges and conflicting pairs.
+        """
+        if self._flip_queue:
+            raise ValueError("Cannot apply parallel flips while flips are pending.")
+        if mode not in ("strict", "greedy"):
+            raise ValueError(f"Unknown parallel flip mode: {mode}")
+        edges = [normalize_edge(*e) for e in edges]
+        selected, unflippable, conflicts = self._flip_map.check_parallel_flips(
+            edges, mode == "greedy"
+        )
+        if mode == "strict" and (unflippable or conflicts):
+            problems = [f"edge {edges[i]} is not flippable" for i in unflippable]
+            problems += [
+                f"edges {edges[i]} and {edges[j]} conflict" for i, j in conflicts
+            ]
+            raise ValueError("Invalid parallel flips: " + "; ".join(problems) + ".")
+        flipped = [edges[i] for i in selected]
+        self._flip_queue.extend(flipped)
+        if (available := self._writable_available()) is not None:
+            for edge in flipped:
+                available.pop(edge, None)
+        return list(zip(flipped, self.commit()))
+
+    def commit(self) -> list[tuple[int, int]]:
         """
         Commits all pending flips to the triangulation.
+        The flips are recorded in a journal, so they can be reverted with
+        undo_last_commit() or rollback().
+
+        Returns:
+            The new edges, in the order in which the flips were added.
         """
+        if self._flip_queue:
+            self._commit_starts.append(len(self._journal) // 4)
+        # Only the new edges and the edges around the flipped quadrilaterals can
+        # change their flippability. This includes all conflicting edges.
+        touched: list[Edge] = []
+        new_edges: list[Edge] = []
         for edge in self._flip_queue:
-            _ = self._flip_map.flip(edge)
+            new_edge = self._flip_map.flip(edge)
+            new_edges.append(new_edge)
+            self._journal.extend((*edge, *new_edge))
+            self._update_hash(edge, new_edge)
+            touched.append(new_edge)
+            touched.extend(normalize_edge(u, w) for u in edge for w in new_edge)
         self._flip_queue.clear()
+        self._pending.clear()
         self._conflicting_edges.clear()
+        self._refresh_available(touched)
+        return new_edges
+
+    def checkpoint(self) -> int:
+        """
+        Returns a token for the current committed state that can be passed to rollback().
+        Pending flips are not part of the checkpoint.
+        """
+        return len(self._journal) // 4
+
+    def rollback(self, to: int):
+        """
+        Reverts the triangulation to the state of the given checkpoint by flipping the
+        journaled flips back in reverse order. Pending flips are discarded.
+        The cost is proportional to the number of reverted flips.
+
+        Args:
+            to: A token returned by checkpoint() on this triangulation.
+
+        Raises:
+            ValueError: If the checkpoint is not part of the current history.
+        """
+        if not 0 <= to <= len(self._journal) // 4:
+            raise ValueError("Checkpoint is not part of the flip history.")
+        touched = self._discard_pending()
+        journal = self._journal
+        while len(journal) > 4 * to:
+            u, v, c, d = journal[-4:]
+            del journal[-4:]
+            self._flip_map.flip((c, d))
+            self._update_hash((c, d), (u, v))
+            touched.extend(((u, v), (c, d)))
+            touched.extend(normalize_edge(x, w) for x in (u, v) for w in (c, d))
+        while self._commit_starts and self._commit_starts[-1] >= to:
+            self._commit_starts.pop()
+        self._refresh_available(touched)
+
+    def undo_last_commit(self):
+        """
+        Reverts the flips of the last commit that has not been reverted yet.
+        Pending flips are discarded.
+
+        Raises:
+            ValueError: If there is no commit to revert.
+        """
+        if not self._commit_starts:
+            raise ValueError("There is no commit to undo.")
+        self.rollback(self._commit_starts[-1])
+
+    def changed_since(self, checkpoint: int) -> set[tuple[int, int]]:
+        """
+        Returns the edges whose flippability or flip partner may have changed since the
+        given checkpoint: the new edges and the four boundary edges of every flipped
+        quadrilateral. Edges that have been flipped away are not included.
+        The cost is proportional to the number of flips since the checkpoint.
+
+        Args:
+            checkpoint: A token returned by checkpoint() on this triangulation.
+
+        Raises:
+            ValueError: If the checkpoint is not part of the current history.
+        """
+        if not 0 <= checkpoint <= len(self._journal) // 4:
+            raise ValueError("Checkpoint is not part of the flip history.")
+        # Replay the journal to know which touched edges still exist.
+        present: dict[Edge, bool] = {}
+        journal = self._journal
+        for i in range(4 * checkpoint, len(journal), 4):
+            u, v, c, d = journal[i : i + 4]
+            present[(u, v)] = False
+            present[(c, d)] = True
+            for x in (u, v):
+                for w in (c, d):
+                    present[normalize_edge(x, w)] = True
+        return {edge for edge, exists in present.items() if exists}
+
+    def _discard_pending(self) -> list[Edge]:
+        """Drops all pending flips and returns the edges whose availability changes."""
+        touched: list[Edge] = []
+        for edge in self._flip_queue:
+            partner = self._flip_map.get_flip_partner(edge)
+            touched.append(edge)
+            touched.extend(normalize_edge(u, w) for u in edge for w in partner)
+        self._flip_queue.clear()
+        self._pending.clear()
+        self._conflicting_edges.clear()
+        return touched
+
+    def _refresh_available(self, touched: list[Edge]):
+        """Updates the available flips for edges whose flippability may have changed."""
+        available = self._writable_available()
+        if available is None:
+            return
+        for edge in touched:
+            if (
+                self._flip_map.is_flippable(edge)
+                and edge not in self._pending
+                and edge not in self._conflicting_edges
+            ):
+                available[edge] = None
+            else:
+                available.pop(edge, None)
+
+    def _writable_available(self) -> dict[Edge, None] | None:
+        """The available flips, copied first if they are shared with a fork."""
+        if self._available is not None and self._available_shared:
+            self._available = self._available.copy()
+            self._available_shared = False
+        return self._available
+
+    def _available_flips(self) -> dict[Edge, None]:
+        if self._available is None:
+            self._available = {
+                e: None
+                for e in self._flip_map.flippable_edges()
+                if e not in self._conflicting_edges and e not in self._pending
+            }
+        return self._available
 
     def possible_flips(self) -> list[tuple[int, int]]:
         """
         Returns a list of all edges that can currently be flipped.
+        The set is maintained incrementally by add_flip() and commit(), so this
+        only copies it instead of filtering all flippable edges.
         """
-        return [
-            e
-            for e in self._flip_map.flippable_edges()
-            if e not in self._conflicting_edges and e not in self._flip_queue
-        ]
+        return list(self._available_flips())
 
     def get_flip_partner(self, edge: tuple[int, int]) -> tuple[int, int]:
         """Return the flip partner of a flippable edge.
@@ -1,7 +1,8 @@
 #include "geometry_operations.h"
 #include "cgal_utils.h"
+#include "combinatorial_validation.h"
+#include "predicates.h"
 #include "triangulation_validation.h"
-#include <CGAL/convex_hull_2.h>
 #include <algorithm>
 #include <array>
 #include <iostream>
@@ -13,18 +14,19 @@ namespace cgshop2026 {
  * No endpoint is allowed to lie on the other segment.
  */
 bool do_cross(const Segment2 &s1, const Segment2 &s2) {
-  auto result = CGAL::intersection(s1, s2);
-  if (result) {
-    if (const Point *p = std::get_if<Point>(&*result)) {
-      // Check if the intersection point is an endpoint of either segment
-      if (*p == s1.source() || *p == s1.target() || *p == s2.source() ||
-          *p == s2.target()) {
-        return false; // Intersection at an endpoint, not a crossing
-      }
-      return true; // Proper crossing
-    }
-  }
-  return false; // No intersection
+  // A proper crossing has each segment strictly separating the endpoints of
+  // the other one. Orientation predicates decide this without constructing
+  // the intersection point, using integer arithmetic for integral points.
+  return exact_do_cross(s1.source(), s1.target(), s2.source(), s2.target());
+}
+
+/**
+ * The edge (a, b) between the triangles (a, b, c) and (a, b, d) violates the
+ * Delaunay property if d lies strictly inside the circumcircle of (a, b, c).
+ */
+bool violates_local_delaunay(const Point &a, const Point &b, const Point &c,
+                             const Point &d) {
+  return exact_violates_local_delaunay(a, b, c, d);
 }
 
 // ============================================================================
@@ -33,24 +35,41 @@ bool do_cross(const Segment2 &s1, const Segment2 &s2) {
 
 /**
  * This function checks if the given set of edges forms a triangulation of the
- * provided points. It uses the CGAL arrangement data structure to insert the
- * edges and verify the triangulation properties.
+ * provided points. By default, it uses a combinatorial check that runs in
+ * O(n log n) time and only falls back to inserting the edges into a CGAL
+ * arrangement for degenerate inputs.
  */
-bool is_triangulation(const std::vector<Point> &points,
+bool is_triangulation(const PointSet &point_set,
                       const std::vector<std::tuple<int, int>> &edges,
-                      bool verbose) {
+                      bool verbose, bool use_arrangement) {
+  const std::vector<Point> &points = point_set.points();
   if (verbose) {
     fmt::print("Validating triangulation with {} points and {} edges.\n",
                points.size(), edges.size());
   }
 
-  // Step 1: Build point-to-index mapping and check for duplicates
-  const auto idx_of_opt = build_point_index_map(points, verbose);
+  // Step 1: Get the (cached) point-to-index mapping and check for duplicates
+  const PointIndex *idx_of_opt = build_point_index_map(point_set, verbose);
   if (!idx_of_opt) {
     return false;
   }
   const auto &idx_of = *idx_of_opt;
 
+  // Fast path: validate via Euler's formula and the rotation system
+  if (!use_arrangement) {
+    switch (check_triangulation_combinatorially(point_set, edges, verbose)) {
+    case CombinatorialResult::Triangulation:
+      if (verbose) {
+        fmt::print("Triangulation validation complete: Valid triangulation\n");
+      }
+      return true;
+    case CombinatorialResult::NoTriangulation:
+      return false;
+    case CombinatorialResult::Degenerate:
+      break; // Handled by the arrangement below
+    }
+  }
+
   // Step 2: Create arrangement and insert edges
   Arrangement_2 arrangement;
   PointLocation point_location(arrangement);
@@ -61,7 +80,8 @@ bool is_triangulation(const std::vector<Point> &points,
   }
 
   // Step 3: Add convex hull edges
-  add_convex_hull_to_arrangement(points, arrangement, point_location, verbose);
+  add_convex_hull_to_arrangement(point_set, arrangement, point_location,
+                                 verbose);
 
   // Step 4: Validate vertex count (no new intersections, no missing points)
   if (!validate_vertex_count(arrangement, points.size(), points, verbose)) {
@@ -98,11 +118,9 @@ bool is_triangulation(const std::vector<Point> &points,
 /**
  * Build arrangement from points and edges, including convex hull.
  */
-static void
-build_arrangement_for_triangles(const std::vector<Point> &points,
-                                const std::vector<std::tuple<int, int>> &edges,
-                                Arrangement_2 &arrangement,
-                                PointLocation &point_location) {
+static void build_arrangement_for_triangles(
+    const PointSet &points, const std::vector<std::tuple<int, int>> &edges,
+    Arrangement_2 &arrangement, PointLocation &point_location) {
 
   // Insert input edges
   for (const auto &edge : edges) {
@@ -116,13 +134,11 @@ build_arrangement_for_triangles(const std::vector<Point> &points,
     CGAL::insert(arrangement, seg, point_location);
   }
 
-  // Add convex hull edges
-  std::vector<Point> hull;
-  hull.reserve(points.size());
-  CGAL::convex_hull_2(points.begin(), points.end(), std::back_inserter(hull));
+  // Add convex hull edges (cached by the point set)
+  const std::vector<int> &hull = points.hull();
   for (size_t k = 0; k < hull.size(); ++k) {
-    const Point &p1 = hull[k];
-    const Point &p2 = hull[(k + 1) % hull.size()];
+    const Point &p1 = points[hull[k]];
+    const Point &p2 = points[hull[(k + 1) % hull.size()]];
     const Segment2 hull_edge(p1, p2);
     CGAL::insert(arrangement, hull_edge, point_location);
   }
@@ -134,7 +150,7 @@ build_arrangement_for_triangles(const std::vector<Point> &points,
  */
 static std::vector<std::tuple<int, int, int>>
 extract_triangular_faces(const Arrangement_2 &arrangement,
-                         const std::map<Point, int, LessPointXY> &idx_of) {
+                         const PointIndex &idx_of) {
 
   std::vector<std::tuple<int, int, int>> triangles;
   triangles.reserve(arrangement.number_of_faces());
@@ -157,14 +173,14 @@ extract_triangular_faces(const Arrangement_2 &arrangement,
       }; // Early out: not a triangle
 
       const Point &pv = e->source()->point();
-      auto it = idx_of.find(pv);
-      if (it == idx_of.end()) {
+      const auto idx = idx_of.find(pv);
+      if (!idx) {
         // Vertex not in original points (likely intersection) - skip face
         throw std::runtime_error(
             "Face vertex not found in original points list.");
       }
       if (deg < 3)
-        idxs[deg] = it->second;
+        idxs[deg] = *idx;
       ++deg;
 
       e = e->next();
@@ -191,15 +207,27 @@ extract_triangular_faces(const Arrangement_2 &arrangement,
  * convex hull. Otherwise, all edges should appear exactly twice. The indices
  * will be sorted in each triangle, and the list of triangles will also be
  * sorted.
+ * If the edges form a triangulation, the triangles are read off the
+ * angularly sorted edges. Otherwise, or with use_arrangement, the edges are
+ * inserted into a CGAL arrangement.
  * Expects that all bounded faces are triangles and will throw if not.
  */
 std::vector<std::tuple<int, int, int>>
-compute_triangles(const std::vector<Point> &points,
-                  const std::vector<std::tuple<int, int>> &edges) {
-  // Step 1: Build point-to-index mapping
-  std::map<Point, int, LessPointXY> idx_of;
-  for (int i = 0; i < static_cast<int>(points.size()); ++i) {
-    idx_of.emplace(points[i], i);
+compute_triangles(const PointSet &points,
+                  const std::vector<std::tuple<int, int>> &edges,
+                  bool use_arrangement) {
+  // Step 1: Get the (cached) point-to-index mapping
+  const PointIndex &idx_of = points.point_index();
+
+  // Fast path: valid triangulations without duplicate points
+  if (!use_arrangement && idx_of.first_duplicate() < 0) {
+    std::vector<std::tuple<int, int, int>> triangles;
+    if (check_triangulation_combinatorially(points, edges,
+                                            /*verbose=*/false, &triangles) ==
+        CombinatorialResult::Triangulation) {
+      std::sort(triangles.begin(), triangles.end());
+      return triangles;
+    }
   }
 
   // Step 2: Build arrangement with edges and convex hull
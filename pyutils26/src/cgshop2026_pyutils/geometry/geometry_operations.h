@@ -1,6 +1,7 @@
 #pragma once
 
 #include "cgal_types.h"
+#include "point_set.h"
 #include <optional>
 #include <tuple>
 #include <vector>
@@ -13,14 +14,25 @@ namespace cgshop2026 {
  */
 bool do_cross(const Segment2 &s1, const Segment2 &s2);
 
+/**
+ * The edge (a, b) between the triangles (a, b, c) and (a, b, d) violates the
+ * Delaunay property if d lies strictly inside the circumcircle of (a, b, c).
+ * The orientation of (a, b, c) does not matter; cocircular points are legal.
+ */
+bool violates_local_delaunay(const Point &a, const Point &b, const Point &c,
+                             const Point &d);
+
 /**
  * This function checks if the given set of edges forms a triangulation of the
- * provided points. It uses the CGAL arrangement data structure to insert the
- * edges and verify the triangulation properties.
+ * provided points. By default, it uses a combinatorial check (see
+ * check_triangulation_combinatorially) and only falls back to the CGAL
+ * arrangement data structure for degenerate inputs. With use_arrangement, the
+ * edges are always inserted into an arrangement to verify the triangulation
+ * properties.
  */
-bool is_triangulation(const std::vector<Point> &points,
+bool is_triangulation(const PointSet &points,
                       const std::vector<std::tuple<int, int>> &edges,
-                      bool verbose = false);
+                      bool verbose = false, bool use_arrangement = false);
 
 /**
  * This function computes all triangles formed by the given set of points and
@@ -29,9 +41,13 @@ bool is_triangulation(const std::vector<Point> &points,
  * convex hull. Otherwise, all edges should appear exactly twice. The indices
  * will be sorted in each triangle, and the list of triangles will also be
  * sorted.
+ * If the edges form a triangulation, the triangles are read off the
+ * angularly sorted edges (see check_triangulation_combinatorially). Otherwise,
+ * or with use_arrangement, the edges are inserted into a CGAL arrangement.
  */
 std::vector<std::tuple<int, int, int>>
-compute_triangles(const std::vector<Point> &points,
-                  const std::vector<std::tuple<int, int>> &edges);
+compute_triangles(const PointSet &points,
+                  const std::vector<std::tuple<int, int>> &edges,
+                  bool use_arrangement = false);
 
 } // namespace cgshop2026
@@ -9,6 +9,14 @@
 
 namespace cgshop2026 {
 
+/**
+ * @brief Largest absolute coordinate for which the integer predicates in
+ * predicates.h are exact. Coordinate differences then fit into 30 bits, so
+ * orientation determinants fit into int64 and incircle determinants into
+ * int128.
+ */
+constexpr long kMaxIntegralCoordinate = 1L << 29;
+
 /**
  * @brief Represents a 2D point with integral coordinates.
  *
@@ -47,6 +55,31 @@ public:
     y_ = static_cast<long>(ry);
   }
 
+  /**
+   * @brief Construct an IntegralPoint from integer coordinates.
+   */
+  IntegralPoint(long x, long y) : x_(x), y_(y) {}
+
+  /**
+   * @brief Exactly convert a CGAL point if it has integral coordinates.
+   *
+   * Only uses the interval approximation of the coordinates, which is exact
+   * (a single value) for points constructed from integers, so no exact
+   * computation is triggered.
+   *
+   * @return The integral point, or std::nullopt if the coordinates are not
+   * provably integral or exceed kMaxIntegralCoordinate in absolute value.
+   */
+  static std::optional<IntegralPoint> try_from(const Point &p) {
+    const auto [x_lo, x_hi] = CGAL::to_interval(p.x());
+    const auto [y_lo, y_hi] = CGAL::to_interval(p.y());
+    if (x_lo != x_hi || y_lo != y_hi || !is_small_integer(x_lo) ||
+        !is_small_integer(y_lo)) {
+      return std::nullopt;
+    }
+    return IntegralPoint(static_cast<long>(x_lo), static_cast<long>(y_lo));
+  }
+
   /**
    * @brief Equality comparison operator.
    */
@@ -91,10 +124,35 @@ public:
   };
 
 private:
+  static bool is_small_integer(double v) {
+    return std::abs(v) <= static_cast<double>(kMaxIntegralCoordinate) &&
+           std::floor(v) == v;
+  }
+
   long x_; ///< X-coordinate
   long y_; ///< Y-coordinate
 };
 
+/**
+ * @brief Convert all points to IntegralPoints if this is exactly possible.
+ *
+ * @return The integral points, or std::nullopt if at least one point is not
+ * integral (see IntegralPoint::try_from).
+ */
+inline std::optional<std::vector<IntegralPoint>>
+to_integral_points(const std::vector<Point> &points) {
+  std::vector<IntegralPoint> result;
+  result.reserve(points.size());
+  for (const auto &p : points) {
+    auto ip = IntegralPoint::try_from(p);
+    if (!ip) {
+      return std::nullopt;
+    }
+    result.push_back(*ip);
+  }
+  return result;
+}
+
 /**
  * @brief Fast point-to-index lookup map using integral coordinates.
  *
@@ -106,6 +164,8 @@ private:
  */
 class IntegralPointIndexMap {
 public:
+  IntegralPointIndexMap() = default;
+
   /**
    * @brief Construct the index map from a vector of points.
    *
@@ -121,6 +181,21 @@ public:
     }
   }
 
+  /**
+   * @brief Insert a point with its index.
+   *
+   * @return False if the point is already contained (the index is not
+   * updated), true otherwise.
+   */
+  bool insert(const IntegralPoint &ip, int index) {
+    return point_to_index_.emplace(ip, index).second;
+  }
+
+  /**
+   * @brief Reserve space for the given number of points.
+   */
+  void reserve(size_t count) { point_to_index_.reserve(count); }
+
   /**
    * @brief Look up the index of a given integral point.
    *
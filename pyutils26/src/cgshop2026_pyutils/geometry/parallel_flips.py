@@ -0,0 +1,164 @@
+"""
+Selection of large sets of flips that can be performed in parallel.
+
+Two flips conflict if their edges share a triangle (see `FlipPartnerMap.conflicting_flips`).
+A set of parallel flips is an independent set in the conflict graph of the candidates.
+As every triangle has three edges, each candidate conflicts with at most four others, and
+the conflict graph usually falls apart into many small components.
+"""
+
+from collections.abc import Sequence
+
+from .flippable_triangulation import FlippableTriangulation
+from .typing import Edge
+
+
+def conflict_graph(
+    triangulation: FlippableTriangulation, candidates: Sequence[Edge]
+) -> tuple[list[int], list[set[int]]]:
+    """
+    Builds the conflict graph of candidate flips with a single call to the flip map.
+    Candidates that cannot be added to the pending flips of the triangulation (not
+    flippable, pending, or conflicting with a pending flip) are left out.
+
+    Args:
+        triangulation: The triangulation the flips are performed on.
+        candidates: The edges to flip.
+
+    Returns:
+        The indices of the usable candidates and, for every candidate, the set of indices
+        of the candidates it conflicts with.
+    """
+    edges = [(u, v) if u < v else (v, u) for u, v in candidates]
+    selected, _, conflicts = triangulation._flip_map.check_parallel_flips(edges, False)
+    blocked = triangulation._pending | triangulation._conflicting_edges
+    usable = [i for i in selected if edges[i] not in blocked]
+    neighbors: list[set[int]] = [set() for _ in edges]
+    for i, j in conflicts:
+        neighbors[i].add(j)
+        neighbors[j].add(i)
+    return usable, neighbors
+
+
+def _components(vertices: list[int], neighbors: list[set[int]]) -> list[list[int]]:
+    remaining = set(vertices)
+    components: list[list[int]] = []
+    for start in vertices:
+        if start not in remaining:
+            continue
+        remaining.remove(start)
+        component = [start]
+        stack = [start]
+        while stack:
+            for w in neighbors[stack.pop()]:
+                if w in remaining:
+                    remaining.remove(w)
+                    component.append(w)
+                    stack.append(w)
+        components.append(component)
+    return components
+
+
+def _exact_independent_set(
+    component: list[int], neighbors: list[set[int]], weights: Sequence[float]
+) -> list[int]:
+    """Maximum weight independent set by branching on bitmasks with memoization."""
+    bit = {v: 1 << k for k, v in enumerate(component)}
+    adjacency = [sum(bit[w] for w in neighbors[v] if w in bit) for v in component]
+    weight = [weights[v] for v in component]
+    memo: dict[int, tuple[float, int]] = {}
+
+    def solve(mask: int) -> tuple[float, int]:
+        if mask == 0:
+            return 0.0, 0
+        if mask in memo:
+            return memo[mask]
+        # Branch on the vertex with the most neighbors left in the mask.
+        best_k, best_degree = -1, -1
+        m = mask
+        while m:
+            low = m & -m
+            k = low.bit_length() - 1
+            degree = (adjacency[k] & mask).bit_count()
+            if degree > best_degree:
+                best_k, best_degree = k, degree
+            m ^= low
+        if best_degree == 0:
+            # Only isolated vertices are left: take all of them.
+            total = sum(weight[k] for k in range(len(component)) if mask >> k & 1)
+            result = (total, mask)
+        else:
+            k = best_k
+            value, chosen = solve(mask & ~(adjacency[k] | 1 << k))
+            take = (value + weight[k], chosen | 1 << k)
+            skip = solve(mask & ~(1 << k))
+            result = take if take[0] >= skip[0] else skip
+        memo[mask] = result
+        return result
+
+    _, chosen = solve((1 << len(component)) - 1)
+    return [v for k, v in enumerate(component) if chosen >> k & 1]
+
+
+def _greedy_independent_set(
+    component: list[int], neighbors: list[set[int]], weights: Sequence[float]
+) -> list[int]:
+    """
+    Repeatedly takes the vertex maximizing weight / (degree + 1) among the remaining
+    vertices and removes it and its neighbors, so the result is a maximal independent
+    set.
+    """
+    remaining = set(component)
+    degree = {v: len(neighbors[v] & remaining) for v in component}
+    chosen: list[int] = []
+    while remaining:
+        v = max(remaining, key=lambda v: (weights[v] / (degree[v] + 1), -v))
+        chosen.append(v)
+        removed = (neighbors[v] & remaining) | {v}
+        remaining -= removed
+        for u in removed:
+            for w in neighbors[u] & remaining:
+                degree[w] -= 1
+    return chosen
+
+
+def select_parallel_flips(
+    triangulation: FlippableTriangulation,
+    candidates: Sequence[Edge],
+    weights: Sequence[float] | None = None,
+    exact_limit: int = 24,
+) -> list[Edge]:
+    """
+    Selects a set of non-conflicting flips among the candidates that is as large (or as
+    heavy) as possible. The conflict graph is split into connected components; components
+    with at most `exact_limit` candidates are solved exactly, larger ones with a greedy
+    heuristic.
+
+    Args:
+        triangulation: The triangulation the flips are performed on. Candidates that
+            cannot be added to its pending flips are ignored.
+        candidates: The edges to choose from. Duplicates are allowed.
+        weights: An optional positive weight for every candidate. By default, the number
+            of selected flips is maximized.
+        exact_limit: The largest component that is solved exactly.
+
+    Returns:
+        The selected edges in the order of the candidates, ready for
+        `FlippableTriangulation.apply_parallel_flips(..., mode="strict")`.
+    """
+    if weights is None:
+        weights = [1.0] * len(candidates)
+    elif len(weights) != len(candidates):
+        raise ValueError("There must be one weight per candidate.")
+    usable, neighbors = conflict_graph(triangulation, candidates)
+    chosen: list[int] = []
+    for component in _components(usable, neighbors):
+        if len(component) == 1:
+            chosen.extend(component)
+        elif len(component) <= exact_limit:
+            chosen.extend(_exact_independent_set(component, neighbors, weights))
+        else:
+            chosen.extend(_greedy_independent_set(component, neighbors, weights))
+    return [
+        (u, v) if u < v else (v, u) for u, v in (candidates[i] for i in sorted(chosen))
+    ]
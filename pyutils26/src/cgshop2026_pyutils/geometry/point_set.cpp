@@ -0,0 +1,220 @@
+#include "point_set.h"
+#include "predicates.h"
+#include <algorithm>
+#include <cmath>
+#include <cstdlib>
+#include <numeric>
+#include <stdexcept>
+#include <tuple>
+#include <utility>
+
+namespace cgshop2026 {
+
+namespace {
+
+// Integers up to this absolute value are exactly representable as double.
+constexpr std::int64_t kMaxExactDouble = std::int64_t(1) << 53;
+
+bool is_small_integral(std::int64_t v) {
+  return v >= -kMaxIntegralCoordinate && v <= kMaxIntegralCoordinate;
+}
+
+// The hull is computed either on native integers or on exact kernel points.
+CGAL::Orientation orient(const IntegralPoint &p, const IntegralPoint &q,
+                         const IntegralPoint &r) {
+  return orientation(p, q, r);
+}
+
+CGAL::Orientation orient(const Point &p, const Point &q, const Point &r) {
+  return CGAL::orientation(p, q, r);
+}
+
+template <typename P> bool less_xy(const P &p, const P &q) {
+  return p.x() < q.x() || (p.x() == q.x() && p.y() < q.y());
+}
+
+/**
+ * Counter-clockwise convex hull (monotone chain), including the points in the
+ * interior of hull edges. Duplicate points are skipped. If all points are
+ * collinear, returns the extreme points and sets `collinear`.
+ */
+template <typename P>
+std::vector<int> hull_with_collinear_points(const std::vector<P> &points,
+                                            bool &collinear) {
+  std::vector<int> order(points.size());
+  std::iota(order.begin(), order.end(), 0);
+  std::sort(order.begin(), order.end(),
+            [&](int a, int b) { return less_xy(points[a], points[b]); });
+  order.erase(std::unique(order.begin(), order.end(),
+                          [&](int a, int b) { return points[a] == points[b]; }),
+              order.end());
+
+  collinear = true;
+  if (order.size() < 3) {
+    return order;
+  }
+  const P &first = points[order.front()];
+  const P &last = points[order.back()];
+  if (std::all_of(order.begin(), order.end(), [&](int i) {
+        return orient(first, last, points[i]) == CGAL::COLLINEAR;
+      })) {
+    return {order.front(), order.back()};
+  }
+  collinear = false;
+
+  std::vector<int> hull;
+  const auto add_chain = [&](auto begin, auto end) {
+    const std::size_t start = hull.size();
+    for (auto it = begin; it != end; ++it) {
+      while (hull.size() >= start + 2 &&
+             orient(points[hull[hull.size() - 2]], points[hull.back()],
+                    points[*it]) == CGAL::RIGHT_TURN) {
+        hull.pop_back();
+      }
+      hull.push_back(*it);
+    }
+    hull.pop_back(); // The last point starts the next chain.
+  };
+  add_chain(order.begin(), order.end());
+  add_chain(order.rbegin(), order.rend());
+  return hull;
+}
+
+} // anonymous namespace
+
+PointIndex::PointIndex(const std::vector<Point> &points)
+    : PointIndex(points, to_integral_points(points)) {}
+
+PointIndex::PointIndex(
+    const std::vector<Point> &points,
+    const std::optional<std::vector<IntegralPoint>> &integral_points) {
+  const int point_count = static_cast<int>(points.size());
+  if (integral_points) {
+    // Fast path: hash the native integer coordinates.
+    integral_.emplace();
+    integral_->reserve(points.size());
+    for (int i = 0; i < point_count; ++i) {
+      if (!integral_->insert((*integral_points)[i], i) && first_duplicate_ < 0)
+        first_duplicate_ = i;
+    }
+    return;
+  }
+  for (int i = 0; i < point_count; ++i) {
+    if (!exact_.emplace(points[i], i).second && first_duplicate_ < 0)
+      first_duplicate_ = i;
+  }
+}
+
+std::optional<int> PointIndex::find(const Point &p) const {
+  if (integral_) {
+    if (const auto ip = IntegralPoint::try_from(p)) {
+      return integral_->get_index(*ip);
+    }
+    // Constructed points (e.g., intersections in an arrangement) may only have
+    // an approximate interval even if they coincide with an input point.
+    const double x = std::round(CGAL::to_double(p.x()));
+    const double y = std::round(CGAL::to_double(p.y()));
+    const double limit = static_cast<double>(kMaxIntegralCoordinate);
+    if (std::abs(x) > limit || std::abs(y) > limit || p.x() != Kernel::FT(x) ||
+        p.y() != Kernel::FT(y)) {
+      return std::nullopt;
+    }
+    return integral_->get_index(
+        IntegralPoint(static_cast<long>(x), static_cast<long>(y)));
+  }
+  const auto it = exact_.find(p);
+  if (it == exact_.end()) {
+    return std::nullopt;
+  }
+  return it->second;
+}
+
+PointSet::PointSet(std::vector<Point> points)
+    : points_(std::move(points)),
+      integral_points_(to_integral_points(points_)) {}
+
+PointSet::PointSet(const std::int64_t *xs, const std::int64_t *ys,
+                   std::size_t count) {
+  points_.reserve(count);
+  bool all_small = true;
+  for (std::size_t i = 0; i < count; ++i) {
+    if (std::llabs(xs[i]) > kMaxExactDouble ||
+        std::llabs(ys[i]) > kMaxExactDouble) {
+      throw std::invalid_argument(
+          "Point coordinates must not exceed 2^53 in absolute value.");
+    }
+    points_.emplace_back(static_cast<double>(xs[i]),
+                         static_cast<double>(ys[i]));
+    all_small =
+        all_small && is_small_integral(xs[i]) && is_small_integral(ys[i]);
+  }
+  if (all_small) {
+    integral_points_.emplace();
+    integral_points_->reserve(count);
+    for (std::size_t i = 0; i < count; ++i) {
+      integral_points_->emplace_back(static_cast<long>(xs[i]),
+                                     static_cast<long>(ys[i]));
+    }
+  }
+}
+
+std::pair<std::vector<std::int64_t>, std::vector<std::int64_t>>
+PointSet::integer_coordinates() const {
+  std::vector<std::int64_t> xs, ys;
+  xs.reserve(points_.size());
+  ys.reserve(points_.size());
+  if (integral_points_) {
+    for (const auto &p : *integral_points_) {
+      xs.push_back(p.x());
+      ys.push_back(p.y());
+    }
+    return {std::move(xs), std::move(ys)};
+  }
+  const auto to_integer = [](const Kernel::FT &value) {
+    auto [lo, hi] = CGAL::to_interval(value);
+    if (lo != hi) {
+      // Computing the exact value tightens the interval to the closest doubles.
+      CGAL::exact(value);
+      std::tie(lo, hi) = CGAL::to_interval(value);
+    }
+    if (lo != hi || std::floor(lo) != lo ||
+        std::abs(lo) > static_cast<double>(kMaxExactDouble)) {
+      throw std::invalid_argument(
+          "Point coordinates must be integers of at most 2^53 in absolute "
+          "value.");
+    }
+    return static_cast<std::int64_t>(lo);
+  };
+  for (const auto &p : points_) {
+    xs.push_back(to_integer(p.x()));
+    ys.push_back(to_integer(p.y()));
+  }
+  return {std::move(xs), std::move(ys)};
+}
+
+const PointIndex &PointSet::point_index() const {
+  std::call_once(point_index_once_, [this] {
+    point_index_ = std::make_unique<PointIndex>(points_, integral_points_);
+  });
+  return *point_index_;
+}
+
+const std::vector<int> &PointSet::hull() const {
+  compute_hull();
+  return hull_;
+}
+
+bool PointSet::is_collinear() const {
+  compute_hull();
+  return collinear_;
+}
+
+void PointSet::compute_hull() const {
+  std::call_once(hull_once_, [this] {
+    hull_ = integral_points_
+                ? hull_with_collinear_points(*integral_points_, collinear_)
+                : hull_with_collinear_points(points_, collinear_);
+  });
+}
+
+} // namespace cgshop2026
@@ -0,0 +1,143 @@
+#pragma once
+
+#include "cgal_types.h"
+#include "cgal_utils.h"
+#include "integral_points.h"
+#include <cstddef>
+#include <cstdint>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <optional>
+#include <utility>
+#include <vector>
+
+namespace cgshop2026 {
+
+/**
+ * Maps points back to their indices. If all points are integral, lookups hash
+ * native integer coordinates instead of comparing exact kernel numbers.
+ * For duplicate points, the first index is kept.
+ */
+class PointIndex {
+public:
+  explicit PointIndex(const std::vector<Point> &points);
+
+  /**
+   * Build the index from points whose integral coordinates are already known
+   * (see to_integral_points).
+   */
+  PointIndex(const std::vector<Point> &points,
+             const std::optional<std::vector<IntegralPoint>> &integral_points);
+
+  /**
+   * Look up the index of a point.
+   * Returns empty optional if the point is not part of the point set.
+   */
+  [[nodiscard]] std::optional<int> find(const Point &p) const;
+
+  /**
+   * The index of the first point that duplicates an earlier one, or -1.
+   */
+  [[nodiscard]] int first_duplicate() const { return first_duplicate_; }
+
+private:
+  std::optional<IntegralPointIndexMap> integral_;
+  std::map<Point, int, LessPointXY> exact_;
+  int first_duplicate_ = -1;
+};
+
+/**
+ * @brief An immutable point set shared by the geometry functions.
+ *
+ * Stores the exact kernel points and, if all coordinates are integral and
+ * small enough (see kMaxIntegralCoordinate), their native integer coordinates
+ * for the integer predicates. Building it from coordinate arrays avoids one
+ * Python object per point.
+ *
+ * The point index and the convex hull only depend on the points, so they are
+ * computed on first use and then shared by all triangulations of the point
+ * set. The lazy initialization is thread-safe.
+ */
+class PointSet {
+public:
+  /**
+   * @brief Build the point set from kernel points.
+   */
+  explicit PointSet(std::vector<Point> points);
+
+  /**
+   * @brief Build the point set from `count` integer coordinates.
+   * @throws std::invalid_argument if a coordinate exceeds 2^53 in absolute
+   * value.
+   */
+  PointSet(const std::int64_t *xs, const std::int64_t *ys, std::size_t count);
+
+  [[nodiscard]] std::size_t size() const { return points_.size(); }
+
+  [[nodiscard]] const Point &operator[](std::size_t i) const {
+    return points_[i];
+  }
+
+  /**
+   * @brief The exact kernel points.
+   */
+  [[nodiscard]] const std::vector<Point> &points() const { return points_; }
+
+  /**
+   * @brief Native integer coordinates, if all points are (small) integral.
+   */
+  [[nodiscard]] const std::optional<std::vector<IntegralPoint>> &
+  integral_points() const {
+    return integral_points_;
+  }
+
+  /**
+   * @brief Maps points to their indices (computed on first use).
+   */
+  [[nodiscard]] const PointIndex &point_index() const;
+
+  /**
+   * @brief The x- and y-coordinates of all points as native integers, e.g.,
+   * for serialization (the inverse of the array constructor).
+   * @throws std::invalid_argument if a coordinate is not an integer of at most
+   * 2^53 in absolute value.
+   */
+  [[nodiscard]] std::pair<std::vector<std::int64_t>, std::vector<std::int64_t>>
+  integer_coordinates() const;
+
+  /**
+   * @brief The index of the first point that duplicates an earlier one, or -1.
+   */
+  [[nodiscard]] int first_duplicate() const {
+    return point_index().first_duplicate();
+  }
+
+  /**
+   * @brief The indices of the points on the boundary of the convex hull in
+   * counter-clockwise order, including the points in the interior of hull
+   * edges (computed on first use). Duplicate points appear only once. If all
+   * points are collinear, these are the (at most two) extreme points.
+   */
+  [[nodiscard]] const std::vector<int> &hull() const;
+
+  /**
+   * @brief Check if all points are collinear (or there are fewer than three
+   * distinct points), i.e., the convex hull has no interior.
+   */
+  [[nodiscard]] bool is_collinear() const;
+
+private:
+  void compute_hull() const;
+
+  std::vector<Point> points_;
+  std::optional<std::vector<IntegralPoint>> integral_points_;
+
+  mutable std::once_flag point_index_once_;
+  mutable std::unique_ptr<PointIndex> point_index_;
+  mutable std::once_flag hull_once_;
+  mutable std::vector<int> hull_;
+  mutable bool collinear_ = false;
+};
+
+} // namespace cgshop2026
@@ -0,0 +1,164 @@
+#pragma once
+
+#include "cgal_types.h"
+#include "integral_points.h"
+#include <cstdint>
+
+namespace cgshop2026 {
+
+// ============================================================================
+// Integer-exact predicates
+// ============================================================================
+//
+// All coordinates must lie within [-kMaxIntegralCoordinate,
+// kMaxIntegralCoordinate]. Coordinate differences then need at most 31 bits,
+// orientation determinants at most 62 bits, and incircle determinants at most
+// 125 bits, so the results below are exact.
+
+namespace detail {
+
+template <typename T> CGAL::Sign sign_of(const T &value) {
+  return value > 0 ? CGAL::POSITIVE : (value < 0 ? CGAL::NEGATIVE : CGAL::ZERO);
+}
+
+} // namespace detail
+
+/**
+ * @brief Orientation of the triangle (p, q, r) using int64 arithmetic.
+ */
+inline CGAL::Orientation orientation(const IntegralPoint &p,
+                                     const IntegralPoint &q,
+                                     const IntegralPoint &r) {
+  const std::int64_t qx = q.x() - p.x(), qy = q.y() - p.y();
+  const std::int64_t rx = r.x() - p.x(), ry = r.y() - p.y();
+  return detail::sign_of(qx * ry - qy * rx);
+}
+
+/**
+ * @brief Check if the segments (a, b) and (c, d) cross properly, i.e., they
+ * intersect in a single point that is not an endpoint of either segment.
+ */
+inline bool do_cross(const IntegralPoint &a, const IntegralPoint &b,
+                     const IntegralPoint &c, const IntegralPoint &d) {
+  return orientation(a, b, c) * orientation(a, b, d) < 0 &&
+         orientation(c, d, a) * orientation(c, d, b) < 0;
+}
+
+#if defined(__SIZEOF_INT128__)
+#define CGSHOP2026_HAS_INT128 1
+/**
+ * @brief Side of the oriented circle through (p, q, r) on which t lies, using
+ * int128 arithmetic. ON_POSITIVE_SIDE means inside if (p, q, r) is
+ * counter-clockwise.
+ */
+inline CGAL::Oriented_side side_of_oriented_circle(const IntegralPoint &p,
+                                                   const IntegralPoint &q,
+                                                   const IntegralPoint &r,
+                                                   const IntegralPoint &t) {
+  using Int128 = __int128;
+  const std::int64_t px = p.x() - t.x(), py = p.y() - t.y();
+  const std::int64_t qx = q.x() - t.x(), qy = q.y() - t.y();
+  const std::int64_t rx = r.x() - t.x(), ry = r.y() - t.y();
+  const Int128 p_lift = Int128(px) * px + Int128(py) * py;
+  const Int128 q_lift = Int128(qx) * qx + Int128(qy) * qy;
+  const Int128 r_lift = Int128(rx) * rx + Int128(ry) * ry;
+  const Int128 det = p_lift * (Int128(qx) * ry - Int128(qy) * rx) -
+                     q_lift * (Int128(px) * ry - Int128(py) * rx) +
+                     r_lift * (Int128(px) * qy - Int128(py) * qx);
+  return detail::sign_of(det);
+}
+
+/**
+ * @brief Check if the edge (a, b) between the triangles (a, b, c) and
+ * (a, b, d) is illegal, i.e., d lies strictly inside the circumcircle of
+ * (a, b, c). Cocircular points do not violate the Delaunay property.
+ */
+inline bool violates_local_delaunay(const IntegralPoint &a,
+                                    const IntegralPoint &b,
+                                    const IntegralPoint &c,
+                                    const IntegralPoint &d) {
+  switch (orientation(a, b, c)) {
+  case CGAL::LEFT_TURN:
+    return side_of_oriented_circle(a, b, c, d) == CGAL::ON_POSITIVE_SIDE;
+  case CGAL::RIGHT_TURN:
+    return side_of_oriented_circle(b, a, c, d) == CGAL::ON_POSITIVE_SIDE;
+  default:
+    return false;
+  }
+}
+#endif
+
+// ============================================================================
+// Exact predicates on kernel points
+// ============================================================================
+//
+// These use the integer predicates above if all involved points are
+// (provably) integral and fall back to the Epeck kernel otherwise.
+
+/**
+ * @brief Exact orientation of the triangle (p, q, r).
+ */
+inline CGAL::Orientation exact_orientation(const Point &p, const Point &q,
+                                           const Point &r) {
+  const auto ip = IntegralPoint::try_from(p);
+  const auto iq = IntegralPoint::try_from(q);
+  const auto ir = IntegralPoint::try_from(r);
+  if (ip && iq && ir) {
+    return orientation(*ip, *iq, *ir);
+  }
+  return CGAL::orientation(p, q, r);
+}
+
+/**
+ * @brief Exact check if the segments (a, b) and (c, d) cross properly.
+ */
+inline bool exact_do_cross(const Point &a, const Point &b, const Point &c,
+                           const Point &d) {
+  const auto ia = IntegralPoint::try_from(a);
+  const auto ib = IntegralPoint::try_from(b);
+  const auto ic = IntegralPoint::try_from(c);
+  const auto id = IntegralPoint::try_from(d);
+  if (ia && ib && ic && id) {
+    return do_cross(*ia, *ib, *ic, *id);
+  }
+  return CGAL::orientation(a, b, c) * CGAL::orientation(a, b, d) < 0 &&
+         CGAL::orientation(c, d, a) * CGAL::orientation(c, d, b) < 0;
+}
+
+/**
+ * @brief Exact side of the oriented circle through (p, q, r) on which t lies.
+ */
+inline CGAL::Oriented_side exact_side_of_oriented_circle(const Point &p,
+                                                         const Point &q,
+                                                         const Point &r,
+                                                         const Point &t) {
+#if defined(CGSHOP2026_HAS_INT128)
+  const auto ip = IntegralPoint::try_from(p);
+  const auto iq = IntegralPoint::try_from(q);
+  const auto ir = IntegralPoint::try_from(r);
+  const auto it = IntegralPoint::try_from(t);
+  if (ip && iq && ir && it) {
+    return side_of_oriented_circle(*ip, *iq, *ir, *it);
+  }
+#endif
+  return CGAL::side_of_oriented_circle(p, q, r, t);
+}
+
+/**
+ * @brief Exact check if the edge (a, b) between the triangles (a, b, c) and
+ * (a, b, d) is illegal, i.e., d lies strictly inside the circumcircle of
+ * (a, b, c). Cocircular points do not violate the Delaunay property.
+ */
+inline bool exact_violates_local_delaunay(const Point &a, const Point &b,
+                                          const Point &c, const Point &d) {
+  switch (exact_orientation(a, b, c)) {
+  case CGAL::LEFT_TURN:
+    return exact_side_of_oriented_circle(a, b, c, d) == CGAL::ON_POSITIVE_SIDE;
+  case CGAL::RIGHT_TURN:
+    return exact_side_of_oriented_circle(b, a, c, d) == CGAL::ON_POSITIVE_SIDE;
+  default:
+    return false;
+  }
+}
+
+} // namespace cgshop2026
@@ -1,6 +1,5 @@
 #include "triangulation_validation.h"
 #include "cgal_utils.h"
-#include <CGAL/convex_hull_2.h>
 #include <fmt/core.h>
 
 namespace cgshop2026 {
@@ -29,20 +28,16 @@ static void print_original_points(const std::vector<Point> &points) {
 // Main validation functions
 // ============================================================================
 
-std::optional<std::map<Point, int, LessPointXY>>
-build_point_index_map(const std::vector<Point> &points, bool verbose) {
-  std::map<Point, int, LessPointXY> idx_of;
-
-  for (int i = 0; i < static_cast<int>(points.size()); ++i) {
-    auto [iter, inserted] = idx_of.emplace(points[i], i);
-    if (!inserted) {
-      if (verbose)
-        fmt::print("ERROR: Duplicate point found at index {}: {}\n", i,
-                   point_to_string(points[i]));
-      return std::nullopt;
-    }
+const PointIndex *build_point_index_map(const PointSet &points, bool verbose) {
+  const PointIndex &idx_of = points.point_index();
+  const int duplicate = idx_of.first_duplicate();
+  if (duplicate >= 0) {
+    if (verbose)
+      fmt::print("ERROR: Duplicate point found at index {}: {}\n", duplicate,
+                 point_to_string(points[duplicate]));
+    return nullptr;
   }
-  return idx_of;
+  return &idx_of;
 }
 
 bool insert_edges_into_arrangement(
@@ -87,14 +82,12 @@ bool insert_edges_into_arrangement(
   return true;
 }
 
-void add_convex_hull_to_arrangement(const std::vector<Point> &points,
+void add_convex_hull_to_arrangement(const PointSet &points,
                                     Arrangement_2 &arrangement,
                                     PointLocation &point_location,
                                     bool verbose) {
 
-  std::vector<Point> hull;
-  hull.reserve(points.size()); // Reserve to avoid reallocations
-  CGAL::convex_hull_2(points.begin(), points.end(), std::back_inserter(hull));
+  const std::vector<int> &hull = points.hull();
 
   if (verbose)
     fmt::print(
@@ -103,8 +96,8 @@ void add_convex_hull_to_arrangement(const std::vector<Point> &points,
 
   const size_t hull_size = hull.size();
   for (size_t k = 0; k < hull_size; ++k) {
-    const Point &p1 = hull[k];
-    const Point &p2 = hull[(k + 1) % hull_size];
+    const Point &p1 = points[hull[k]];
+    const Point &p2 = points[hull[(k + 1) % hull_size]];
     const Segment2 hull_edge(p1, p2);
 
     if (verbose)
@@ -151,8 +144,7 @@ bool validate_vertex_count(const Arrangement_2 &arrangement,
 }
 
 bool validate_all_faces_triangular(
-    const Arrangement_2 &arrangement,
-    const std::map<Point, int, LessPointXY> &idx_of,
+    const Arrangement_2 &arrangement, const PointIndex &idx_of,
     std::unordered_set<std::tuple<int, int>, TupleHash> &edges_in_arrangement,
     bool verbose) {
 
@@ -185,15 +177,15 @@ bool validate_all_faces_triangular(
       face_vertices.push_back(p);
 
       // Look up vertex index
-      auto it = idx_of.find(p);
-      if (it == idx_of.end()) {
+      const auto idx = idx_of.find(p);
+      if (!idx) {
         if (verbose)
           fmt::print(
               "ERROR: Face vertex {} not found in original points list.\n",
               point_to_string(p));
         return false;
       }
-      vertex_indices.push_back(it->second);
+      vertex_indices.push_back(*idx);
 
       e = e->next();
     } while (e != start);
@@ -2,22 +2,20 @@
 
 #include "cgal_types.h"
 #include "cgal_utils.h"
-#include <map>
 #include <optional>
 #include <tuple>
 #include <unordered_set>
 #include <vector>
 
-#include "integral_points.h"
+#include "point_set.h"
 
 namespace cgshop2026 {
 
 /**
- * Build a point-to-index mapping and check for duplicate points.
- * Returns empty optional if duplicates are found.
+ * Get the point-to-index mapping of the point set and check for duplicate
+ * points. Returns nullptr if duplicates are found.
  */
-std::optional<std::map<Point, int, LessPointXY>>
-build_point_index_map(const std::vector<Point> &points, bool verbose);
+const PointIndex *build_point_index_map(const PointSet &points, bool verbose);
 
 /**
  * Insert edges into the arrangement and validate each insertion.
@@ -29,8 +27,9 @@ bool insert_edges_into_arrangement(
 
 /**
  * Add convex hull edges to the arrangement if not already present.
+ * Uses the convex hull cached by the point set.
  */
-void add_convex_hull_to_arrangement(const std::vector<Point> &points,
+void add_convex_hull_to_arrangement(const PointSet &points,
                                     Arrangement_2 &arrangement,
                                     PointLocation &point_location,
                                     bool verbose);
@@ -48,8 +47,7 @@ bool validate_vertex_count(const Arrangement_2 &arrangement,
  * Collects all edges from triangular faces for later validation.
  */
 bool validate_all_faces_triangular(
-    const Arrangement_2 &arrangement,
-    const std::map<Point, int, LessPointXY> &idx_of,
+    const Arrangement_2 &arrangement, const PointIndex &idx_of,
     std::unordered_set<std::tuple<int, int>, TupleHash> &edges_in_arrangement,
     bool verbose);
 
@@ -0,0 +1,24 @@
+from .bounds import FlipDistanceBound, flip_distance_bound, instance_lower_bound
+from .delaunay import flip_to_delaunay, is_delaunay
+from .target import (
+    TargetCandidate,
+    candidate_targets,
+    edge_frequencies,
+    estimate_cost,
+    flip_to_target,
+    median_triangulation,
+)
+
+__all__ = [
+    "flip_to_delaunay",
+    "is_delaunay",
+    "TargetCandidate",
+    "candidate_targets",
+    "edge_frequencies",
+    "estimate_cost",
+    "flip_to_target",
+    "median_triangulation",
+    "FlipDistanceBound",
+    "flip_distance_bound",
+    "instance_lower_bound",
+]
@@ -0,0 +1,88 @@
+"""
+Lower bounds on the number of parallel flip rounds.
+
+Every edge of the start that is not in the target has to be flipped at least once,
+and a round flips at most one edge per pair of triangles. Moreover, the edges crossed
+by a target edge form a path of consecutive triangles, and flips of a round must not
+share a triangle, so a round removes at most every other of them: an edge crossed by c
+edges needs at least c.bit_length() rounds. Reversing the rounds swaps start and
+target, so both directions are valid.
+
+For a whole instance, the target is unknown. Flipping a triangulation to the target
+and back from the target to another one is a valid sequence, so the distances to any
+target sum to at least the distance bound of every matching of the triangulations.
+"""
+
+import itertools
+from collections.abc import Sequence
+from typing import NamedTuple
+
+from ..geometry import FlippableTriangulation
+from .target import _engine
+
+
+class FlipDistanceBound(NamedTuple):
+    """
+    Lower bounds for flipping one triangulation to another: the number of flips (the
+    edges of the start that are not in the target), the number of parallel rounds, and
+    the maximum number of edges of one triangulation crossed by an edge of the other.
+    """
+
+    flips: int
+    rounds: int
+    max_crossings: int
+
+
+def flip_distance_bound(
+    start: FlippableTriangulation, target: FlippableTriangulation
+) -> FlipDistanceBound:
+    """
+    Computes lower bounds for flipping start to target (or target to start). The
+    crossings are counted by walking along the edges of the symmetric difference, which
+    takes time linear in the number of crossings.
+
+    Args:
+        start: A triangulation without pending flips.
+        target: A triangulation of the same points.
+    """
+    start_edges = set(start._flip_map.edges)
+    target_edges = set(target._flip_map.edges)
+    removed = sorted(start_edges - target_edges)
+    added = sorted(target_edges - start_edges)
+    max_crossings = max(
+        max(_engine(start).count_crossings(added), default=0),
+        max(_engine(target).count_crossings(removed), default=0),
+    )
+    # By Euler's formula, a triangulation with n points and m edges has m - n + 1
+    # triangles.
+    triangles = len(start_edges) - len(start._flip_map.points) + 1
+    per_round = max(triangles // 2, 1)
+    rounds = max(-(-len(removed) // per_round), max_crossings.bit_length())
+    return FlipDistanceBound(len(removed), rounds, max_crossings)
+
+
+def instance_lower_bound(triangulations: Sequence[FlippableTriangulation]) -> int:
+    """
+    Computes a lower bound on the objective of the instance, i.e., the total number of
+    rounds to flip all triangulations to any common target. Bounds the distance of
+    every pair, which takes quadratic time in the number of triangulations, and takes
+    the larger of a greedy maximum matching and the average over all pairs.
+
+    Args:
+        triangulations: The triangulations of one point set, without pending flips.
+    """
+    count = len(triangulations)
+    distances = {
+        (i, j): flip_distance_bound(triangulations[i], triangulations[j]).rounds
+        for i, j in itertools.combinations(range(count), 2)
+    }
+    matched: set[int] = set()
+    matching = 0
+    for (i, j), rounds in sorted(distances.items(), key=lambda item: -item[1]):
+        if i not in matched and j not in matched:
+            matched.update((i, j))
+            matching += rounds
+    # Every triangulation is part of count - 1 pairs, and the distance of a pair is
+    # at most the sum of the distances of its triangulations to the target.
+    average = -(-sum(distances.values()) // (count - 1)) if count > 1 else 0
+    return max(matching, average)
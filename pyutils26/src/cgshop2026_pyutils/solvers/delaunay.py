@@ -0,0 +1,78 @@
+"""
+Flipping triangulations to the Delaunay triangulation.
+
+An edge is illegal if the opposite vertex of one of its triangles lies inside the
+circumcircle of the other one (see `violates_local_delaunay`). Flipping illegal edges
+until none is left (Lawson's algorithm) ends in the Delaunay triangulation. Whether an
+edge is illegal only depends on its two triangles, so after a flip only the new edge and
+the four boundary edges of the flipped quadrilateral have to be checked again.
+"""
+
+from ..geometry import FlippableTriangulation, PointSet, illegal_edges
+from ..geometry.typing import Edge
+
+
+def _point_set(triangulation: FlippableTriangulation) -> PointSet:
+    """The points of the triangulation as a PointSet, converted if necessary."""
+    points = triangulation._flip_map.points
+    return points if isinstance(points, PointSet) else PointSet(points)
+
+
+def _illegal(
+    triangulation: FlippableTriangulation, points: PointSet, edges: list[Edge]
+) -> list[Edge]:
+    """The flippable edges among the given edges that are illegal."""
+    flippable = [e for e in edges if triangulation._flip_map.is_flippable(e)]
+    partners = [triangulation.get_flip_partner(e) for e in flippable]
+    return illegal_edges(points, flippable, partners)
+
+
+def is_delaunay(triangulation: FlippableTriangulation) -> bool:
+    """Whether no edge of the triangulation is illegal. Takes linear time."""
+    flippable = triangulation._flip_map.flippable_edges()
+    return not _illegal(triangulation, _point_set(triangulation), flippable)
+
+
+def flip_to_delaunay(triangulation: FlippableTriangulation) -> list[list[Edge]]:
+    """
+    Flips the triangulation to the Delaunay triangulation in parallel rounds.
+    Every round flips the illegal edges of a worklist, newest first, skipping edges
+    that conflict with an earlier flip of the round. Only the edges around the flipped
+    quadrilaterals are re-examined after a round, so a round costs time proportional
+    to the number of flips and the size of the worklist instead of the number of edges.
+
+    Args:
+        triangulation: The triangulation to flip, which must not have pending flips.
+            It is modified in place.
+
+    Returns:
+        The flipped edges of every round, in the format of a solution.
+
+    Raises:
+        RuntimeError: If a round flips no edge although illegal edges are left, which
+            means that the flip map is inconsistent.
+    """
+    points = _point_set(triangulation)
+    # Illegal edges in insertion order; an edge stays until it is flipped or legal.
+    worklist = dict.fromkeys(
+        _illegal(triangulation, points, triangulation.possible_flips())
+    )
+    rounds: list[list[Edge]] = []
+    while worklist:
+        checkpoint = triangulation.checkpoint()
+        # Edges that became illegal in the last round come first, which keeps the
+        # flips close to the previous ones and needed fewer rounds than FIFO order.
+        # apply_parallel_flips copies the edges, so this takes O(|worklist|) time.
+        flips = triangulation.apply_parallel_flips(reversed(worklist), mode="greedy")
+        if not flips:
+            # Illegal edges are flippable, and the first one never conflicts.
+            raise RuntimeError("No edge of the worklist could be flipped.")
+        batch = [edge for edge, _ in flips]
+        rounds.append(batch)
+        for edge in batch:
+            del worklist[edge]
+        changed = triangulation.changed_since(checkpoint)
+        for edge in changed:
+            worklist.pop(edge, None)
+        worklist.update(dict.fromkeys(_illegal(triangulation, points, sorted(changed))))
+    return rounds
@@ -0,0 +1,208 @@
+"""
+Choosing and reaching a common target triangulation.
+
+All triangulations of an instance have to be flipped to the same triangulation, and the
+objective is the total number of parallel rounds, so the choice of the target matters.
+Candidate targets are the Delaunay triangulation, the input triangulations, and "median"
+triangulations that contain edges shared by many inputs. Candidates are ranked by a
+cheap estimate, and the most promising ones can then be solved with flip_to_target().
+
+flip_to_target() only performs flips that reduce the number of crossings with the
+target. Such a flip exists as long as the target is not reached (Hanke, Ottmann and
+Schuierer, "The edge-flipping distance of triangulations", 1996), so the number of
+flips is at most the number of crossings between the two triangulations.
+"""
+
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from typing import NamedTuple
+
+from ..geometry import FlipEngine, FlippableTriangulation
+from ..geometry.flip_partner_map import normalize_edge
+from ..geometry.typing import Edge
+from .delaunay import _point_set, flip_to_delaunay, is_delaunay
+
+
+class TargetCandidate(NamedTuple):
+    """A candidate target triangulation and its estimated cost (see estimate_cost())."""
+
+    name: str
+    target: FlippableTriangulation
+    estimate: int
+
+
+def edge_frequencies(triangulations: Sequence[FlippableTriangulation]) -> Counter[Edge]:
+    """Counts in how many of the triangulations every edge occurs."""
+    frequencies: Counter[Edge] = Counter()
+    for triangulation in triangulations:
+        frequencies.update(triangulation._flip_map.edges)
+    return frequencies
+
+
+def estimate_cost(
+    target: FlippableTriangulation, frequencies: Mapping[Edge, int], count: int
+) -> int:
+    """
+    Estimates the cost of flipping `count` triangulations with the given edge
+    frequencies to the target: the total number of their edges that are not in the
+    target, which is a lower bound on the number of flips. Takes linear time.
+    """
+    edges = target._flip_map.edges
+    return count * len(edges) - sum(frequencies.get(e, 0) for e in edges)
+
+
+def median_triangulation(
+    start: FlippableTriangulation, frequencies: Mapping[Edge, int]
+) -> FlippableTriangulation:
+    """
+    Returns a copy of start in which edges are flipped as long as the new edge occurs
+    in more triangulations than the old one, largest gain first. The result is a local
+    minimum of estimate_cost().
+    """
+    median = start.fork()
+    while True:
+        gains: dict[Edge, int] = {}
+        for edge in median.possible_flips():
+            partner = normalize_edge(*median.get_flip_partner(edge))
+            gain = frequencies.get(partner, 0) - frequencies.get(edge, 0)
+            if gain > 0:
+                gains[edge] = gain
+        if not gains:
+            return median
+        order = sorted(gains, key=gains.__getitem__, reverse=True)
+        median.apply_parallel_flips(order, mode="greedy")
+
+
+def candidate_targets(
+    triangulations: Sequence[FlippableTriangulation],
+) -> list[TargetCandidate]:
+    """
+    Generates candidate targets for the triangulations, sorted by estimate_cost(): the
+    Delaunay triangulation ("delaunay"), every input ("input i"), and the median
+    triangulations grown from the Delaunay triangulation ("median") and from the input
+    with the lowest estimate ("median from input i").
+
+    Args:
+        triangulations: The triangulations of one point set, without pending flips.
+    """
+    frequencies = edge_frequencies(triangulations)
+    count = len(triangulations)
+    delaunay = triangulations[0].fork()
+    flip_to_delaunay(delaunay)
+    targets = {"delaunay": delaunay}
+    targets.update((f"input {i}", t.fork()) for i, t in enumerate(triangulations))
+    targets["median"] = median_triangulation(delaunay, frequencies)
+    best = min(
+        range(count),
+        key=lambda i: estimate_cost(triangulations[i], frequencies, count),
+    )
+    targets[f"median from input {best}"] = median_triangulation(
+        triangulations[best], frequencies
+    )
+    candidates = [
+        TargetCandidate(name, target, estimate_cost(target, frequencies, count))
+        for name, target in targets.items()
+    ]
+    return sorted(candidates, key=lambda candidate: candidate.estimate)
+
+
+def _engine(triangulation: FlippableTriangulation) -> FlipEngine:
+    """The native engine of the triangulation, built if it runs on the Python backend."""
+    if isinstance(triangulation._flip_map, FlipEngine):
+        return triangulation._flip_map
+    return FlipEngine.build(
+        _point_set(triangulation), list(triangulation._flip_map.edges)
+    )
+
+
+def _rounds_from_delaunay(target: FlippableTriangulation) -> list[list[Edge]]:
+    """The rounds that flip the Delaunay triangulation reached from target back to it."""
+    delaunay = target.fork()
+    rounds = flip_to_delaunay(delaunay)
+    replay = target.fork()
+    reverse = [
+        [new_edge for _, new_edge in replay.apply_parallel_flips(batch, mode="strict")]
+        for batch in rounds
+    ]
+    return reverse[::-1]
+
+
+def flip_to_target(
+    triangulation: FlippableTriangulation,
+    target: FlippableTriangulation,
+    target_is_delaunay: bool | None = None,
+) -> list[list[Edge]]:
+    """
+    Flips the triangulation to the target in parallel rounds. If the target is a
+    Delaunay triangulation, flip_to_delaunay() does most of the work. Then every round
+    performs non-conflicting flips that reduce the number of crossings with the target,
+    largest reduction first. As in flip_to_delaunay(), only the edges around the flips
+    of a round are re-examined. Should no such flip exist (which the crossing argument
+    rules out for points in general position), the remaining flips go through the
+    Delaunay triangulation.
+
+    Args:
+        triangulation: The triangulation to flip, which must not have pending flips.
+            It is modified in place.
+        target: A triangulation of the same points. It is not modified, so one target
+            can be shared by many calls.
+        target_is_delaunay: Whether the target is a Delaunay triangulation, see
+            is_delaunay(). Computed if not given, which takes linear time; pass it
+            when flipping many triangulations to the same target.
+
+    Returns:
+        The flipped edges of every round, in the format of a solution.
+
+    Raises:
+        RuntimeError: If the target cannot be reached, which requires a point set with
+            several Delaunay triangulations.
+    """
+    target_edges = set(target._flip_map.edges)
+    rounds: list[list[Edge]] = []
+    if target_is_delaunay is None:
+        target_is_delaunay = is_delaunay(target)
+    if target_is_delaunay:
+        rounds += flip_to_delaunay(triangulation)
+    engine = _engine(target)
+    crossings: dict[Edge, int] = {}
+
+    def gains(edges: Iterable[Edge]) -> dict[Edge, int]:
+        flippable = [
+            e
+            for e in edges
+            if e not in target_edges and triangulation._flip_map.is_flippable(e)
+        ]
+        partners = [
+            normalize_edge(*triangulation.get_flip_partner(e)) for e in flippable
+        ]
+        missing = [e for e in dict.fromkeys(flippable + partners) if e not in crossings]
+        crossings.update(zip(missing, engine.count_crossings(missing)))
+        result = {}
+        for edge, partner in zip(flippable, partners):
+            gain = crossings[edge] - crossings[partner]
+            if gain > 0:
+                result[edge] = gain
+        return result
+
+    worklist = gains(triangulation.possible_flips())
+    while worklist:
+        checkpoint = triangulation.checkpoint()
+        order = sorted(worklist, key=worklist.__getitem__, reverse=True)
+        flips = triangulation.apply_parallel_flips(order, mode="greedy")
+        rounds.append([edge for edge, _ in flips])
+        for edge, _ in flips:
+            del worklist[edge]
+        changed = triangulation.changed_since(checkpoint)
+        for edge in changed:
+            worklist.pop(edge, None)
+        worklist.update(gains(sorted(changed)))
+    if triangulation._flip_map.edges != target_edges:
+        rounds += flip_to_delaunay(triangulation)
+        for batch in _rounds_from_delaunay(target):
+            if not all(triangulation._flip_map.is_flippable(e) for e in batch):
+                raise RuntimeError("The target triangulation cannot be reached.")
+            triangulation.apply_parallel_flips(batch, mode="strict")
+            rounds.append(batch)
+        if triangulation._flip_map.edges != target_edges:
+            raise RuntimeError("The target triangulation cannot be reached.")
+    return rounds
@@ -1,5 +1,35 @@
 from .schemas import CGSHOP2026Instance, CGSHOP2026Solution
-from .geometry import FlippableTriangulation, Point
+from .geometry import FlipPartnerMap, FlippableTriangulation, PointSet, is_triangulation
+
+
+def _audit(points: PointSet, tri: FlippableTriangulation) -> str | None:
+    """
+    Validates the whole triangulation and compares its flippable edges with a full recompute.
+    Returns an error message if the audit fails.
+    """
+    edges = tri.get_edges()
+    if not is_triangulation(points, edges):
+        return "Audit failed: the edges no longer form a triangulation."
+    fresh = FlipPartnerMap.build(points, edges)
+    if set(fresh.flippable_edges()) != set(tri._flip_map.flippable_edges()):
+        return "Audit failed: the flippable edges differ from a full recompute."
+    return None
+
+
+def _flip_error(
+    tri: FlippableTriangulation, parallel_flips: list[tuple[int, int]], error: str
+) -> str:
+    """
+    Returns the message for a rejected set of parallel flips. The set is replayed edge by
+    edge on a copy, so the first failing edge is reported like a sequence of add_flip calls.
+    """
+    replay = tri.fork()
+    for edge in parallel_flips:
+        try:
+            replay.add_flip(edge)
+        except ValueError as e:
+            return f"Error when flipping edge {edge} in triangulation: {e}"
+    return f"Error when flipping edges in triangulation: {error}"
 
 
 def check_for_errors(
@@ -7,13 +37,29 @@ def check_for_errors(
     solution: CGSHOP2026Solution,
     full_recompute: bool = False,
     verbose: bool = False,
+    incremental: bool = False,
+    audit_every: int = 0,
 ) -> list[str]:
     """
     Verifies the given solution against the provided instance and returns a list of error messages if any issues are found.
+
+    Args:
+        instance: The instance the solution belongs to.
+        solution: The solution to verify.
+        full_recompute: Rebuild all triangles after every set of parallel flips instead of
+            relying on the incremental updates of the flip map.
+        verbose: Print progress information.
+        incremental: Certify every committed flip by re-checking only its quadrilateral with
+            exact predicates (see `FlipEngine.certify_flips`). This gives the same guarantees
+            as `full_recompute` at a cost proportional to the number of flips. The flips are
+            applied on the native engine, which certifies each set of parallel flips in one call.
+        audit_every: In incremental mode, additionally validate the whole triangulation every
+            `audit_every` sets of parallel flips. 0 disables these audits.
     """
-    points = [Point(x, y) for x, y in zip(instance.points_x, instance.points_y)]
+    points = PointSet.from_instance(instance)
+    backend = "native" if incremental else "python"
     triangulations = [
-        FlippableTriangulation.from_points_edges(points, edges)
+        FlippableTriangulation.from_points_edges(points, edges, backend=backend)
         for edges in instance.triangulations
     ]
     for tri, flip_sequence in zip(triangulations, solution.flips):
@@ -21,15 +67,22 @@ def check_for_errors(
             print(
                 f"Verifying flips for triangulation with {len(tri.get_edges())} edges."
             )
-        for parallel_flips in flip_sequence:
-            for edge in parallel_flips:
-                try:
-                    tri.add_flip(edge)
-                except ValueError as e:
-                    return [f"Error when flipping edge {edge} in triangulation: {e}"]
-            tri.commit()
+        for step, parallel_flips in enumerate(flip_sequence, start=1):
+            try:
+                flips = tri.apply_parallel_flips(parallel_flips, mode="strict")
+            except ValueError as e:
+                # A rejected set leaves the triangulation unchanged.
+                return [_flip_error(tri, parallel_flips, str(e))]
             if full_recompute:
                 tri._flip_map._rebuild_flip_map()
+            if incremental:
+                try:
+                    tri._flip_map.certify_flips(flips)
+                except ValueError as e:
+                    return [str(e)]
+                if audit_every > 0 and step % audit_every == 0:
+                    if error := _audit(points, tri):
+                        return [f"{error} (after {step} parallel flip sets)"]
     if verbose:
         print("Final triangulations computed, checking for equality...")
     for i in range(1, len(triangulations)):
@@ -0,0 +1,26 @@
+"""Shared helpers for the geometry tests."""
+
+import random
+
+from cgshop2026_pyutils.geometry import Point
+from cgshop2026_pyutils.geometry.typing import Edge
+
+
+def grid_triangulation(
+    size: int, rng: random.Random | None = None
+) -> tuple[list[Point], list[Edge]]:
+    """
+    A size x size grid where every cell is split by a diagonal: a random one if rng
+    is given, else the ascending one. The diagonals come first, cell by cell.
+    """
+    points = [Point(i, j) for i in range(size) for j in range(size)]
+    edges = [
+        (i * size + j + 1, (i + 1) * size + j)
+        if rng is not None and rng.random() >= 0.5
+        else (i * size + j, (i + 1) * size + j + 1)
+        for i in range(size - 1)
+        for j in range(size - 1)
+    ]
+    edges += [(v, v + 1) for v in range(size * size) if (v + 1) % size]
+    edges += [(v, v + size) for v in range(size * (size - 1))]
+    return points, edges
@@ -0,0 +1,119 @@
+"""
+Unit tests for the batched predicates do_cross_many and flippable_mask.
+
+Tests verify that the batched queries agree with the scalar do_cross, that
+flippable_mask agrees with the native FlipEngine, and that malformed input is rejected.
+"""
+
+import random
+
+import numpy as np
+import pytest
+from cgshop2026_pyutils.geometry import (
+    FlipEngine,
+    FlipPartnerMap,
+    Point,
+    Segment,
+    do_cross,
+    do_cross_many,
+    flippable_mask,
+)
+
+
+class TestDoCrossMany:
+    """Test suite for do_cross_many."""
+
+    def test_square_diagonals(self):
+        """The diagonals of a square cross, its sides do not."""
+        points = [Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1)]
+        quads = np.array([[0, 2, 1, 3], [0, 1, 2, 3], [0, 2, 0, 1], [0, 1, 1, 2]])
+
+        result = do_cross_many(points, quads)
+
+        assert result.dtype == np.bool_
+        assert result.tolist() == [True, False, False, False]
+
+    def test_matches_do_cross(self):
+        """Random queries give the same result as the scalar predicate."""
+        rng = random.Random(0)
+        points = [Point(rng.randint(0, 20), rng.randint(0, 20)) for _ in range(30)]
+        quads = [[rng.randrange(len(points)) for _ in range(4)] for _ in range(500)]
+
+        result = do_cross_many(points, quads)
+
+        for (a, b, c, d), crossing in zip(quads, result):
+            expected = do_cross(
+                Segment(points[a], points[b]), Segment(points[c], points[d])
+            )
+            assert crossing == expected, f"Mismatch for quad {(a, b, c, d)}"
+
+    def test_few_queries_on_many_points(self):
+        """Small batches on large point sets give the same results."""
+        points = [Point(i, i * i % 101) for i in range(1000)]
+        points[1] = Point(10, 0)
+        points[2] = Point(0, 10)
+        points[3] = Point(10, 10)
+
+        assert do_cross_many(points, [[0, 3, 1, 2]]).tolist() == [True]
+
+    def test_non_integral_points(self):
+        """Non-integral coordinates are handled by the exact fallback."""
+        points = [Point(0, 0), Point(1, 1), Point(0.5, 0), Point(0.5, 1), Point(2, 2)]
+
+        result = do_cross_many(points, [[0, 1, 2, 3], [1, 4, 2, 3]])
+
+        assert result.tolist() == [True, False]
+
+    def test_empty(self):
+        """An empty batch gives an empty result."""
+        points = [Point(0, 0), Point(1, 0)]
+        result = do_cross_many(points, np.empty((0, 4), dtype=np.int64))
+        assert result.shape == (0,)
+
+    def test_invalid_shape(self):
+        points = [Point(0, 0), Point(1, 0), Point(1, 1)]
+        with pytest.raises(ValueError, match=r"shape \(k, 4\)"):
+            do_cross_many(points, [[0, 1, 2]])
+
+    def test_out_of_bounds(self):
+        points = [Point(0, 0), Point(1, 0), Point(1, 1)]
+        with pytest.raises(RuntimeError, match="out of bounds"):
+            do_cross_many(points, [[0, 1, 2, 3]])
+
+
+class TestFlippableMask:
+    """Test suite for flippable_mask."""
+
+    def test_matches_flip_partner_map(self):
+        """The mask marks exactly the flippable edges of the triangulation."""
+        points = [
+            Point(0, 0),
+            Point(4, 0),
+            Point(4, 4),
+            Point(0, 4),
+            Point(2, 1),
+            Point(1, 3),
+        ]
+        edges = [(0, 4), (1, 4), (4, 5), (0, 5), (3, 5), (2, 5), (2, 4)]
+        flip_map = FlipPartnerMap.build(points, edges)
+        inner = [e for e, tris in flip_map.edge_to_triangles.items() if len(tris) == 2]
+        opposite = [
+            tuple(v for tri in flip_map.edge_to_triangles[e] for v in tri if v not in e)
+            for e in inner
+        ]
+
+        mask = flippable_mask(points, inner, opposite)
+
+        flippable = {e for e, ok in zip(inner, mask) if ok}
+        assert flippable == set(FlipEngine.build(points, edges).flippable_edges())
+        assert flippable == set(flip_map.flippable_edges())
+
+    def test_mismatched_lengths(self):
+        points = [Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1)]
+        with pytest.raises(ValueError, match="same length"):
+            flippable_mask(points, [[0, 2]], [[1, 3], [1, 3]])
+
+    def test_invalid_shape(self):
+        points = [Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1)]
+        with pytest.raises(ValueError, match=r"shape \(k, 2\)"):
+            flippable_mask(points, [0, 2], [1, 3])
@@ -295,3 +295,46 @@ class TestComputeTriangles:
         # Each triangle should contain the internal point (index 3)
         for triangle in result:
             assert 3 in triangle, f"Triangle {triangle} should contain internal point"
+
+
+class TestComputeTrianglesFastPath:
+    """The triangles of valid triangulations are read off the sorted edges."""
+
+    def test_grid_matches_arrangement(self):
+        """Both paths give the same triangles on a grid with collinear hull points."""
+        size = 8
+        points = [Point(i, j) for i in range(size) for j in range(size)]
+        edges: list[Edge] = []
+        for i in range(size):
+            for j in range(size):
+                idx = i * size + j
+                if i + 1 < size:
+                    edges.append((idx, idx + size))
+                if j + 1 < size:
+                    edges.append((idx, idx + 1))
+                if i + 1 < size and j + 1 < size:
+                    if (i * j) % 3 == 0:
+                        edges.append((idx, idx + size + 1))
+                    else:
+                        edges.append((idx + 1, idx + size))
+
+        result = compute_triangles(points, edges)
+
+        assert len(result) == 2 * (size - 1) ** 2
+        assert result == compute_triangles(points, edges, use_arrangement=True)
+
+    def test_non_triangulation_falls_back(self):
+        """Inputs that are no triangulation are still handled by the arrangement."""
+        points = [Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2), Point(1, 1)]
+        # Edge (0, 2) passes through point 4 and is split there
+        edges = [(0, 2), (1, 4), (3, 4)]
+
+        result = compute_triangles(points, edges)
+
+        assert result == [(0, 1, 4), (0, 3, 4), (1, 2, 4), (2, 3, 4)]
+        assert result == compute_triangles(points, edges, use_arrangement=True)
+
+    def test_duplicate_points_fall_back(self):
+        """Duplicate points are resolved to the first index as before."""
+        points = [Point(0, 0), Point(1, 0), Point(0, 1), Point(0, 0)]
+        assert compute_triangles(points, [(0, 1), (1, 2), (0, 2)]) == [(0, 1, 2)]
@@ -0,0 +1,100 @@
+"""
+Unit tests for violates_local_delaunay and illegal_edges.
+
+Tests verify the exact incircle test for both orientations of the triangle,
+cocircular and non-integral points, and that the batched variant agrees with
+the scalar predicate.
+"""
+
+import math
+
+import pytest
+from cgshop2026_pyutils.geometry import (
+    FlipPartnerMap,
+    Point,
+    illegal_edges,
+    violates_local_delaunay,
+)
+
+
+class TestViolatesLocalDelaunay:
+    """Test suite for the violates_local_delaunay predicate."""
+
+    def test_point_inside_circumcircle(self):
+        """The long diagonal of a flat rhombus is illegal, the short one is not."""
+        a, b, c, d = Point(0, 0), Point(4, 0), Point(2, 1), Point(2, -1)
+        assert violates_local_delaunay(a, b, c, d)
+        assert not violates_local_delaunay(c, d, a, b)
+
+    def test_orientation_does_not_matter(self):
+        a, b, c, d = Point(0, 0), Point(4, 0), Point(2, 1), Point(2, -1)
+        assert violates_local_delaunay(b, a, c, d)
+        assert violates_local_delaunay(a, b, d, c)
+        assert violates_local_delaunay(b, a, d, c)
+
+    def test_cocircular_points_are_legal(self):
+        """Both diagonals of a square are Delaunay."""
+        a, b, c, d = Point(0, 0), Point(1, 1), Point(1, 0), Point(0, 1)
+        assert not violates_local_delaunay(a, b, c, d)
+        assert not violates_local_delaunay(c, d, a, b)
+
+    def test_degenerate_triangle(self):
+        """A collinear triangle has no circumcircle."""
+        assert not violates_local_delaunay(
+            Point(0, 0), Point(2, 0), Point(1, 0), Point(1, 1)
+        )
+
+    def test_non_integral_points(self):
+        a, b, c = Point(0, 0), Point(1, 0), Point(0.5, 0.5)
+        assert violates_local_delaunay(a, b, c, Point(0.5, -0.25))
+        assert not violates_local_delaunay(a, b, c, Point(0.5, -0.5))
+        assert not violates_local_delaunay(a, b, c, Point(0.5, -0.75))
+
+    def test_large_coordinates(self):
+        """Coordinates close to the integer limit are handled exactly."""
+        big = 2**28
+        a, b, c = Point(-big, 0), Point(big, 0), Point(0, big)
+        assert not violates_local_delaunay(a, b, c, Point(0, -big))
+        assert violates_local_delaunay(a, b, c, Point(0, -big + 1))
+
+
+class TestIllegalEdges:
+    """Test suite for the batched illegal_edges."""
+
+    def test_matches_scalar_predicate(self):
+        # A fan triangulation of a flat convex polygon
+        points = [
+            Point(
+                round(100 * math.cos(2 * math.pi * k / 12)),
+                round(40 * math.sin(2 * math.pi * k / 12)),
+            )
+            for k in range(12)
+        ]
+        edges = [(0, i) for i in range(2, len(points) - 1)]
+        flip_map = FlipPartnerMap.build(points, edges)
+        flippable = flip_map.flippable_edges()
+        partners = [flip_map.get_flip_partner(e) for e in flippable]
+
+        result = illegal_edges(points, flippable, partners)
+
+        expected = [
+            e
+            for e, (c, d) in zip(flippable, partners)
+            if violates_local_delaunay(points[e[0]], points[e[1]], points[c], points[d])
+        ]
+        assert result == expected
+        assert sorted(result) == [(0, 4), (0, 5), (0, 6), (0, 7), (0, 8)]
+
+    def test_empty(self):
+        points = [Point(0, 0), Point(1, 0), Point(0, 1)]
+        assert illegal_edges(points, [], []) == []
+
+    def test_mismatched_lengths(self):
+        points = [Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1)]
+        with pytest.raises(ValueError, match="same length"):
+            illegal_edges(points, [(0, 2)], [(1, 3), (1, 3)])
+
+    def test_out_of_bounds(self):
+        points = [Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1)]
+        with pytest.raises(RuntimeError, match="out of bounds"):
+            illegal_edges(points, [(0, 2)], [(1, 4)])
@@ -205,3 +205,31 @@ class TestDoCross:
         s2 = Segment(Point(1, 0), Point(1, 2))  # Vertical, crossing s1
 
         assert do_cross(s1, s2), "Perpendicular crossing segments should be detected"
+
+    def test_instance_sized_coordinates_touching(self):
+        """Test an endpoint exactly on a long segment with instance-sized coordinates."""
+        s1 = Segment(Point(0, 0), Point(1_000_000, 999_998))
+        s2 = Segment(Point(500_000, 499_999), Point(0, 1_000_000))  # Starts on s1
+        s3 = Segment(Point(500_000, 500_000), Point(500_001, 499_997))  # Barely crosses
+
+        assert not do_cross(s1, s2), "Touching segments should not cross"
+        assert do_cross(s1, s3), "Barely crossing segments should be detected"
+
+    def test_coordinates_beyond_integer_fast_path(self):
+        """Test that huge integral coordinates are still handled exactly."""
+        big = 2**40
+        s1 = Segment(Point(0, 0), Point(big, big))
+        s2 = Segment(Point(0, big), Point(big, 0))
+        s3 = Segment(Point(big // 2, big // 2), Point(big, 0))  # Starts on s1
+
+        assert do_cross(s1, s2), "Huge crossing segments should cross"
+        assert not do_cross(s1, s3), "Huge touching segments should not cross"
+
+    def test_non_integral_coordinates(self):
+        """Test that non-integral coordinates fall back to exact arithmetic."""
+        s1 = Segment(Point(0, 0), Point(1, 1))
+        s2 = Segment(Point(0.5, 0.5), Point(1, 0))  # Starts on s1
+        s3 = Segment(Point(0.25, 0.75), Point(0.75, 0.25))
+
+        assert not do_cross(s1, s2), "Touching segments should not cross"
+        assert do_cross(s1, s3), "Crossing segments should cross"
@@ -0,0 +1,217 @@
+"""
+Unit tests for the native FlipEngine.
+
+Tests verify that the C++ engine behaves exactly like the Python
+FlipPartnerMap (same flippable edges, partners, conflicts and resulting
+triangulations) and that it can be used as backend of FlippableTriangulation.
+"""
+
+import random
+
+import pytest
+from cgshop2026_pyutils.geometry import (
+    FlipEngine,
+    FlipPartnerMap,
+    FlippableTriangulation,
+    Point,
+    Segment,
+    do_cross,
+)
+from cgshop2026_pyutils.geometry.flip_partner_map import _FLIPPABLE, normalize_edge
+from conftest import grid_triangulation
+
+
+class TestFlipEngine:
+    """Test suite for the FlipEngine class."""
+
+    def test_square(self):
+        """The diagonal of a square is flippable and its partner is the other diagonal."""
+        points = [Point(0, 0), Point(1, 0), Point(0, 1), Point(1, 1)]
+        engine = FlipEngine.build(points, [(0, 3)])
+
+        assert engine.flippable_edges() == [(0, 3)]
+        assert engine.is_flippable((3, 0)), "Edge order should not matter"
+        assert engine.get_flip_partner((0, 3)) == (1, 2)
+        assert engine.conflicting_flips((0, 3)) == set()
+        assert engine.edges == {(0, 1), (0, 2), (1, 3), (2, 3), (0, 3)}
+
+        assert engine.flip((0, 3)) == (1, 2)
+        assert engine.flippable_edges() == [(1, 2)]
+        assert not engine.is_flippable((0, 3))
+        assert engine.compute_triangles() == [(0, 1, 2), (1, 2, 3)]
+
+    def test_errors(self):
+        """Invalid flips raise ValueError like FlipPartnerMap."""
+        points = [Point(0, 0), Point(1, 0), Point(0, 1), Point(1, 1)]
+        engine = FlipEngine.build(points, [(0, 3)])
+
+        with pytest.raises(ValueError, match="Edge does not exist"):
+            engine.flip((1, 2))
+        with pytest.raises(ValueError, match="Edge is not flippable"):
+            engine.flip((0, 1))
+        with pytest.raises(ValueError, match="Edge is not flippable"):
+            engine.get_flip_partner((0, 1))
+        with pytest.raises(ValueError, match="Edge is not flippable"):
+            engine.conflicting_flips((0, 1))
+
+    def test_non_convex_quadrilateral(self):
+        """Edges of non-convex quadrilaterals are not flippable."""
+        points = [Point(0, 0), Point(4, 0), Point(2, 4), Point(2, 1)]
+        engine = FlipEngine.build(points, [(0, 3), (1, 3), (2, 3)])
+
+        assert engine.flippable_edges() == []
+
+    def test_deep_copy_is_independent(self):
+        """Flipping a copy does not modify the original."""
+        points = [Point(0, 0), Point(1, 0), Point(0, 1), Point(1, 1)]
+        original = FlipEngine.build(points, [(0, 3)])
+        copy = original.deep_copy()
+
+        copy.flip((0, 3))
+
+        assert original.is_flippable((0, 3))
+        assert not copy.is_flippable((0, 3))
+
+    def test_matches_flip_partner_map(self):
+        """Random flip sequences give identical states in both implementations."""
+        points, edges = grid_triangulation(6)
+        engine = FlipEngine.build(points, edges)
+        reference = FlipPartnerMap.build(points, edges)
+        rng = random.Random(42)
+
+        for _ in range(200):
+            flippable = sorted(reference.flippable_edges())
+            assert sorted(engine.flippable_edges()) == flippable
+            edge = rng.choice(flippable)
+            assert engine.get_flip_partner(edge) == tuple(
+                sorted(reference.get_flip_partner(edge))
+            )
+            assert engine.conflicting_flips(edge) == reference.conflicting_flips(edge)
+            assert engine.flip(edge) == reference.flip(edge)
+            assert engine.edges == reference.edges
+
+        assert engine.compute_triangles() == reference.compute_triangles()
+        engine._rebuild_flip_map()
+        assert sorted(engine.flippable_edges()) == sorted(reference.flippable_edges())
+
+    def test_count_crossings(self):
+        """Crossings agree with pairwise tests, also along collinear points."""
+        points, edges = grid_triangulation(5)
+        engine = FlipEngine.build(points, edges)
+        rng = random.Random(7)
+        for _ in range(30):
+            engine.flip(rng.choice(engine.flippable_edges()))
+        segments = [(u, v) for u in range(len(points)) for v in range(len(points))]
+        segments = [(u, v) for u, v in segments if u != v]
+        expected = [
+            sum(
+                do_cross(Segment(points[u], points[v]), Segment(points[a], points[b]))
+                for a, b in engine.edges
+            )
+            for u, v in segments
+        ]
+        assert engine.count_crossings(segments) == expected
+        assert not any(engine.count_crossings(sorted(engine.edges))), (
+            "Edges do not cross"
+        )
+
+    def test_count_crossings_errors(self):
+        """Segments need two distinct vertices of the point set."""
+        points = [Point(0, 0), Point(1, 0), Point(0, 1), Point(1, 1)]
+        engine = FlipEngine.build(points, [(0, 3)])
+
+        assert engine.count_crossings([(1, 2), (2, 1), (0, 1)]) == [1, 1, 0]
+        with pytest.raises(ValueError, match="Invalid segment"):
+            engine.count_crossings([(0, 0)])
+        with pytest.raises(ValueError, match="Invalid segment"):
+            engine.count_crossings([(0, 4)])
+
+
+class TestNativeBackend:
+    """FlippableTriangulation running on the native engine."""
+
+    def test_backend_selection(self):
+        points = [Point(0, 0), Point(1, 0), Point(0, 1), Point(1, 1)]
+        tri = FlippableTriangulation.from_points_edges(
+            points, [(0, 3)], backend="native"
+        )
+
+        assert isinstance(tri._flip_map, FlipEngine)
+        assert tri.possible_flips() == [(0, 3)]
+        assert tri.add_flip((0, 3)) == (1, 2)
+        tri.commit()
+        assert set(tri.get_edges()) == {(0, 1), (0, 2), (1, 3), (2, 3), (1, 2)}
+
+    def test_unknown_backend(self):
+        points = [Point(0, 0), Point(1, 0), Point(0, 1)]
+        with pytest.raises(ValueError, match="Unknown flip map backend"):
+            FlippableTriangulation.from_points_edges(points, [], backend="rust")  # type: ignore[arg-type]
+
+    def test_equal_to_python_backend(self):
+        """Both backends stay equal when the same flips are applied."""
+        points, edges = grid_triangulation(5)
+        native = FlippableTriangulation.from_points_edges(
+            points, edges, backend="native"
+        )
+        python = FlippableTriangulation.from_points_edges(points, edges)
+        assert native == python
+
+        for _ in range(5):
+            for edge in sorted(python.possible_flips()):
+                if edge in python.possible_flips():
+                    python.add_flip(edge)
+                    native.add_flip(edge)
+            python.commit()
+            native.commit()
+            assert native == python
+
+        forked = native.fork()
+        forked.add_flip(forked.possible_flips()[0])
+        forked.commit()
+        assert forked != native
+
+
+@pytest.mark.parametrize("implementation", [FlipEngine, FlipPartnerMap])
+class TestCertifyFlip:
+    """Both implementations certify committed flips locally."""
+
+    def test_random_flips(self, implementation):
+        points, edges = grid_triangulation(6)
+        flip_map = implementation.build(points, edges)
+        rng = random.Random(7)
+        for _ in range(100):
+            edge = rng.choice(sorted(flip_map.flippable_edges()))
+            new_edge = flip_map.flip(edge)
+            flip_map.certify_flip(edge, new_edge)
+
+    def test_flip_not_applied(self, implementation):
+        points = [Point(0, 0), Point(1, 0), Point(0, 1), Point(1, 1)]
+        flip_map = implementation.build(points, [(0, 3)])
+        with pytest.raises(ValueError, match="still present"):
+            flip_map.certify_flip((0, 3), (1, 2))
+
+    def test_wrong_partner(self, implementation):
+        points, edges = grid_triangulation(4)
+        flip_map = implementation.build(points, edges)
+        edge = sorted(flip_map.flippable_edges())[0]
+        flip_map.flip(edge)
+        with pytest.raises(ValueError):
+            flip_map.certify_flip(edge, (0, 15))
+
+
+class TestCertifyFlipDetectsCorruption:
+    """Certification catches inconsistent incremental updates."""
+
+    def test_stale_flip_partner(self):
+        points, edges = grid_triangulation(4, random.Random(0))
+        flip_map = FlipPartnerMap.build(points, edges)
+        edge = sorted(flip_map.flippable_edges())[0]
+        new_edge = flip_map.flip(edge)
+        flip_map.certify_flip(edge, new_edge)
+        # Pretend the update of an edge of the quadrilateral was forgotten.
+        outer = [normalize_edge(u, v) for u in edge for v in new_edge]
+        stale = next(e for e in outer if e in flip_map.flip_map)
+        page, offset = flip_map._writable_record(flip_map._edge_id(*stale))
+        page[offset + _FLIPPABLE] = 0
+        with pytest.raises(ValueError, match="out of date"):
+            flip_map.certify_flip(edge, new_edge)
@@ -330,3 +330,60 @@ class TestFlipPartnerMap:
         assert flip_map.is_flippable((0, 3)) == flip_map.is_flippable((3, 0)), (
             "Flippability should be independent of edge vertex order"
         )
+
+
+class TestCompactStorage:
+    """The tuple attributes are views on the array-backed edge storage."""
+
+    @staticmethod
+    def _fan() -> FlipPartnerMap:
+        # A square with a center point, triangulated as a fan around the center.
+        points = [Point(0, 0), Point(4, 0), Point(4, 4), Point(0, 4), Point(2, 1)]
+        return FlipPartnerMap.build(points, [(0, 4), (1, 4), (2, 4), (3, 4)])
+
+    def test_views_match_triangles(self):
+        """Edges and incident triangles agree with a full recompute after flips."""
+        flip_map = self._fan()
+        flip_map.flip(flip_map.flippable_edges()[0])
+        triangles = flip_map.compute_triangles()
+        expected: dict[Edge, set[frozenset[int]]] = {}
+        for tri in triangles:
+            for i in range(3):
+                edge = tuple(sorted((tri[i], tri[(i + 1) % 3])))
+                expected.setdefault(edge, set()).add(frozenset(tri))
+        assert set(flip_map.edges) == set(expected), "Edge view out of date"
+        assert len(flip_map.edges) == len(expected)
+        for edge, tris in expected.items():
+            assert {frozenset(t) for t in flip_map.edge_to_triangles[edge]} == tris, (
+                f"Triangles of {edge} out of date"
+            )
+
+    def test_flip_map_view(self):
+        flip_map = self._fan()
+        assert dict(flip_map.flip_map) == {
+            e: flip_map.get_flip_partner(e) for e in flip_map.flippable_edges()
+        }
+        assert len(flip_map.flip_map) == len(flip_map.flippable_edges())
+        assert (4, 0) not in flip_map.flip_map, "Keys are normalized edges"
+        with pytest.raises(KeyError):
+            flip_map.flip_map[(0, 1)]
+
+    def test_edge_views_compare_by_content(self):
+        a = self._fan()
+        b = self._fan()
+        assert a.edges == b.edges
+        assert a.edges == set(b.edges), "Views compare equal to plain sets"
+        edge = a.flippable_edges()[0]
+        new_edge = a.flip(edge)
+        assert a.edges != b.edges
+        b.flip(edge)
+        assert a.edges == b.edges
+        a.flip(new_edge)
+        assert a.edges == self._fan().edges, "Flipping back restores the edges"
+
+    def test_deep_copy_shares_no_storage(self):
+        original = self._fan()
+        copy = original.deep_copy()
+        copy.flip(copy.flippable_edges()[0])
+        assert original.edges == self._fan().edges, "Original must not change"
+        assert original.flip_map == self._fan().flip_map
@@ -6,8 +6,13 @@ edge flip operations, manages pending flips, handles conflicts, and provides
 proper validation and error handling.
 """
 
+import pickle
+import random
+
 import pytest
 from cgshop2026_pyutils.geometry import FlippableTriangulation, Point, Edge
+from cgshop2026_pyutils.geometry import flip_partner_map, flippable_triangulation
+from conftest import grid_triangulation
 
 
 class TestFlippableTriangulation:
@@ -845,3 +850,477 @@ class TestFlippableTriangulation:
         # We don't assert a specific result here since it depends on internal implementation,
         # but we verify the comparison doesn't crash and returns a boolean
         assert isinstance(result, bool), "Equality comparison should return boolean"
+
+
+@pytest.mark.parametrize("backend", ["python", "native"])
+class TestIncrementalPossibleFlips:
+    """possible_flips stays equal to a full recompute while batches are built."""
+
+    @staticmethod
+    def _expected(triangulation: FlippableTriangulation) -> set[Edge]:
+        return {
+            e
+            for e in triangulation._flip_map.flippable_edges()
+            if e not in triangulation._conflicting_edges
+            and e not in triangulation._flip_queue
+        }
+
+    def test_random_batches(self, backend):
+        rng = random.Random(3)
+        triangulation = FlippableTriangulation.from_points_edges(
+            *grid_triangulation(6, rng), backend=backend
+        )
+        for _ in range(30):
+            for _ in range(rng.randint(1, 5)):
+                possible = triangulation.possible_flips()
+                assert set(possible) == self._expected(triangulation)
+                assert len(possible) == len(set(possible)), "No duplicates"
+                if not possible:
+                    break
+                triangulation.add_flip(rng.choice(possible))
+            fork = triangulation.fork()
+            assert set(fork.possible_flips()) == set(
+                fork._flip_map.flippable_edges()
+            ), "Forks start without pending flips"
+            triangulation.commit()
+            assert set(triangulation.possible_flips()) == self._expected(triangulation)
+
+
+@pytest.mark.parametrize("backend", ["python", "native"])
+class TestCopyOnWriteFork:
+    """Forks share storage until modified but behave as independent copies."""
+
+    def test_forks_are_independent(self, backend):
+        rng = random.Random(5)
+        points, edges = grid_triangulation(6, rng)
+        root = FlippableTriangulation.from_points_edges(points, edges, backend=backend)
+        # Every branch remembers its flips to compare against a replay.
+        branches = [(root, [])]
+        for _ in range(40):
+            tri, history = rng.choice(branches)
+            if rng.random() < 0.4:
+                branches.append((tri.fork(), list(history)))
+                continue
+            possible = tri.possible_flips()
+            if not possible:
+                continue
+            edge = rng.choice(possible)
+            tri.add_flip(edge)
+            tri.commit()
+            history.append(edge)
+        for tri, history in branches:
+            replay = FlippableTriangulation.from_points_edges(
+                points, edges, backend=backend
+            )
+            for edge in history:
+                replay.add_flip(edge)
+                replay.commit()
+            assert set(tri.get_edges()) == set(replay.get_edges()), (
+                "A fork was modified by another branch"
+            )
+            assert sorted(tri.possible_flips()) == sorted(replay.possible_flips())
+
+    def test_fork_shares_available_flips(self, backend):
+        """The available flips are only copied by the first branch that changes them."""
+        points, edges = grid_triangulation(6, random.Random(6))
+        root = FlippableTriangulation.from_points_edges(points, edges, backend=backend)
+        possible = root.possible_flips()
+        fork = root.fork()
+        assert fork._available is root._available, "Forking should not copy"
+        fork.add_flip(possible[0])
+        fork.commit()
+        assert fork._available is not root._available
+        assert root.possible_flips() == possible, "The root is not modified"
+        forked = fork.possible_flips()
+        root.add_flip(possible[1])
+        assert fork.possible_flips() == forked, "The fork is not modified"
+
+
+@pytest.mark.parametrize("backend", ["python", "native"])
+class TestRollback:
+    """Committed flips can be reverted through the flip journal."""
+
+    @staticmethod
+    def _random_round(triangulation: FlippableTriangulation, rng: random.Random):
+        for edge in triangulation.possible_flips():
+            if rng.random() < 0.5 and edge in triangulation.possible_flips():
+                triangulation.add_flip(edge)
+        triangulation.commit()
+
+    def test_undo_last_commit(self, backend):
+        rng = random.Random(11)
+        points, edges = grid_triangulation(6, rng)
+        triangulation = FlippableTriangulation.from_points_edges(
+            points, edges, backend=backend
+        )
+        self._random_round(triangulation, rng)
+        before = set(triangulation.get_edges())
+        possible = set(triangulation.possible_flips())
+        self._random_round(triangulation, rng)
+        assert set(triangulation.get_edges()) != before, "The round flipped edges"
+        triangulation.undo_last_commit()
+        assert set(triangulation.get_edges()) == before
+        assert set(triangulation.possible_flips()) == possible
+        triangulation.undo_last_commit()
+        assert set(triangulation.get_edges()) == set(
+            FlippableTriangulation.from_points_edges(points, edges).get_edges()
+        )
+        with pytest.raises(ValueError, match="no commit"):
+            triangulation.undo_last_commit()
+
+    def test_rollback_to_checkpoint(self, backend):
+        rng = random.Random(12)
+        points, edges = grid_triangulation(7, rng)
+        triangulation = FlippableTriangulation.from_points_edges(
+            points, edges, backend=backend
+        )
+        self._random_round(triangulation, rng)
+        checkpoint = triangulation.checkpoint()
+        before = triangulation.fork()
+        for _ in range(5):
+            self._random_round(triangulation, rng)
+        # Pending flips are discarded as well.
+        triangulation.add_flip(triangulation.possible_flips()[0])
+        triangulation.rollback(checkpoint)
+        assert triangulation == before, "Rollback must restore the checkpoint"
+        assert sorted(triangulation.possible_flips()) == sorted(before.possible_flips())
+        assert triangulation.checkpoint() == checkpoint
+        # The history can be extended again after a rollback.
+        self._random_round(triangulation, rng)
+        triangulation.undo_last_commit()
+        assert triangulation == before
+        triangulation.undo_last_commit()
+        assert triangulation.checkpoint() == 0
+
+    def test_invalid_checkpoint(self, backend):
+        points = [Point(0, 0), Point(1, 0), Point(0, 1), Point(1, 1)]
+        triangulation = FlippableTriangulation.from_points_edges(
+            points, [(0, 3)], backend=backend
+        )
+        with pytest.raises(ValueError, match="flip history"):
+            triangulation.rollback(1)
+        triangulation.add_flip((0, 3))
+        triangulation.commit()
+        assert triangulation.checkpoint() == 1
+        triangulation.rollback(0)
+        assert set(triangulation.get_edges()) == {
+            (0, 1),
+            (0, 2),
+            (0, 3),
+            (1, 3),
+            (2, 3),
+        }
+
+
+class TestStateHash:
+    """The Zobrist hash identifies the edge set independent of the flip order."""
+
+    def test_incremental_matches_recompute(self):
+        rng = random.Random(21)
+        points, edges = grid_triangulation(6, rng)
+        python = FlippableTriangulation.from_points_edges(points, edges)
+        native = FlippableTriangulation.from_points_edges(
+            points, edges, backend="native"
+        )
+        initial = python.state_hash()
+        assert native.state_hash() == initial, "Backends agree on the hash"
+        for _ in range(20):
+            edge = rng.choice(python.possible_flips())
+            python.add_flip(edge)
+            native.add_flip(edge)
+            python.commit()
+            native.commit()
+            fresh = FlippableTriangulation.from_points_edges(points, python.get_edges())
+            assert python.state_hash() == fresh.state_hash()
+            assert native.state_hash() == fresh.state_hash()
+        python.rollback(0)
+        assert python.state_hash() == initial, "Rollback restores the hash"
+
+    def test_transposition(self):
+        """Independent flips applied in different orders give the same state."""
+        points, edges = grid_triangulation(5, random.Random(2))
+        first = FlippableTriangulation.from_points_edges(points, edges)
+        second = first.fork()
+        a = first.possible_flips()[0]
+        conflicts = first._flip_map.conflicting_flips(a)
+        b = next(e for e in first.possible_flips()[1:] if e not in conflicts)
+        for tri, order in ((first, (a, b)), (second, (b, a))):
+            for edge in order:
+                tri.add_flip(edge)
+                tri.commit()
+        assert first.state_hash() == second.state_hash()
+        assert first == second
+        table = {first: "seen"}
+        assert table.get(second) == "seen", "Usable in transposition tables"
+
+    def test_eq_rejects_different_hash(self):
+        points, edges = grid_triangulation(5, random.Random(4))
+        first = FlippableTriangulation.from_points_edges(points, edges)
+        second = first.fork()
+        second.add_flip(second.possible_flips()[0])
+        second.commit()
+        assert first.state_hash() != second.state_hash()
+        assert first != second
+
+
+@pytest.mark.parametrize("backend", ["python", "native"])
+class TestApplyParallelFlips:
+    """A whole round of flips is validated and committed in one call."""
+
+    def test_strict_round(self, backend):
+        points = [Point(0, 0), Point(1, 0), Point(0, 1), Point(1, 1)]
+        triangulation = FlippableTriangulation.from_points_edges(
+            points, [(0, 3)], backend=backend
+        )
+        assert triangulation.apply_parallel_flips([(3, 0)]) == [((0, 3), (1, 2))]
+        assert (1, 2) in triangulation.get_edges()
+        assert triangulation.checkpoint() == 1, "The round is journaled"
+
+    def test_accepts_iterators(self, backend):
+        points = [Point(0, 0), Point(1, 0), Point(0, 1), Point(1, 1)]
+        triangulation = FlippableTriangulation.from_points_edges(
+            points, [(0, 3)], backend=backend
+        )
+        worklist = dict.fromkeys([(0, 1), (0, 3)])
+        flips = triangulation.apply_parallel_flips(reversed(worklist), mode="greedy")
+        assert flips == [((0, 3), (1, 2))]
+
+    def test_strict_reports_all_problems(self, backend):
+        points, edges = grid_triangulation(5, random.Random(8))
+        triangulation = FlippableTriangulation.from_points_edges(
+            points, edges, backend=backend
+        )
+        edge = triangulation.possible_flips()[0]
+        conflict = next(iter(triangulation._flip_map.conflicting_flips(edge)))
+        before = triangulation.fork()
+        with pytest.raises(ValueError) as error:
+            triangulation.apply_parallel_flips([edge, (0, 1), conflict])
+        assert "edge (0, 1) is not flippable" in str(error.value)
+        assert f"edges {edge} and {conflict} conflict" in str(error.value)
+        assert triangulation == before, "A rejected round must not flip anything"
+
+    def test_greedy_matches_add_flip(self, backend):
+        rng = random.Random(9)
+        points, edges = grid_triangulation(7, rng)
+        batched = FlippableTriangulation.from_points_edges(
+            points, edges, backend=backend
+        )
+        reference = batched.fork()
+        for _ in range(10):
+            candidates = list(batched._flip_map.edges)
+            rng.shuffle(candidates)
+            candidates = candidates[:30] + candidates[:3]  # with duplicates
+            flips = batched.apply_parallel_flips(candidates, mode="greedy")
+            expected = []
+            for edge in candidates:
+                try:
+                    expected.append((edge, reference.add_flip(edge)))
+                except ValueError:
+                    continue
+            reference.commit()
+            assert [edge for edge, _ in flips] == [edge for edge, _ in expected]
+            assert {new for _, new in flips} == {
+                tuple(sorted(new)) for _, new in expected
+            }
+            assert batched == reference
+
+    def test_conflicts_agree_between_backends(self, backend):
+        points, edges = grid_triangulation(6, random.Random(10))
+        python = FlippableTriangulation.from_points_edges(points, edges)
+        other = FlippableTriangulation.from_points_edges(points, edges, backend=backend)
+        candidates = sorted(python._flip_map.edges)
+        for greedy in (False, True):
+            assert python._flip_map.check_parallel_flips(
+                candidates, greedy
+            ) == other._flip_map.check_parallel_flips(candidates, greedy)
+
+    def test_pending_flips(self, backend):
+        points = [Point(0, 0), Point(1, 0), Point(0, 1), Point(1, 1)]
+        triangulation = FlippableTriangulation.from_points_edges(
+            points, [(0, 3)], backend=backend
+        )
+        triangulation.add_flip((0, 3))
+        with pytest.raises(ValueError, match="pending"):
+            triangulation.apply_parallel_flips([(0, 3)])
+
+
+@pytest.mark.parametrize("backend", ["python", "native"])
+class TestChangedSince:
+    """changed_since reports every edge whose flip status or partner changed."""
+
+    @staticmethod
+    def _flip_status(triangulation: FlippableTriangulation) -> dict[Edge, Edge | None]:
+        return {
+            edge: triangulation.get_flip_partner(edge)
+            if triangulation._flip_map.is_flippable(edge)
+            else None
+            for edge in triangulation.get_edges()
+        }
+
+    def test_changed_edges_cover_all_changes(self, backend):
+        rng = random.Random(31)
+        triangulation = FlippableTriangulation.from_points_edges(
+            *grid_triangulation(7, rng), backend=backend
+        )
+        for _ in range(10):
+            before = self._flip_status(triangulation)
+            checkpoint = triangulation.checkpoint()
+            for _ in range(rng.randint(1, 3)):
+                for edge in triangulation.possible_flips():
+                    if rng.random() < 0.3 and edge in triangulation.possible_flips():
+                        triangulation.add_flip(edge)
+                triangulation.commit()
+            after = self._flip_status(triangulation)
+            changed = triangulation.changed_since(checkpoint)
+            assert changed <= after.keys(), "Only current edges are reported"
+            for edge, status in after.items():
+                if before.get(edge, "missing") != status:
+                    assert edge in changed, f"{edge} changed but was not reported"
+            assert triangulation.changed_since(triangulation.checkpoint()) == set()
+
+    def test_invalid_checkpoint(self, backend):
+        triangulation = FlippableTriangulation.from_points_edges(
+            *grid_triangulation(4, random.Random(32)), backend=backend
+        )
+        with pytest.raises(ValueError, match="not part of the flip history"):
+            triangulation.changed_since(1)
+
+
+@pytest.mark.parametrize("backend", ["python", "native"])
+class TestSerialization:
+    """to_bytes/from_bytes restore the full state without re-validation."""
+
+    @staticmethod
+    def _flipped_triangulation(backend: str) -> FlippableTriangulation:
+        rng = random.Random(41)
+        triangulation = FlippableTriangulation.from_points_edges(
+            *grid_triangulation(7, rng), backend=backend
+        )
+        for _ in range(5):
+            for edge in triangulation.possible_flips():
+                if rng.random() < 0.3 and edge in triangulation.possible_flips():
+                    triangulation.add_flip(edge)
+            triangulation.commit()
+        triangulation.add_flip(triangulation.possible_flips()[0])
+        return triangulation
+
+    @staticmethod
+    def _assert_same_state(a: FlippableTriangulation, b: FlippableTriangulation):
+        assert a == b, "Edges and pending flips should be restored"
+        assert set(a.possible_flips()) == set(b.possible_flips())
+        for edge in a._flip_map.flippable_edges():
+            # The Python backend does not normalize flip partners.
+            assert sorted(a.get_flip_partner(edge)) == sorted(b.get_flip_partner(edge))
+        assert sorted(a._flip_map.compute_triangles()) == sorted(
+            b._flip_map.compute_triangles()
+        )
+
+    def test_round_trip(self, backend):
+        triangulation = self._flipped_triangulation(backend)
+        restored = FlippableTriangulation.from_bytes(triangulation.to_bytes())
+        assert isinstance(restored._flip_map, type(triangulation._flip_map))
+        self._assert_same_state(triangulation, restored)
+        assert restored.checkpoint() == 0, "The journal is not serialized"
+        # Both continue identically.
+        triangulation.commit()
+        restored.commit()
+        self._assert_same_state(triangulation, restored)
+
+    def test_other_backend(self, backend):
+        other = "native" if backend == "python" else "python"
+        triangulation = self._flipped_triangulation(backend)
+        restored = FlippableTriangulation.from_bytes(
+            triangulation.to_bytes(), backend=other
+        )
+        self._assert_same_state(triangulation, restored)
+
+    def test_no_revalidation(self, backend, monkeypatch):
+        triangulation = self._flipped_triangulation(backend)
+        data = triangulation.to_bytes()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("Loading should not recompute the triangulation")
+
+        monkeypatch.setattr(flippable_triangulation, "is_triangulation", fail)
+        monkeypatch.setattr(flip_partner_map, "compute_triangles", fail)
+        monkeypatch.setattr(flip_partner_map, "flippable_mask", fail)
+        restored = FlippableTriangulation.from_bytes(data)
+        monkeypatch.undo()
+        self._assert_same_state(triangulation, restored)
+
+    def test_pickle_and_shared_buffer(self, backend):
+        triangulation = self._flipped_triangulation(backend)
+        self._assert_same_state(
+            triangulation, pickle.loads(pickle.dumps(triangulation))
+        )
+        # A buffer may be longer than the data, e.g., a shared memory block.
+        data = triangulation.to_bytes()
+        buffer = bytearray(len(data) + 100)
+        buffer[: len(data)] = data
+        self._assert_same_state(
+            triangulation, FlippableTriangulation.from_bytes(memoryview(buffer))
+        )
+
+    def test_invalid_data(self, backend):
+        data = self._flipped_triangulation(backend).to_bytes()
+        with pytest.raises(ValueError, match="not a serialized triangulation"):
+            FlippableTriangulation.from_bytes(b"XXXX" + data[4:])
+        with pytest.raises(ValueError, match="shorter"):
+            FlippableTriangulation.from_bytes(data[:-8])
+        with pytest.raises(ValueError, match="too short"):
+            FlippableTriangulation.from_bytes(data[:10])
+
+    def test_non_integral_points(self, backend):
+        points = [Point(0, 0), Point(1, 0), Point(0.5, 1)]
+        triangulation = FlippableTriangulation.from_points_edges(
+            points, [], backend=backend
+        )
+        with pytest.raises(ValueError, match="integers"):
+            triangulation.to_bytes()
+
+
+@pytest.mark.parametrize("backend", ["python", "native"])
+class TestAdjacencyArrays:
+    """The array views match the triangles and edges after every commit."""
+
+    def test_arrays_match_triangulation(self, backend):
+        rng = random.Random(51)
+        points, edges = grid_triangulation(6, rng)
+        triangulation = FlippableTriangulation.from_points_edges(
+            points, edges, backend=backend
+        )
+        for _ in range(5):
+            self._check(triangulation, len(points))
+            for edge in triangulation.possible_flips():
+                if rng.random() < 0.3 and edge in triangulation.possible_flips():
+                    triangulation.add_flip(edge)
+            triangulation.commit()
+
+    @staticmethod
+    def _check(triangulation: FlippableTriangulation, n: int):
+        edges = sorted(triangulation.get_edges())
+        assert triangulation.edge_array().tolist() == [list(e) for e in edges]
+        triangles = sorted(triangulation._flip_map.compute_triangles())
+        assert triangulation.triangle_array().tolist() == [list(t) for t in triangles]
+
+        incident: dict[Edge, list[int]] = {}
+        for i, triangle in enumerate(triangles):
+            for j in range(3):
+                side = tuple(v for k, v in enumerate(triangle) if k != j)
+                incident.setdefault(side, []).append(i)
+        array_triangles, adjacency = triangulation.triangle_adjacency()
+        assert array_triangles.tolist() == [list(t) for t in triangles]
+        for i, triangle in enumerate(triangles):
+            for j in range(3):
+                side = tuple(v for k, v in enumerate(triangle) if k != j)
+                others = [t for t in incident[side] if t != i]
+                expected = others[0] if others else -1
+                assert adjacency[i, j] == expected, (
+                    f"Wrong neighbor of triangle {triangle} across {side}"
+                )
+
+        indptr, indices = triangulation.vertex_neighbors()
+        assert len(indptr) == n + 1
+        for v in range(n):
+            expected = sorted({w for e in edges for w in e if v in e and w != v})
+            assert indices[indptr[v] : indptr[v + 1]].tolist() == expected
@@ -8,6 +8,7 @@ intersecting edges, and malformed input.
 
 import pytest
 from cgshop2026_pyutils.geometry import is_triangulation, Point, Edge
+from conftest import grid_triangulation
 
 
 class TestIsTriangulation:
@@ -420,3 +421,65 @@ class TestIsTriangulation:
         assert not is_triangulation(points, edges), (
             "Nasty overlapping edges (0,2) and (0,1) should be invalid"
         )
+
+
+class TestCombinatorialCheck:
+    """The default combinatorial check must agree with the arrangement."""
+
+    CASES = [
+        ([(0, 0), (1, 0), (0, 1), (1, 1)], [(0, 3)], True),
+        ([(0, 0), (1, 0), (0, 1), (1, 1)], [(0, 3), (1, 2)], False),
+        ([(0, 0), (1, 0), (0, 1), (1, 1)], [], False),
+        ([(0, 0), (1, 0), (2, 0), (1, 1)], [(0, 3), (1, 3), (2, 3)], True),
+        ([(0, 0), (1, 0), (2, 0), (1, 1)], [(0, 3), (2, 3)], False),
+        ([(0, 0), (2, 0), (1, 1), (1, 2)], [(0, 2), (1, 2), (2, 3)], True),
+        ([(0, 0), (2, 0), (1, 1), (1, 2)], [(0, 2), (1, 2)], False),
+        (
+            [(0, 0), (4, 0), (2, 4), (2, 1), (2, 2)],
+            [(0, 3), (1, 3), (3, 4), (0, 4), (1, 4), (2, 4)],
+            True,
+        ),
+        (
+            [(0, 0), (4, 0), (2, 4), (2, 1), (2, 2)],
+            [(0, 3), (1, 3), (2, 3), (0, 4), (1, 4), (2, 4)],
+            False,
+        ),
+        ([(0, 0), (1, 0), (2, 0)], [(0, 1), (1, 2)], True),
+    ]
+
+    @pytest.mark.parametrize("coords, edges, expected", CASES)
+    def test_agrees_with_arrangement(self, coords, edges, expected):
+        points = [Point(x, y) for x, y in coords]
+        assert is_triangulation(points, edges) == expected
+        assert is_triangulation(points, edges, use_arrangement=True) == expected
+
+    def test_non_integral_coordinates(self):
+        """Rational coordinates are checked with exact arithmetic."""
+        points = [
+            Point(0.5, 0),
+            Point(1.5, 0),
+            Point(0.5, 1),
+            Point(1.5, 1),
+            Point(1, 0.5),
+        ]
+        assert is_triangulation(points, [(0, 4), (1, 4), (2, 4), (3, 4)])
+        assert not is_triangulation(points, [(0, 4), (1, 4), (2, 4), (0, 3)])
+
+    def test_large_grid(self):
+        """Large triangulations are validated quickly."""
+        points, edges = grid_triangulation(100)
+        assert is_triangulation(points, edges), "Grid triangulation should be valid"
+
+        # Replace one diagonal by the crossing one
+        size = 100
+        idx = 50 * size + 50
+        edges.remove((idx, idx + size + 1))
+        assert not is_triangulation(points, edges), (
+            "Missing diagonal should be detected"
+        )
+        edges.append((idx + 1, idx + size))
+        assert is_triangulation(points, edges), "Flipped diagonal should be valid"
+        edges.append((idx, idx + size + 1))
+        assert not is_triangulation(points, edges), (
+            "Crossing diagonals should be detected"
+        )
@@ -0,0 +1,132 @@
+"""
+Unit tests for the selection of parallel flips.
+
+Tests verify that the selected flips are pairwise non-conflicting, that small
+conflict graphs are solved optimally, and that the selection can be applied
+as a single strict round.
+"""
+
+import itertools
+import random
+
+import pytest
+from cgshop2026_pyutils.geometry import (
+    Edge,
+    FlippableTriangulation,
+    conflict_graph,
+    select_parallel_flips,
+)
+from conftest import grid_triangulation
+
+
+def _is_independent(triangulation: FlippableTriangulation, edges: list[Edge]) -> bool:
+    chosen = set(edges)
+    return all(
+        chosen.isdisjoint(triangulation._flip_map.conflicting_flips(e)) for e in edges
+    )
+
+
+def _brute_force(
+    candidates: list[Edge], neighbors: list[set[int]], weights: list[float]
+) -> float:
+    best = 0.0
+    for r in range(len(candidates) + 1):
+        for subset in itertools.combinations(range(len(candidates)), r):
+            if all(neighbors[i].isdisjoint(subset) for i in subset):
+                best = max(best, sum(weights[i] for i in subset))
+    return best
+
+
+@pytest.mark.parametrize("backend", ["python", "native"])
+class TestSelectParallelFlips:
+    """Test suite for select_parallel_flips and conflict_graph."""
+
+    def test_conflict_graph_matches_conflicting_flips(self, backend):
+        """Two candidates are adjacent iff their flips conflict."""
+        triangulation = FlippableTriangulation.from_points_edges(
+            *grid_triangulation(5, random.Random(0)), backend=backend
+        )
+        candidates = triangulation.possible_flips()
+        usable, neighbors = conflict_graph(triangulation, candidates)
+        assert usable == list(range(len(candidates))), "All candidates are usable"
+        for i, edge in enumerate(candidates):
+            expected = set(triangulation._flip_map.conflicting_flips(edge))
+            assert {candidates[j] for j in neighbors[i]} == expected, (
+                f"Neighbors of {edge} should be its conflicting flips"
+            )
+
+    def test_selection_is_applicable_in_one_round(self, backend):
+        """The selection is independent and accepted by a strict round."""
+        rng = random.Random(1)
+        triangulation = FlippableTriangulation.from_points_edges(
+            *grid_triangulation(8, rng), backend=backend
+        )
+        for _ in range(5):
+            selected = select_parallel_flips(
+                triangulation, triangulation.possible_flips()
+            )
+            assert selected, "A non-empty selection is expected"
+            assert _is_independent(triangulation, selected), "No conflicts"
+            flips = triangulation.apply_parallel_flips(selected, mode="strict")
+            assert [edge for edge, _ in flips] == selected, "All flips are applied"
+
+    def test_exact_selection_is_optimal(self, backend):
+        """Small conflict graphs are solved optimally, also with weights."""
+        rng = random.Random(2)
+        for _ in range(5):
+            triangulation = FlippableTriangulation.from_points_edges(
+                *grid_triangulation(4, rng), backend=backend
+            )
+            candidates = triangulation.possible_flips()
+            _, neighbors = conflict_graph(triangulation, candidates)
+            for weights in (
+                [1.0] * len(candidates),
+                [rng.uniform(0.5, 2.0) for _ in candidates],
+            ):
+                selected = select_parallel_flips(
+                    triangulation, candidates, weights, exact_limit=len(candidates)
+                )
+                assert _is_independent(triangulation, selected), "No conflicts"
+                total = sum(weights[candidates.index(e)] for e in selected)
+                assert total == pytest.approx(
+                    _brute_force(candidates, neighbors, weights)
+                ), "The selection should have maximum weight"
+
+    def test_greedy_selection_is_maximal(self, backend):
+        """Without exact solving, no candidate can be added to the selection."""
+        triangulation = FlippableTriangulation.from_points_edges(
+            *grid_triangulation(8, random.Random(3)), backend=backend
+        )
+        candidates = triangulation.possible_flips()
+        selected = select_parallel_flips(triangulation, candidates, exact_limit=0)
+        assert _is_independent(triangulation, selected), "No conflicts"
+        chosen = set(selected)
+        for edge in candidates:
+            assert edge in chosen or not chosen.isdisjoint(
+                triangulation._flip_map.conflicting_flips(edge)
+            ), f"{edge} could be added to the selection"
+
+    def test_pending_and_unflippable_edges_are_skipped(self, backend):
+        """Candidates that cannot be added to the pending flips are ignored."""
+        triangulation = FlippableTriangulation.from_points_edges(
+            *grid_triangulation(5, random.Random(4)), backend=backend
+        )
+        candidates = triangulation.possible_flips()
+        pending = candidates[0]
+        triangulation.add_flip(pending)
+        blocked = set(triangulation._flip_map.conflicting_flips(pending)) | {pending}
+        hull_edge = (0, 1)
+        selected = select_parallel_flips(triangulation, [hull_edge, *candidates])
+        assert blocked.isdisjoint(selected), "Blocked edges should not be selected"
+        assert hull_edge not in selected, "Unflippable edges should not be selected"
+        for edge in selected:
+            triangulation.add_flip(edge)
+
+    def test_weight_count_mismatch(self, backend):
+        """One weight per candidate is required."""
+        triangulation = FlippableTriangulation.from_points_edges(
+            *grid_triangulation(4, random.Random(5)), backend=backend
+        )
+        candidates = triangulation.possible_flips()
+        with pytest.raises(ValueError, match="one weight per candidate"):
+            select_parallel_flips(triangulation, candidates, [1.0])
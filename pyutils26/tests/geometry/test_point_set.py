@@ -0,0 +1,177 @@
+"""
+Unit tests for the array-backed PointSet.
+
+Tests verify construction from Point lists, coordinate arrays, and instances,
+the sequence protocol, and that all geometry functions accept a PointSet in
+place of a list of points with the same results.
+"""
+
+import numpy as np
+import pytest
+from cgshop2026_pyutils.geometry import (
+    FlipEngine,
+    FlippableTriangulation,
+    Point,
+    PointSet,
+    compute_triangles,
+    do_cross_many,
+    flippable_mask,
+    illegal_edges,
+    is_triangulation,
+)
+from cgshop2026_pyutils.schemas import CGSHOP2026Instance
+
+XS = [0, 4, 4, 0, 2, 1]
+YS = [0, 0, 4, 4, 1, 3]
+EDGES = [(0, 4), (1, 4), (4, 5), (0, 5), (3, 5), (2, 5), (2, 4)]
+
+
+def _points() -> list[Point]:
+    return [Point(x, y) for x, y in zip(XS, YS)]
+
+
+class TestPointSetConstruction:
+    """Test suite for building a PointSet."""
+
+    def test_from_arrays(self):
+        """The points keep the order and coordinates of the arrays."""
+        points = PointSet.from_arrays(np.array(XS), np.array(YS))
+        assert len(points) == len(XS)
+        assert list(points) == _points(), "Points differ from the input"
+
+    def test_from_lists(self):
+        """Plain Python lists are accepted as coordinate arrays."""
+        assert list(PointSet.from_arrays(XS, YS)) == _points()
+
+    def test_from_points(self):
+        points = PointSet(_points())
+        assert list(points) == _points()
+
+    def test_from_instance(self):
+        instance = CGSHOP2026Instance(
+            instance_uid="square",
+            points_x=XS,
+            points_y=YS,
+            triangulations=[EDGES],
+        )
+        assert list(PointSet.from_instance(instance)) == _points()
+
+    def test_empty(self):
+        assert len(PointSet.from_arrays([], [])) == 0
+
+    def test_large_coordinates(self):
+        """Coordinates beyond the native integer range stay exact."""
+        points = PointSet.from_arrays([2**40, -(2**40)], [3, 2**52])
+        assert points[0] == Point(2**40, 3)
+        assert points[1] == Point(-(2**40), 2**52)
+
+    def test_mismatched_lengths(self):
+        with pytest.raises(ValueError, match="same length"):
+            PointSet.from_arrays([0, 1], [0])
+
+    def test_invalid_shape(self):
+        with pytest.raises(ValueError, match="one-dimensional"):
+            PointSet.from_arrays([[0, 1]], [[0, 1]])
+
+    def test_too_large_coordinate(self):
+        with pytest.raises(ValueError, match="2\\^53"):
+            PointSet.from_arrays([2**60], [0])
+
+    def test_to_arrays(self):
+        """to_arrays returns the integer coordinates, also for large ones."""
+        xs, ys = PointSet.from_arrays(XS, YS).to_arrays()
+        assert xs.tolist() == XS and ys.tolist() == YS
+        xs, ys = PointSet([Point(2**40, 3), Point(-1, 2**52)]).to_arrays()
+        assert xs.tolist() == [2**40, -1] and ys.tolist() == [3, 2**52]
+
+    def test_to_arrays_non_integral(self):
+        with pytest.raises(ValueError, match="integers"):
+            PointSet([Point(0.5, 1)]).to_arrays()
+
+
+class TestPointSetSequence:
+    """Test suite for the sequence protocol of PointSet."""
+
+    def test_getitem(self):
+        points = PointSet.from_arrays(XS, YS)
+        assert points[2] == Point(4, 4)
+        assert points[-1] == Point(1, 3), "Negative indices count from the end"
+
+    def test_getitem_out_of_range(self):
+        points = PointSet.from_arrays(XS, YS)
+        with pytest.raises(IndexError):
+            points[len(XS)]
+        with pytest.raises(IndexError):
+            points[-len(XS) - 1]
+
+
+class TestPointSetInterop:
+    """All geometry functions accept a PointSet in place of a list of points."""
+
+    def test_triangulation_functions(self):
+        points = PointSet.from_arrays(XS, YS)
+        assert is_triangulation(points, EDGES)
+        assert not is_triangulation(points, EDGES[:-1])
+        assert compute_triangles(points, EDGES) == compute_triangles(_points(), EDGES)
+
+    def test_batched_predicates(self):
+        points = PointSet.from_arrays(XS, YS)
+        quads = [[0, 2, 1, 3], [0, 1, 2, 3]]
+        assert do_cross_many(points, quads).tolist() == [True, False]
+        assert flippable_mask(points, [[4, 5]], [[0, 2]]).tolist() == [True]
+        assert illegal_edges(points, [[4, 5]], [[0, 2]]) == illegal_edges(
+            _points(), [[4, 5]], [[0, 2]]
+        )
+
+    def test_flip_engine_shares_points(self):
+        """Engines built from a PointSet expose it instead of a copy."""
+        points = PointSet.from_arrays(XS, YS)
+        engine = FlipEngine.build(points, EDGES)
+        assert engine.points is points
+        assert engine.deep_copy().points is points
+
+    @pytest.mark.parametrize("backend", ["python", "native"])
+    def test_flippable_triangulation(self, backend):
+        """Both backends give the same flips for a PointSet and a list."""
+        from_set = FlippableTriangulation.from_points_edges(
+            PointSet.from_arrays(XS, YS), EDGES, backend=backend
+        )
+        from_list = FlippableTriangulation.from_points_edges(
+            _points(), EDGES, backend=backend
+        )
+        assert sorted(from_set.possible_flips()) == sorted(from_list.possible_flips())
+        edge = from_set.possible_flips()[0]
+        from_set.add_flip(edge)
+        from_list.add_flip(edge)
+        from_set.commit()
+        from_list.commit()
+        assert from_set == from_list
+
+
+class TestPointSetCaching:
+    """The point index and hull are computed once and reused across calls."""
+
+    def test_many_triangulations(self):
+        """Repeated checks on one point set give consistent results."""
+        points = PointSet.from_arrays(XS, YS)
+        for _ in range(3):
+            assert is_triangulation(points, EDGES)
+            assert not is_triangulation(points, EDGES[:-1])
+            assert is_triangulation(points, EDGES, use_arrangement=True)
+
+    def test_duplicate_points(self):
+        """The cached duplicate check rejects every triangulation."""
+        points = PointSet.from_arrays([0, 1, 0, 1], [0, 0, 1, 0])
+        assert not is_triangulation(points, [(0, 2)])
+        assert not is_triangulation(points, [(0, 2)], use_arrangement=True)
+
+    def test_collinear_hull_points(self):
+        """Points in the interior of hull edges belong to the cached hull."""
+        points = PointSet.from_arrays([0, 1, 2, 1], [0, 0, 0, 1])
+        edges = [(0, 3), (1, 3), (2, 3)]
+        assert is_triangulation(points, edges)
+        assert compute_triangles(points, edges) == [(0, 1, 3), (1, 2, 3)]
+        assert compute_triangles(points, edges, use_arrangement=True) == [
+            (0, 1, 3),
+            (1, 2, 3),
+        ]
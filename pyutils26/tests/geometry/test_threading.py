@@ -0,0 +1,163 @@
+"""
+Unit tests for running the geometry functions from multiple threads.
+
+The long-running free functions release the GIL, so validating the
+triangulations of an instance in a thread pool must give the same results as a
+serial loop and, given enough cores, a real speedup. The methods of a FlipEngine
+keep the GIL, so threads sharing an engine never race.
+"""
+
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from cgshop2026_pyutils.geometry import (
+    FlipEngine,
+    PointSet,
+    compute_triangles,
+    do_cross_many,
+    is_triangulation,
+)
+from cgshop2026_pyutils.geometry.typing import Edge
+from conftest import grid_triangulation
+
+
+SIZE = 60
+COUNT = 20
+
+
+@pytest.fixture(scope="module")
+def instance() -> tuple[PointSet, list[list[Edge]]]:
+    points = PointSet(grid_triangulation(SIZE)[0])
+    triangulations = [
+        grid_triangulation(SIZE, random.Random(seed))[1] for seed in range(COUNT)
+    ]
+    # Break every other triangulation by removing the diagonal of cell (0, 0).
+    for edges in triangulations[::2]:
+        del edges[0]
+    return points, triangulations
+
+
+class TestThreadPool:
+    """Validate many triangulations of one point set concurrently."""
+
+    def test_is_triangulation(self, instance):
+        points, triangulations = instance
+        serial = [is_triangulation(points, edges) for edges in triangulations]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            parallel = list(
+                pool.map(lambda edges: is_triangulation(points, edges), triangulations)
+            )
+        assert parallel == serial, "Threads must not change the results"
+        assert serial == [i % 2 == 1 for i in range(COUNT)]
+
+    def test_compute_triangles_and_flip_engines(self, instance):
+        points, triangulations = instance
+        valid = triangulations[1::2]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            triangles = list(
+                pool.map(lambda edges: compute_triangles(points, edges), valid)
+            )
+            engines = list(
+                pool.map(lambda edges: FlipEngine.build(points, edges), valid)
+            )
+        for edges, tris, engine in zip(valid, triangles, engines):
+            assert tris == compute_triangles(points, edges)
+            assert engine.compute_triangles() == tris
+
+    def test_batched_predicates(self, instance):
+        points, _ = instance
+        rng = np.random.default_rng(0)
+        batches = [rng.integers(0, len(points), size=(2000, 4)) for _ in range(8)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            parallel = list(pool.map(lambda q: do_cross_many(points, q), batches))
+        for quads, result in zip(batches, parallel):
+            assert np.array_equal(result, do_cross_many(points, quads))
+
+    def test_gil_is_released(self):
+        """Other Python threads keep running during a long validation."""
+        size = 250
+        points, edges = grid_triangulation(size, random.Random(0))
+        points = PointSet(points)
+        progress: list[float] = []
+        stop = threading.Event()
+
+        def record() -> None:
+            while not stop.is_set():
+                progress.append(time.perf_counter())
+
+        thread = threading.Thread(target=record)
+        thread.start()
+        try:
+            start = time.perf_counter()
+            assert is_triangulation(points, edges)
+            end = time.perf_counter()
+        finally:
+            stop.set()
+            thread.join()
+        # With the GIL held, the thread could only run after the call returned.
+        during = [t for t in progress if start < t < end]
+        assert during, "The thread should run while the GIL is released"
+        assert during[0] - start < (end - start) / 2
+
+    def test_flip_while_reading(self):
+        """Readers of an engine never see a half-done flip of another thread."""
+        size = 30
+        points, edges = grid_triangulation(size, random.Random(1))
+        points = PointSet(points)
+        engine = FlipEngine.build(points, edges)
+        expected = len(engine.compute_triangles())
+        snapshots: list[list[tuple[int, int, int]]] = []
+        stop = threading.Event()
+
+        def read() -> None:
+            while not stop.is_set() and len(snapshots) < 50:
+                snapshots.append(engine.compute_triangles())
+
+        thread = threading.Thread(target=read)
+        thread.start()
+        try:
+            rng = random.Random(2)
+            for _ in range(2000):
+                engine.flip(rng.choice(engine.flippable_edges()))
+        finally:
+            stop.set()
+            thread.join()
+        assert snapshots
+        for triangles in snapshots:
+            assert len(triangles) == expected
+            edges = {edge for i, j, k in triangles for edge in ((i, j), (i, k), (j, k))}
+            assert is_triangulation(points, sorted(edges))
+
+    @pytest.mark.skipif(
+        (os.cpu_count() or 1) < 4, reason="Speedup needs at least four cores"
+    )
+    def test_speedup(self):
+        """Four threads validate a batch of triangulations much faster."""
+        size = 150
+        points = PointSet(grid_triangulation(size)[0])
+        triangulations = [
+            grid_triangulation(size, random.Random(seed))[1] for seed in range(8)
+        ]
+
+        def run(workers: int) -> float:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(
+                    pool.map(
+                        lambda edges: is_triangulation(points, edges), triangulations
+                    )
+                )
+            assert all(results)
+            return time.perf_counter() - start
+
+        run(4)  # warm up
+        serial = min(run(1) for _ in range(3))
+        parallel = min(run(4) for _ in range(3))
+        assert serial / parallel > 2.0, (
+            f"Expected a speedup with 4 threads, got {serial / parallel:.2f}x"
+        )
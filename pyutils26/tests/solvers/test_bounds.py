@@ -0,0 +1,99 @@
+"""
+Unit tests for the lower bounds on the flip distance.
+
+Tests verify the bounds on small examples and that they never exceed the number of
+flips and rounds that the solvers actually need.
+"""
+
+import random
+
+import pytest
+from cgshop2026_pyutils.geometry import FlippableTriangulation, Point
+from cgshop2026_pyutils.solvers import (
+    FlipDistanceBound,
+    flip_distance_bound,
+    flip_to_delaunay,
+    flip_to_target,
+    instance_lower_bound,
+)
+
+
+def _triangulations(
+    size: int, count: int, seed: int, backend: str
+) -> list[FlippableTriangulation]:
+    """Triangulations of a jittered grid with random cell diagonals."""
+    rng = random.Random(seed)
+    points = []
+    for i in range(size):
+        for j in range(size):
+            interior = 0 < i < size - 1 and 0 < j < size - 1
+            dx, dy = (
+                (rng.randint(-30, 30), rng.randint(-30, 30)) if interior else (0, 0)
+            )
+            points.append(Point(100 * i + dx, 100 * j + dy))
+    triangulations = []
+    for _ in range(count):
+        edges = [
+            (i * size + j, (i + 1) * size + j + 1)
+            if rng.random() < 0.5
+            else (i * size + j + 1, (i + 1) * size + j)
+            for i in range(size - 1)
+            for j in range(size - 1)
+        ]
+        edges += [(v, v + 1) for v in range(size * size) if (v + 1) % size]
+        edges += [(v, v + size) for v in range(size * (size - 1))]
+        triangulations.append(
+            FlippableTriangulation.from_points_edges(points, edges, backend=backend)
+        )
+    return triangulations
+
+
+@pytest.mark.parametrize("backend", ["python", "native"])
+class TestLowerBounds:
+    """Test suite for flip_distance_bound and instance_lower_bound."""
+
+    def test_square(self, backend):
+        points = [Point(0, 0), Point(1, 0), Point(0, 1), Point(1, 1)]
+        start = FlippableTriangulation.from_points_edges(
+            points, [(0, 3)], backend=backend
+        )
+        target = FlippableTriangulation.from_points_edges(
+            points, [(1, 2)], backend=backend
+        )
+        assert flip_distance_bound(start, target) == FlipDistanceBound(1, 1, 1)
+        assert flip_distance_bound(start, start.fork()) == FlipDistanceBound(0, 0, 0)
+
+    def test_fans_of_convex_polygon(self, backend):
+        """A fan edge crossing many edges of the other fan needs several rounds."""
+        points = [Point(0, 0), Point(1000, 0)]
+        points += [Point(1000 + 100 * i - i * i, 100 * i + i * i) for i in range(1, 8)]
+        n = len(points)
+        start = FlippableTriangulation.from_points_edges(
+            points, [(0, v) for v in range(2, n - 1)], backend=backend
+        )
+        target = FlippableTriangulation.from_points_edges(
+            points, [(1, v) for v in range(3, n)], backend=backend
+        )
+        bound = flip_distance_bound(start, target)
+        assert bound.flips == n - 3
+        assert bound.max_crossings == n - 3
+        assert bound.rounds == (n - 3).bit_length()
+
+    def test_bounds_do_not_exceed_solutions(self, backend):
+        """The bounds hold for the rounds found by flip_to_target, in both directions."""
+        triangulations = _triangulations(7, 3, 0, backend)
+        for start in triangulations:
+            for target in triangulations:
+                bound = flip_distance_bound(start, target)
+                assert bound == flip_distance_bound(target, start)
+                rounds = flip_to_target(start.fork(), target)
+                assert bound.rounds <= len(rounds)
+                assert bound.flips <= sum(len(batch) for batch in rounds)
+
+    def test_instance_bound(self, backend):
+        """The instance bound holds for the Delaunay target."""
+        triangulations = _triangulations(7, 5, 1, backend)
+        objective = sum(len(flip_to_delaunay(t.fork())) for t in triangulations)
+        bound = instance_lower_bound(triangulations)
+        assert 0 < bound <= objective
+        assert instance_lower_bound(triangulations[:1]) == 0
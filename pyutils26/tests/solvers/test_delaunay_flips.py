@@ -0,0 +1,117 @@
+"""
+Unit tests for the worklist-driven flipping to the Delaunay triangulation.
+
+Tests verify that the result is the Delaunay triangulation, that every round is a
+valid set of parallel flips, and that only the edges around flips are re-examined.
+"""
+
+import random
+
+import pytest
+from cgshop2026_pyutils.geometry import FlippableTriangulation, Point, illegal_edges
+from cgshop2026_pyutils.solvers import delaunay, flip_to_delaunay
+
+
+def _jittered_grid(
+    size: int, seed: int, diagonals_seed: int
+) -> tuple[list[Point], list[tuple[int, int]]]:
+    """A grid with randomly moved interior points and random cell diagonals."""
+    rng = random.Random(seed)
+    points = []
+    for i in range(size):
+        for j in range(size):
+            interior = 0 < i < size - 1 and 0 < j < size - 1
+            dx, dy = (
+                (rng.randint(-30, 30), rng.randint(-30, 30)) if interior else (0, 0)
+            )
+            points.append(Point(100 * i + dx, 100 * j + dy))
+    rng = random.Random(diagonals_seed)
+    edges = [
+        (i * size + j, (i + 1) * size + j + 1)
+        if rng.random() < 0.5
+        else (i * size + j + 1, (i + 1) * size + j)
+        for i in range(size - 1)
+        for j in range(size - 1)
+    ]
+    edges += [(v, v + 1) for v in range(size * size) if (v + 1) % size]
+    edges += [(v, v + size) for v in range(size * (size - 1))]
+    return points, edges
+
+
+def _illegal_edges(triangulation: FlippableTriangulation) -> list[tuple[int, int]]:
+    candidates = triangulation.possible_flips()
+    partners = [triangulation.get_flip_partner(e) for e in candidates]
+    return illegal_edges(triangulation._flip_map.points, candidates, partners)
+
+
+@pytest.mark.parametrize("backend", ["python", "native"])
+class TestFlipToDelaunay:
+    """Test suite for solvers.flip_to_delaunay."""
+
+    def test_result_is_delaunay(self, backend):
+        """No illegal edge is left, independent of the start."""
+        results = []
+        for diagonals_seed in (1, 2):
+            points, edges = _jittered_grid(8, 0, diagonals_seed)
+            triangulation = FlippableTriangulation.from_points_edges(
+                points, edges, backend=backend
+            )
+            rounds = flip_to_delaunay(triangulation)
+            assert rounds, "The random start should not be Delaunay"
+            assert _illegal_edges(triangulation) == [], "Illegal edges are left"
+            results.append(set(triangulation.get_edges()))
+        assert results[0] == results[1], "The Delaunay triangulation is unique"
+
+    def test_rounds_are_parallel_flips(self, backend):
+        """Replaying every round as a strict parallel flip gives the same result."""
+        points, edges = _jittered_grid(8, 3, 4)
+        triangulation = FlippableTriangulation.from_points_edges(
+            points, edges, backend=backend
+        )
+        replay = triangulation.fork()
+        rounds = flip_to_delaunay(triangulation)
+        for batch in rounds:
+            assert batch, "Rounds should not be empty"
+            replay.apply_parallel_flips(batch, mode="strict")
+        assert replay == triangulation
+
+    def test_already_delaunay(self, backend):
+        points, edges = _jittered_grid(6, 5, 6)
+        triangulation = FlippableTriangulation.from_points_edges(
+            points, edges, backend=backend
+        )
+        flip_to_delaunay(triangulation)
+        assert flip_to_delaunay(triangulation) == []
+
+    def test_stuck_round_raises(self, backend, monkeypatch):
+        """A round without flips is a broken invariant, not a solution."""
+        points, edges = _jittered_grid(6, 0, 1)
+        triangulation = FlippableTriangulation.from_points_edges(
+            points, edges, backend=backend
+        )
+        monkeypatch.setattr(
+            FlippableTriangulation, "apply_parallel_flips", lambda *args, **kwargs: []
+        )
+        with pytest.raises(RuntimeError, match="could be flipped"):
+            flip_to_delaunay(triangulation)
+
+    def test_only_touched_edges_are_examined(self, backend, monkeypatch):
+        """After the first classification, only edges around flips are checked."""
+        points, edges = _jittered_grid(10, 7, 8)
+        triangulation = FlippableTriangulation.from_points_edges(
+            points, edges, backend=backend
+        )
+        initial = len(triangulation.possible_flips())
+        examined = []
+
+        def counting_illegal_edges(points, candidates, partners):
+            examined.append(len(candidates))
+            return illegal_edges(points, candidates, partners)
+
+        monkeypatch.setattr(delaunay, "illegal_edges", counting_illegal_edges)
+        rounds = flip_to_delaunay(triangulation)
+        flips = sum(len(batch) for batch in rounds)
+        assert examined[0] == initial
+        assert sum(examined[1:]) <= 5 * flips, (
+            "Each flip should re-examine at most its new edge and four boundary edges"
+        )
@@ -0,0 +1,153 @@
+"""
+Unit tests for the selection of a common target triangulation.
+
+Tests verify the cost estimate, that median triangulations improve the estimate,
+and that flip_to_target reaches arbitrary targets with valid parallel rounds.
+"""
+
+import random
+
+import pytest
+from cgshop2026_pyutils.geometry import FlippableTriangulation, Point
+from cgshop2026_pyutils.solvers import (
+    candidate_targets,
+    edge_frequencies,
+    estimate_cost,
+    flip_to_delaunay,
+    flip_to_target,
+    is_delaunay,
+    median_triangulation,
+)
+from cgshop2026_pyutils.solvers.target import _rounds_from_delaunay
+
+
+def _triangulations(
+    size: int, count: int, seed: int, backend: str
+) -> list[FlippableTriangulation]:
+    """Triangulations of a jittered grid with random cell diagonals and flips."""
+    rng = random.Random(seed)
+    points = []
+    for i in range(size):
+        for j in range(size):
+            interior = 0 < i < size - 1 and 0 < j < size - 1
+            dx, dy = (
+                (rng.randint(-30, 30), rng.randint(-30, 30)) if interior else (0, 0)
+            )
+            points.append(Point(100 * i + dx, 100 * j + dy))
+    triangulations = []
+    for _ in range(count):
+        edges = [
+            (i * size + j, (i + 1) * size + j + 1)
+            if rng.random() < 0.5
+            else (i * size + j + 1, (i + 1) * size + j)
+            for i in range(size - 1)
+            for j in range(size - 1)
+        ]
+        edges += [(v, v + 1) for v in range(size * size) if (v + 1) % size]
+        edges += [(v, v + size) for v in range(size * (size - 1))]
+        triangulation = FlippableTriangulation.from_points_edges(
+            points, edges, backend=backend
+        )
+        for _ in range(2 * size):
+            triangulation.add_flip(rng.choice(triangulation.possible_flips()))
+            triangulation.commit()
+        triangulations.append(triangulation.fork())
+    return triangulations
+
+
+@pytest.mark.parametrize("backend", ["python", "native"])
+class TestTargetSelection:
+    """Test suite for the cost estimate and the candidate targets."""
+
+    def test_estimate_counts_missing_edges(self, backend):
+        """The estimate is the number of input edges that are not in the target."""
+        triangulations = _triangulations(6, 4, 0, backend)
+        frequencies = edge_frequencies(triangulations)
+        target = triangulations[0]
+        missing = sum(
+            len(set(t.get_edges()) - set(target.get_edges())) for t in triangulations
+        )
+        assert estimate_cost(target, frequencies, len(triangulations)) == missing
+
+    def test_median_improves_estimate(self, backend):
+        """No flip of the median adds an edge that occurs in more inputs."""
+        triangulations = _triangulations(7, 5, 1, backend)
+        frequencies = edge_frequencies(triangulations)
+        start = triangulations[0]
+        edges = set(start.get_edges())
+        median = median_triangulation(start, frequencies)
+        assert set(start.get_edges()) == edges, "The start is not modified"
+        count = len(triangulations)
+        assert estimate_cost(median, frequencies, count) < estimate_cost(
+            start, frequencies, count
+        )
+        for edge in median.possible_flips():
+            partner = tuple(sorted(median.get_flip_partner(edge)))
+            assert frequencies[partner] <= frequencies[edge]
+
+    def test_candidates_are_sorted_by_estimate(self, backend):
+        triangulations = _triangulations(6, 3, 2, backend)
+        candidates = candidate_targets(triangulations)
+        names = {candidate.name for candidate in candidates}
+        assert {"delaunay", "median", "input 0", "input 1", "input 2"} <= names
+        estimates = [candidate.estimate for candidate in candidates]
+        assert estimates == sorted(estimates)
+        delaunay = next(c.target for c in candidates if c.name == "delaunay")
+        reference = triangulations[1].fork()
+        flip_to_delaunay(reference)
+        assert set(delaunay.get_edges()) == set(reference.get_edges())
+
+
+@pytest.mark.parametrize("backend", ["python", "native"])
+class TestFlipToTarget:
+    """Test suite for solvers.flip_to_target."""
+
+    def test_reaches_other_inputs(self, backend):
+        """Every round is a valid set of parallel flips that ends at the target."""
+        triangulations = _triangulations(7, 3, 3, backend)
+        for target in triangulations[1:]:
+            triangulation = triangulations[0].fork()
+            replay = triangulation.fork()
+            rounds = flip_to_target(triangulation, target)
+            assert set(triangulation.get_edges()) == set(target.get_edges())
+            for batch in rounds:
+                assert batch, "Rounds should not be empty"
+                replay.apply_parallel_flips(batch, mode="strict")
+            assert replay == triangulation
+
+    def test_delaunay_target(self, backend):
+        """For a Delaunay target, the rounds of flip_to_delaunay are used."""
+        triangulations = _triangulations(7, 2, 4, backend)
+        target = triangulations[1].fork()
+        flip_to_delaunay(target)
+        expected = flip_to_delaunay(triangulations[0].fork())
+        assert flip_to_target(triangulations[0], target) == expected
+
+    def test_shared_target(self, backend):
+        """One target and its Delaunay check serve many calls and stay unchanged."""
+        triangulations = _triangulations(7, 4, 7, backend)
+        target = triangulations[0]
+        before = target.fork()
+        delaunay = is_delaunay(target)
+        assert not delaunay
+        for triangulation in triangulations[1:]:
+            expected = flip_to_target(triangulation.fork(), target)
+            assert flip_to_target(triangulation, target, delaunay) == expected
+            assert triangulation == target
+        assert target == before
+        flip_to_delaunay(before)
+        assert is_delaunay(before)
+
+    def test_target_reached(self, backend):
+        triangulations = _triangulations(5, 1, 5, backend)
+        assert flip_to_target(triangulations[0], triangulations[0].fork()) == []
+
+    def test_rounds_from_delaunay(self, backend):
+        """The fallback path from the Delaunay triangulation ends at the target."""
+        triangulations = _triangulations(6, 2, 6, backend)
+        target = triangulations[1]
+        triangulation = triangulations[0]
+        flip_to_delaunay(triangulation)
+        for batch in _rounds_from_delaunay(target):
+            triangulation.apply_parallel_flips(batch, mode="strict")
+        assert set(triangulation.get_edges()) == set(target.get_edges())
@@ -64,6 +64,12 @@ def test_import_verify():
     assert check_for_errors is not None
 
 
+def test_import_solvers():
+    """Test that the solvers can be imported."""
+    from cgshop2026_pyutils.solvers import flip_to_delaunay
+    assert flip_to_delaunay is not None
+
+
 def test_import_zip_utilities():
     """Test that ZIP utilities can be imported."""
     from cgshop2026_pyutils.zip import (
@@ -1,9 +1,17 @@
+import pytest
+
 from cgshop2026_pyutils.schemas import CGSHOP2026Instance, CGSHOP2026Solution
-from cgshop2026_pyutils.geometry import Point, is_triangulation
+from cgshop2026_pyutils.geometry import (
+    FlipEngine,
+    FlippableTriangulation,
+    Point,
+    is_triangulation,
+)
+from cgshop2026_pyutils.geometry.flip_partner_map import normalize_edge
 from cgshop2026_pyutils.verify import check_for_errors
 
 
-def test_instance_1():
+def _instance_1() -> tuple[CGSHOP2026Instance, CGSHOP2026Solution]:
     points = [((0, 2)), (0, 0), (5, 0), (5, 2), (4, 1), (1, 1)]
     triang_1 = [(0, 5), (0, 4), (1, 4), (1, 5), (2, 4), (3, 4), (4, 5)]
     triang_2 = [(0, 5), (1, 5), (2, 4), (2, 5), (3, 4), (3, 5), (4, 5)]
@@ -14,16 +22,100 @@ def test_instance_1():
         points_y=[y for _, y in points],
         triangulations=[triang_1, triang_2, triang_3],
     )
-    for triang in instance.triangulations:
-        points = [Point(x, y) for x, y in zip(instance.points_x, instance.points_y)]
-        assert is_triangulation(points, triang, verbose=False), (
-            f"Triangulation {triang} is not valid for the given points."
-        )
     flips_1 = []
     flips_2 = [[(3, 5), (2, 5)]]
     flips_3 = [[(1, 3)], [(3, 5)]]
     solution = CGSHOP2026Solution(
         instance_uid="test_instance_1", flips=[flips_1, flips_2, flips_3]
     )
+    return instance, solution
+
+
+def test_instance_1():
+    instance, solution = _instance_1()
+    for triang in instance.triangulations:
+        points = [Point(x, y) for x, y in zip(instance.points_x, instance.points_y)]
+        assert is_triangulation(points, triang, verbose=False), (
+            f"Triangulation {triang} is not valid for the given points."
+        )
     errors = check_for_errors(instance, solution)
     assert not errors, f"Errors found in solution: {errors}"
+
+
+def test_instance_1_incremental():
+    instance, solution = _instance_1()
+    errors = check_for_errors(instance, solution, incremental=True, audit_every=1)
+    assert not errors, f"Errors found in solution: {errors}"
+
+
+def test_incremental_detects_stale_flip_map(monkeypatch):
+    """A broken incremental update is caught by the certification of the flip."""
+    instance, solution = _instance_1()
+    apply_parallel_flips = FlippableTriangulation.apply_parallel_flips
+
+    def apply_and_corrupt(self, edges, mode="strict"):
+        flips = apply_parallel_flips(self, edges, mode)
+        # Pretend the update of an edge of the first quadrilateral was forgotten.
+        (a, b), (c, d) = flips[0]
+        outer = {normalize_edge(u, v) for u in (a, b) for v in (c, d)}
+        records = self._flip_map._edge_records()
+        row = next(i for i, r in enumerate(records) if (r[0], r[1]) in outer)
+        records[row, 4] = 1 - records[row, 4]
+        self._flip_map = FlipEngine._from_edge_records(self._flip_map.points, records)
+        return flips
+
+    monkeypatch.setattr(
+        FlippableTriangulation, "apply_parallel_flips", apply_and_corrupt
+    )
+    errors = check_for_errors(instance, solution, incremental=True)
+    assert errors and "could not be certified" in errors[0], errors
+
+
+def test_incremental_rejects_invalid_flip():
+    instance, _ = _instance_1()
+    solution = CGSHOP2026Solution(
+        instance_uid="test_instance_1", flips=[[], [[(0, 5)]], []]
+    )
+    errors = check_for_errors(instance, solution, incremental=True)
+    assert errors, "Flipping a hull edge must be rejected"
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+class TestFlipErrors:
+    """Rejected flips are reported per edge, in the order of the solution."""
+
+    def _errors(self, flips, incremental):
+        instance, _ = _instance_1()
+        solution = CGSHOP2026Solution(
+            instance_uid="test_instance_1", flips=[[], flips, []]
+        )
+        return check_for_errors(instance, solution, incremental=incremental)
+
+    def test_not_flippable(self, incremental):
+        errors = self._errors([[(3, 5), (5, 0)]], incremental)
+        assert errors == [
+            "Error when flipping edge (5, 0) in triangulation: Edge is not flippable."
+        ]
+
+    def test_conflict(self, incremental):
+        # Ascending diagonals in a 3 x 3 grid: (0, 4) and (1, 4) share a triangle.
+        edges = [(0, 4), (1, 5), (3, 7), (4, 8), (0, 1), (1, 2), (3, 4), (4, 5)]
+        edges += [(6, 7), (7, 8), (0, 3), (1, 4), (2, 5), (3, 6), (4, 7), (5, 8)]
+        instance = CGSHOP2026Instance(
+            instance_uid="grid",
+            points_x=[i for i in range(3) for _ in range(3)],
+            points_y=[j for _ in range(3) for j in range(3)],
+            triangulations=[edges],
+        )
+        solution = CGSHOP2026Solution(instance_uid="grid", flips=[[[(0, 4), (1, 4)]]])
+        errors = check_for_errors(instance, solution, incremental=incremental)
+        assert errors == [
+            "Error when flipping edge (1, 4) in triangulation: "
+            "Edge flip conflicts with previously added flips."
+        ]
+
+    def test_already_pending(self, incremental):
+        errors = self._errors([[(3, 5), (5, 3)]], incremental)
+        assert errors == [
+            "Error when flipping edge (5, 3) in triangulation: Edge flip already pending."
+        ]
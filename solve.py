@@ -1,4 +1,9 @@
-"""Batch solver CLI that writes CGSHOP2026 solutions to a zip archive."""
+"""Batch solver CLI that writes CGSHOP2026 solutions to a zip archive.
+
+With --time-limit, every instance is improved until its time limit. If the batch
+is interrupted (Ctrl+C), the archive is closed with the solutions so far, including
+the best solution of the interrupted instance if one was checkpointed.
+"""
 
 from __future__ import annotations
 
@@ -19,11 +24,12 @@ VENV_SITE = (
 if VENV_SITE.exists() and str(VENV_SITE) not in sys.path:
     sys.path.insert(0, str(VENV_SITE))
 
-from cgshop2026_pyutils.io import read_instance
+from cgshop2026_pyutils.io import read_instance, read_solution
+from cgshop2026_pyutils.schemas import CGSHOP2026Instance, CGSHOP2026Solution
 from cgshop2026_pyutils.verify import check_for_errors
 from cgshop2026_pyutils.zip.zip_writer import ZipWriter
 
-from main import solve_instance, solution_metrics
+from main import bound_summary, solve_instance, solve_instance_anytime, solution_metrics
 
 
 def parse_args() -> argparse.Namespace:
@@ -49,6 +55,38 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Verify each generated solution with cgshop2026_pyutils.verify.check_for_errors.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes that solve the triangulations of an instance concurrently.",
+    )
+    parser.add_argument(
+        "--target",
+        choices=("delaunay", "auto"),
+        default="delaunay",
+        help="Common target triangulation: Delaunay, or the best candidate target.",
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=None,
+        help="Seconds per instance to keep improving the Delaunay solution (overrides --target).",
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=Path,
+        default=None,
+        help=(
+            "With --time-limit, keep the best solution of every instance in this "
+            "directory while it is being improved."
+        ),
+    )
+    parser.add_argument(
+        "--bounds",
+        action="store_true",
+        help="Report a lower bound on the objective of every instance and the gap to it.",
+    )
     return parser.parse_args()
 
 
@@ -61,6 +99,32 @@ def json_instances(instances_dir: Path) -> list[Path]:
     )
 
 
+def checkpoint_path(args: argparse.Namespace, instance_uid: str) -> Path | None:
+    """Return the checkpoint file of an instance, if checkpoints are enabled."""
+    if args.time_limit is None or args.checkpoint_dir is None:
+        return None
+    return args.checkpoint_dir / f"{instance_uid}.solution.json"
+
+
+def solve(instance: CGSHOP2026Instance, args: argparse.Namespace) -> CGSHOP2026Solution:
+    """Solve an instance as configured on the command line."""
+    if args.time_limit is None:
+        return solve_instance(
+            instance, workers=args.workers, target=args.target, bounds=args.bounds
+        )
+    checkpoint = checkpoint_path(args, instance.instance_uid)
+    if checkpoint is not None:
+        # An interrupted run must only add checkpoints that it wrote itself.
+        checkpoint.unlink(missing_ok=True)
+    return solve_instance_anytime(
+        instance,
+        args.time_limit,
+        workers=args.workers,
+        checkpoint=checkpoint,
+        bounds=args.bounds,
+    )
+
+
 def main() -> None:
     args = parse_args()
     if not args.instances_dir.exists():
@@ -73,23 +137,37 @@ def main() -> None:
         raise SystemExit(f"No .json instances found in {args.instances_dir}")
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
+    if args.checkpoint_dir is not None:
+        args.checkpoint_dir.mkdir(parents=True, exist_ok=True)
     if args.output.exists():
         args.output.unlink()
     total = len(instance_files)
     total_start = time.perf_counter()
+    written = 0
     with ZipWriter(args.output) as archive:
         for idx, instance_path in enumerate(instance_files, start=1):
             instance_start = time.perf_counter()
             instance = read_instance(instance_path)
-            solution = solve_instance(instance)
+            try:
+                solution = solve(instance, args)
+            except KeyboardInterrupt:
+                checkpoint = checkpoint_path(args, instance.instance_uid)
+                if checkpoint is not None and checkpoint.exists():
+                    archive.add_solution(read_solution(checkpoint))
+                    written += 1
+                    print(f"Interrupted, added best solution so far for {instance_path.name}")
+                else:
+                    print(f"Interrupted while solving {instance_path.name}")
+                break
             if args.verify:
-                errors = check_for_errors(instance, solution, full_recompute=True)
+                errors = check_for_errors(instance, solution, incremental=True)
                 if errors:
                     raise SystemExit(
                         f"Verification failed for {instance_path.name}:\n"
                         + "\n".join(f"- {msg}" for msg in errors)
                     )
             archive.add_solution(solution)
+            written += 1
             instance_elapsed = time.perf_counter() - instance_start
             total_flips, total_steps = solution_metrics(solution)
             percent = idx / total * 100
@@ -97,11 +175,11 @@ def main() -> None:
                 f"[{idx}/{total} | {percent:5.1f}%] "
                 f"Solved {instance_path.name} -> {solution.instance_uid}.solution.json "
                 f"in {instance_elapsed:.2f}s "
-                f"({total_flips} flips / {total_steps} steps)"
+                f"({total_flips} flips / {total_steps} steps{bound_summary(solution)})"
             )
     total_elapsed = time.perf_counter() - total_start
     print(
-        f"Wrote {len(instance_files)} solutions to {args.output} "
+        f"Wrote {written} solutions to {args.output} "
         f"in {total_elapsed:.2f}s"
     )
 